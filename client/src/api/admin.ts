@@ -34,6 +34,13 @@ export type AdminOverview = {
   active_sessions: number
   wallet_count: number
   recent_transactions: number
+  pending_turn_timers: number
+  turn_timer_lag_ms: number
+  game_log_queue_depth: number
+  game_log_max_depth: number
+  game_log_full_waits: number
+  game_log_wait_ms: number
+  game_log_failed: number
   generated_at: string
 }
 
@@ -203,6 +210,13 @@ const buildDemoOverview = (users: AdminUser[]): AdminOverview => ({
   active_sessions: Math.max(1, Math.floor(users.length / 2)),
   wallet_count: users.length,
   recent_transactions: 12,
+  pending_turn_timers: 0,
+  turn_timer_lag_ms: 0,
+  game_log_queue_depth: 0,
+  game_log_max_depth: 0,
+  game_log_full_waits: 0,
+  game_log_wait_ms: 0,
+  game_log_failed: 0,
   generated_at: new Date().toISOString(),
 })
 
@@ -5,6 +5,7 @@ import type { Card, GameState, HandResult, Player } from './types'
 import { Hand } from './types'
 import { playSound, Sounds } from './sound'
 import { useAuthStore } from '../store/authStore'
+import { applyPatch, type PatchOp } from '../realtime/patch'
 
 const MINIMUM_BET = 1
 const STARTING_BANK = 20
@@ -28,12 +29,19 @@ type ServerPlayerPayload = {
   userId: string
   displayName: string
   isDealer: boolean
-  bank: number
+  bank: number | null
   hands: ServerHandPayload[]
 }
 
+type ServerViewer = {
+  userId: string
+  bank: number | null
+  hint: string | null
+}
+
 type ServerGameState = {
   tableId: string
+  version: number
   status: string
   minBet: number
   maxBet: number
@@ -44,6 +52,15 @@ type ServerGameState = {
   activeHandId: string | null
   turnEndsAt: string | null
   players: ServerPlayerPayload[]
+  viewer?: ServerViewer
+}
+
+type ServerGamePatch = {
+  tableId: string
+  baseVersion: number
+  version: number
+  ops: PatchOp[]
+  viewer?: ServerViewer
 }
 
 const SERVER_SUIT_MAP: Record<string, Card['suit']> = {
@@ -75,14 +92,16 @@ const sleep = (ms: number = 900) => new Promise((resolve) => setTimeout(resolve,
 export const useGameStore = create<GameStore>((set, get) => {
   const syncPlayers = () => set((state) => ({ players: [...state.players] }))
   let boundSocket: Socket | null = null
+  let serverState: ServerGameState | null = null
 
   const applyServerState = (payload: ServerGameState) => {
+    const viewer = payload.viewer
     const players = payload.players.map((player) => ({
       userId: player.userId,
       displayName: player.displayName,
       name: player.displayName,
       isDealer: player.isDealer,
-      bank: player.bank,
+      bank: (viewer && player.userId === viewer.userId ? viewer.bank : player.bank) ?? 0,
       hands: player.hands.map((hand) =>
         Hand.fromPayload({
           ...hand,
@@ -126,9 +145,25 @@ export const useGameStore = create<GameStore>((set, get) => {
 
   const handleGameState = (payload: ServerGameState | null) => {
     if (!payload) return
+    serverState = payload
     applyServerState(payload)
   }
 
+  const handleGamePatch = (payload: ServerGamePatch | null) => {
+    if (!payload || !serverState) return
+    if (payload.baseVersion !== serverState.version || payload.tableId !== serverState.tableId) {
+      serverState = null
+      boundSocket?.emit('game:sync')
+      return
+    }
+    serverState = {
+      ...applyPatch(serverState, payload.ops),
+      version: payload.version,
+      viewer: payload.viewer ?? serverState.viewer,
+    }
+    applyServerState(serverState)
+  }
+
   const handleGameError = (payload: { message?: string } | null) => {
     set({ serverError: payload?.message ?? 'Game error' })
     window.setTimeout(() => set({ serverError: null }), 4000)
@@ -398,16 +433,19 @@ export const useGameStore = create<GameStore>((set, get) => {
     bindSocket: (socket, tableId) => {
       if (boundSocket) {
         boundSocket.off('game:state', handleGameState)
+        boundSocket.off('game:patch', handleGamePatch)
         boundSocket.off('game:error', handleGameError)
         boundSocket.off('disconnect')
       }
       boundSocket = socket
+      serverState = null
       if (!socket) {
         set({ socket: null, serverMode: false, tableId: null })
         return
       }
       set({ socket, serverMode: true, tableId, serverError: null })
       socket.on('game:state', handleGameState)
+      socket.on('game:patch', handleGamePatch)
       socket.on('game:error', handleGameError)
       socket.on('disconnect', () => {
         set({ serverError: 'Disconnected from game server.' })
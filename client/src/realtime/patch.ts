@@ -0,0 +1,34 @@
+export type PatchOp =
+  | { op: 'add' | 'replace'; path: string; value: unknown }
+  | { op: 'remove'; path: string }
+
+type Container = Record<string, unknown> | unknown[]
+
+const parsePath = (path: string) =>
+  path
+    .split('/')
+    .slice(1)
+    .map((part) => part.replace(/~1/g, '/').replace(/~0/g, '~'))
+
+export const applyPatch = <T>(document: T, ops: PatchOp[]): T => {
+  const root = structuredClone(document) as unknown as Container
+  for (const op of ops) {
+    const parts = parsePath(op.path)
+    const key = parts.pop()
+    if (key === undefined) continue
+    let target = root
+    for (const part of parts) {
+      target = (Array.isArray(target) ? target[Number(part)] : target[part]) as Container
+    }
+    if (Array.isArray(target)) {
+      if (op.op === 'remove') target.splice(Number(key), 1)
+      else if (key === '-') target.push(op.value)
+      else target[Number(key)] = op.value
+    } else if (op.op === 'remove') {
+      delete target[key]
+    } else {
+      target[key] = op.value
+    }
+  }
+  return root as unknown as T
+}
@@ -6,8 +6,22 @@ const SOCKET_URL =
   socketBase || (typeof window !== 'undefined' ? window.location.origin : '')
 
 export const createSocket = (token: string): Socket => {
-  return io(SOCKET_URL, {
+  let epoch: string | null = null
+  let lastSeq: number | null = null
+  const socket = io(SOCKET_URL, {
     autoConnect: false,
-    auth: { token },
+    auth: (cb) =>
+      cb(epoch === null || lastSeq === null ? { token } : { token, epoch, lastSeq }),
   })
+  socket.onAny((event: string, payload?: { seq?: unknown; epoch?: unknown }) => {
+    const seq = payload?.seq
+    if (typeof seq !== 'number') return
+    if (event === 'table:joined') {
+      epoch = typeof payload?.epoch === 'string' ? payload.epoch : null
+      lastSeq = seq
+    } else if (lastSeq === null || seq > lastSeq) {
+      lastSeq = seq
+    }
+  })
+  return socket
 }
@@ -96,6 +96,9 @@ export type LobbyTableSummary = {
   isPrivate: boolean
   maxPlayers: number
   playerCount: number
+  minBet?: number
+  maxBet?: number
+  decks?: number
 }
 
 export type TablePlayer = {
@@ -151,12 +154,15 @@ const wireSocket = (
   set: (state: Partial<LobbyState>) => void,
   get: () => LobbyState,
 ) => {
+  let lobbyVersion = -1
+
   socket.on('connect', () => {
     set({ isConnected: true, isConnecting: false, error: null })
     socket.emit('lobby:list')
   })
 
   socket.on('disconnect', () => {
+    lobbyVersion = -1
     set({ isConnected: false })
   })
 
@@ -164,9 +170,54 @@ const wireSocket = (
     set({ isConnecting: false, isConnected: false, error: error.message })
   })
 
-  socket.on('lobby:snapshot', (payload: { tables?: LobbyTableSummary[] } | null) => {
-    set({ tables: payload?.tables ?? [] })
-  })
+  socket.on(
+    'lobby:snapshot',
+    (payload: { version?: number; tables?: LobbyTableSummary[] } | null) => {
+      lobbyVersion = payload?.version ?? -1
+      set({ tables: payload?.tables ?? [] })
+    },
+  )
+
+  const applyLobbyDelta = (
+    version: number | undefined,
+    apply: (tables: LobbyTableSummary[]) => LobbyTableSummary[],
+  ) => {
+    if (lobbyVersion < 0 || version === undefined || version <= lobbyVersion) {
+      return
+    }
+    if (version !== lobbyVersion + 1) {
+      lobbyVersion = -1
+      socket.emit('lobby:list')
+      return
+    }
+    lobbyVersion = version
+    set({ tables: apply(get().tables) })
+  }
+
+  const upsertTables = (
+    payload: { version?: number; tables?: LobbyTableSummary[] } | null,
+  ) => {
+    const changed = payload?.tables ?? []
+    applyLobbyDelta(payload?.version, (tables) => {
+      const byId = new Map(changed.map((table) => [table.id, table]))
+      const next = tables.map((table) => byId.get(table.id) ?? table)
+      const known = new Set(tables.map((table) => table.id))
+      return next.concat(changed.filter((table) => !known.has(table.id)))
+    })
+  }
+
+  socket.on('lobby:table_added', upsertTables)
+  socket.on('lobby:table_updated', upsertTables)
+
+  socket.on(
+    'lobby:table_removed',
+    (payload: { version?: number; tableIds?: string[] } | null) => {
+      const removed = new Set(payload?.tableIds ?? [])
+      applyLobbyDelta(payload?.version, (tables) =>
+        tables.filter((table) => !removed.has(table.id)),
+      )
+    },
+  )
 
   socket.on('table:state', (payload: TableState | null) => {
     const currentId = payload?.id ?? get().currentTableId
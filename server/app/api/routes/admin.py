@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from typing import Any
 import uuid
 
+from anyio import from_thread
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 
-from app.core.deps import get_db, require_admin
+from app.core.config import settings
+from app.core.deps import get_async_db, get_db, require_admin
 from app.db.models import (
     AdminActionLog,
     CryptoDeposit,
@@ -19,6 +23,8 @@ from app.db.models import (
     Wallet,
     WalletTransaction,
 )
+from app.game.odds import cached_house_edge, config_hash
+from app.game.probability import OddsRequest, build_odds_request, cached_live_odds
 from app.schemas.admin import (
     AdminActionLogEntry,
     AdminCryptoDeposit,
@@ -30,6 +36,7 @@ from app.schemas.admin import (
     AdminSessionResetResponse,
     AdminTableDetail,
     AdminTableKickRequest,
+    AdminTableOdds,
     AdminTableRulesUpdateRequest,
     AdminTableSummary,
     AdminUserBanRequest,
@@ -43,18 +50,36 @@ from app.schemas.admin import (
 from app.schemas.wallet import WalletSummary, WalletTransactionPublic
 from app.realtime.server import (
     LOBBY_ROOM,
+    actors,
+    call_table_command,
+    call_worker_commands,
+    current_table,
     emit_game_state,
+    emit_table,
+    game_logs,
+    invalidate_user,
+    lobby_lock,
     log_game_events,
+    publish_lobby,
     schedule_turn_timeout,
+    set_user_muted,
     sio,
     state,
-    state_lock,
+    sync_seats,
+    table_command,
     table_room,
+    turn_timers,
     _set_turn_deadline,
 )
+from app.realtime.state import TableError, TableState
 
 router = APIRouter()
 
+TABLE_ERROR_STATUS = {
+    "not_found": status.HTTP_404_NOT_FOUND,
+    "unavailable": status.HTTP_503_SERVICE_UNAVAILABLE,
+}
+
 
 def build_admin_user(user: User) -> AdminUser:
     display_name = user.profile.display_name if user.profile else user.email.split("@")[0]
@@ -184,37 +209,40 @@ def parse_uuid(value: str | None) -> uuid.UUID | None:
         return None
 
 
+async def run_table_admin(name: str, table_id: str, payload: dict | None = None) -> Any:
+    try:
+        return await call_table_command(name, table_id, payload)
+    except TableError as exc:
+        raise HTTPException(
+            status_code=TABLE_ERROR_STATUS.get(exc.code, status.HTTP_400_BAD_REQUEST),
+            detail=str(exc),
+        ) from exc
+
+
+def _admin_table(table_id: str, require_game: bool = True) -> TableState:
+    table = state.tables.get(table_id)
+    if not table or (require_game and not table.game):
+        raise TableError("not_found", "Table not found")
+    return table
+
+
+async def _announce_table_change(
+    table_id: str, table_snapshot: dict, game_state: dict | None, token: int | None = None
+) -> dict:
+    await emit_table(table_id, "table:state", table_snapshot)
+    await emit_game_state(table_id)
+    schedule_turn_timeout(table_id, token)
+    return {"table": table_snapshot, "game": game_state}
+
+
 async def remove_user_from_tables(user_id: str) -> None:
-    removed_table_id = None
-    table_snapshot = None
-    tables_payload = None
-    player_sid = None
-    token = None
-    async with state_lock:
-        player = next(
-            (candidate for candidate in state.sid_to_player.values() if candidate.user_id == user_id),
-            None,
-        )
-        if not player:
-            return
-        player_sid = player.sid
-        removed_table_id, table, removed = state.remove_from_table(player)
-        table_snapshot = table.snapshot() if table and not removed else None
-        tables_payload = state.list_tables()
-        if removed_table_id and table and table.game:
-            token = _set_turn_deadline(removed_table_id)
-
-    if player_sid and removed_table_id:
-        await sio.leave_room(player_sid, table_room(removed_table_id))
-        await sio.emit("table:kicked", {"tableId": removed_table_id}, room=player_sid)
-        await sio.disconnect(player_sid)
-    if removed_table_id and table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(removed_table_id))
-        await emit_game_state(removed_table_id)
-    if tables_payload is not None:
-        await sio.emit("lobby:snapshot", {"tables": tables_payload}, room=LOBBY_ROOM)
-    if token and removed_table_id:
-        asyncio.create_task(schedule_turn_timeout(removed_table_id, token))
+    table_id = await current_table(user_id)
+    if not table_id:
+        return
+    try:
+        await call_table_command("admin:kick", table_id, {"userId": user_id, "disconnect": True})
+    except TableError:
+        return
 
 
 @router.get("/overview", response_model=AdminOverview)
@@ -244,6 +272,13 @@ def admin_overview(
         active_sessions=int(active_sessions),
         wallet_count=int(wallet_count),
         recent_transactions=int(recent_transactions),
+        pending_turn_timers=turn_timers.pending,
+        turn_timer_lag_ms=turn_timers.lag * 1000,
+        game_log_queue_depth=game_logs.depth,
+        game_log_max_depth=game_logs.max_depth,
+        game_log_full_waits=game_logs.full_waits,
+        game_log_wait_ms=game_logs.wait_seconds * 1000,
+        game_log_failed=game_logs.failed,
         generated_at=now,
     )
 
@@ -293,6 +328,7 @@ def update_user(
         )
     db.commit()
     db.refresh(user)
+    from_thread.run(invalidate_user, user.id)
     return build_admin_user(user)
 
 
@@ -317,10 +353,8 @@ async def mute_user(
     )
     db.commit()
     db.refresh(user)
-    async with state_lock:
-        for player in state.sid_to_player.values():
-            if player.user_id == str(user.id):
-                player.muted_until = user.muted_until
+    await invalidate_user(user.id)
+    await set_user_muted(str(user.id), user.muted_until)
     return build_admin_user(user)
 
 
@@ -337,10 +371,8 @@ async def unmute_user(
     add_admin_log(db, admin_user, "user.unmute", target_user_id=user_id)
     db.commit()
     db.refresh(user)
-    async with state_lock:
-        for player in state.sid_to_player.values():
-            if player.user_id == str(user.id):
-                player.muted_until = None
+    await invalidate_user(user.id)
+    await set_user_muted(str(user.id), None)
     return build_admin_user(user)
 
 
@@ -374,6 +406,7 @@ async def ban_user(
     )
     db.commit()
     db.refresh(user)
+    await invalidate_user(user.id)
     await remove_user_from_tables(str(user.id))
     return build_admin_user(user)
 
@@ -393,6 +426,7 @@ async def unban_user(
     add_admin_log(db, admin_user, "user.unban", target_user_id=user_id)
     db.commit()
     db.refresh(user)
+    await invalidate_user(user.id)
     return build_admin_user(user)
 
 
@@ -493,40 +527,63 @@ def adjust_wallet(
 
 
 @router.get("/logs", response_model=list[AdminActionLogEntry])
-def admin_logs(
+async def admin_logs(
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: User = Depends(require_admin),
 ) -> list[AdminActionLogEntry]:
-    logs = db.scalars(
-        select(AdminActionLog)
-        .order_by(AdminActionLog.created_at.desc())
-        .limit(min(limit, 500))
+    logs = (
+        await db.scalars(
+            select(AdminActionLog)
+            .order_by(AdminActionLog.created_at.desc())
+            .limit(min(limit, 500))
+        )
     ).all()
     return [AdminActionLogEntry.model_validate(log) for log in logs]
 
 
 @router.get("/game-logs", response_model=list[AdminGameActionLogEntry])
-def admin_game_logs(
+async def admin_game_logs(
     table_id: str | None = None,
     limit: int = 200,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: User = Depends(require_admin),
 ) -> list[AdminGameActionLogEntry]:
     query = select(GameActionLog).order_by(GameActionLog.created_at.desc())
     if table_id:
         query = query.where(GameActionLog.table_id == table_id)
-    logs = db.scalars(query.limit(min(limit, 500))).all()
+    logs = (await db.scalars(query.limit(min(limit, 500)))).all()
     return [AdminGameActionLogEntry.model_validate(log) for log in logs]
 
 
+@table_command("admin:tables")
+async def _list_tables(sid: str, user: dict, table_id: str, payload: dict) -> list[dict]:
+    async with lobby_lock:
+        tables = list(state.tables.values())
+        return [build_table_summary(table).model_dump(mode="json") for table in tables]
+
+
 @router.get("/tables", response_model=list[AdminTableSummary])
 async def admin_tables(
     _: User = Depends(require_admin),
 ) -> list[AdminTableSummary]:
-    async with state_lock:
-        tables = list(state.tables.values())
-        return [build_table_summary(table) for table in tables]
+    results = await call_worker_commands("admin:tables")
+    return [AdminTableSummary.model_validate(summary) for tables in results for summary in tables]
+
+
+@table_command("admin:detail")
+async def _table_detail(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[AdminTableDetail, OddsRequest | None]:
+        table = _admin_table(table_id, require_game=False)
+        detail = build_table_detail(table)
+        odds_request = build_odds_request(table.game) if table.game else None
+        return detail, odds_request
+
+    detail, odds_request = await actors.run(table_id, apply)
+
+    if odds_request:
+        detail.odds = await cached_live_odds(odds_request, settings.odds_workers)
+    return detail.model_dump(mode="json")
 
 
 @router.get("/tables/{table_id}", response_model=AdminTableDetail)
@@ -534,11 +591,65 @@ async def admin_table_detail(
     table_id: str,
     _: User = Depends(require_admin),
 ) -> AdminTableDetail:
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-        return build_table_detail(table)
+    return AdminTableDetail.model_validate(await run_table_admin("admin:detail", table_id))
+
+
+@table_command("admin:config")
+async def _table_config(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> dict:
+        table = _admin_table(table_id, require_game=False)
+        return {
+            "decks": table.config.decks,
+            "blackjack_payout": table.config.blackjack_payout,
+            "dealer_hits_soft_17": table.config.dealer_hits_soft_17,
+        }
+
+    return await actors.run(table_id, apply)
+
+
+@router.get("/tables/{table_id}/odds", response_model=AdminTableOdds)
+async def admin_table_odds(
+    table_id: str,
+    _: User = Depends(require_admin),
+) -> AdminTableOdds:
+    config = await run_table_admin("admin:config", table_id)
+    decks = config["decks"]
+    blackjack_payout = config["blackjack_payout"]
+    dealer_hits_soft_17 = config["dealer_hits_soft_17"]
+
+    estimate = await asyncio.to_thread(
+        cached_house_edge,
+        decks,
+        blackjack_payout,
+        dealer_hits_soft_17,
+    )
+    return AdminTableOdds(
+        table_id=table_id,
+        config_hash=config_hash(decks, blackjack_payout, dealer_hits_soft_17),
+        decks=decks,
+        blackjack_payout=blackjack_payout,
+        dealer_hits_soft_17=dealer_hits_soft_17,
+        hands=estimate.hands,
+        house_edge=estimate.house_edge,
+        variance=estimate.variance,
+        std_error=estimate.std_error,
+        win_rate=estimate.win_rate,
+        push_rate=estimate.push_rate,
+        loss_rate=estimate.loss_rate,
+    )
+
+
+@table_command("admin:pause")
+async def _pause_table(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[dict, dict]:
+        table = _admin_table(table_id)
+        table.is_paused = True
+        table.game.turn_ends_at = None
+        turn_timers.cancel(table_id)
+        return table.snapshot(), table.game.snapshot()
+
+    table_snapshot, game_state = await actors.run(table_id, apply)
+    return await _announce_table_change(table_id, table_snapshot, game_state)
 
 
 @router.post("/tables/{table_id}/pause", response_model=AdminTableDetail)
@@ -547,24 +658,23 @@ async def admin_table_pause(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ) -> AdminTableDetail:
-    table_snapshot = None
-    game_state = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-        table.is_paused = True
-        table.game.turn_ends_at = None
-        table_snapshot = table.snapshot()
-        game_state = table.game.snapshot()
-
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
+    result = await run_table_admin("admin:pause", table_id)
 
     add_admin_log(db, admin_user, "table.pause", target_table_id=table_id)
     db.commit()
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
+
+
+@table_command("admin:resume")
+async def _resume_table(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[int | None, dict, dict]:
+        table = _admin_table(table_id)
+        table.is_paused = False
+        token = _set_turn_deadline(table_id)
+        return token, table.snapshot(), table.game.snapshot()
+
+    token, table_snapshot, game_state = await actors.run(table_id, apply)
+    return await _announce_table_change(table_id, table_snapshot, game_state, token=token)
 
 
 @router.post("/tables/{table_id}/resume", response_model=AdminTableDetail)
@@ -573,55 +683,50 @@ async def admin_table_resume(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ) -> AdminTableDetail:
-    token = None
-    table_snapshot = None
-    game_state = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-        table.is_paused = False
-        token = _set_turn_deadline(table_id)
-        table_snapshot = table.snapshot()
-        game_state = table.game.snapshot()
-
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
-    if token:
-        asyncio.create_task(schedule_turn_timeout(table_id, token))
+    result = await run_table_admin("admin:resume", table_id)
 
     add_admin_log(db, admin_user, "table.resume", target_table_id=table_id)
     db.commit()
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
 
 
-@router.post("/tables/{table_id}/restart", response_model=AdminTableDetail)
-async def admin_table_restart(
-    table_id: str,
-    db: Session = Depends(get_db),
-    admin_user: User = Depends(require_admin),
-) -> AdminTableDetail:
-    table_snapshot = None
-    game_state = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
+@table_command("admin:restart")
+async def _restart_table(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[dict, dict | None]:
+        table = _admin_table(table_id, require_game=False)
         table.game = None
         for player in table.players.values():
             player.is_ready = False
         state.ensure_game(table)
-        table_snapshot = table.snapshot()
         game_state = table.game.snapshot() if table.game else None
+        return table.snapshot(), game_state
 
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
+    table_snapshot, game_state = await actors.run(table_id, apply)
+    return await _announce_table_change(table_id, table_snapshot, game_state)
+
+
+@router.post("/tables/{table_id}/restart", response_model=AdminTableDetail)
+async def admin_table_restart(
+    table_id: str,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+) -> AdminTableDetail:
+    result = await run_table_admin("admin:restart", table_id)
 
     add_admin_log(db, admin_user, "table.restart", target_table_id=table_id)
     db.commit()
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
+
+
+@table_command("admin:betting")
+async def _set_betting_locked(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[dict, dict]:
+        table = _admin_table(table_id)
+        table.betting_locked = bool(payload["locked"])
+        return table.snapshot(), table.game.snapshot()
+
+    table_snapshot, game_state = await actors.run(table_id, apply)
+    return await _announce_table_change(table_id, table_snapshot, game_state)
 
 
 @router.post("/tables/{table_id}/lock-betting", response_model=AdminTableDetail)
@@ -630,23 +735,11 @@ async def admin_lock_betting(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ) -> AdminTableDetail:
-    table_snapshot = None
-    game_state = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-        table.betting_locked = True
-        table_snapshot = table.snapshot()
-        game_state = table.game.snapshot()
-
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
+    result = await run_table_admin("admin:betting", table_id, {"locked": True})
 
     add_admin_log(db, admin_user, "table.lock_betting", target_table_id=table_id)
     db.commit()
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
 
 
 @router.post("/tables/{table_id}/unlock-betting", response_model=AdminTableDetail)
@@ -655,23 +748,41 @@ async def admin_unlock_betting(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ) -> AdminTableDetail:
-    table_snapshot = None
-    game_state = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-        table.betting_locked = False
-        table_snapshot = table.snapshot()
-        game_state = table.game.snapshot()
-
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
+    result = await run_table_admin("admin:betting", table_id, {"locked": False})
 
     add_admin_log(db, admin_user, "table.unlock_betting", target_table_id=table_id)
     db.commit()
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
+
+
+@table_command("admin:rules")
+async def _update_table_rules(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[dict, dict | None]:
+        table = _admin_table(table_id)
+        if table.game.is_round_active():
+            raise TableError("in_progress", "Cannot update rules during an active round")
+        if payload["min_bet"] is not None:
+            table.config.min_bet = payload["min_bet"]
+        if payload["max_bet"] is not None:
+            table.config.max_bet = max(payload["max_bet"], table.config.min_bet)
+        if payload["decks"] is not None:
+            table.config.decks = payload["decks"]
+        if payload["starting_bank"] is not None:
+            table.config.starting_bank = payload["starting_bank"]
+        if payload["blackjack_payout"] is not None:
+            table.config.blackjack_payout = payload["blackjack_payout"]
+        if payload["dealer_hits_soft_17"] is not None:
+            table.config.dealer_hits_soft_17 = payload["dealer_hits_soft_17"]
+        table.game = None
+        state.ensure_game(table)
+        state.index_table(table)
+        game_state = table.game.snapshot() if table.game else None
+        return table.snapshot(), game_state
+
+    table_snapshot, game_state = await actors.run(table_id, apply)
+    result = await _announce_table_change(table_id, table_snapshot, game_state)
+    await publish_lobby()
+    return result
 
 
 @router.patch("/tables/{table_id}/rules", response_model=AdminTableDetail)
@@ -681,48 +792,35 @@ async def admin_update_table_rules(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ) -> AdminTableDetail:
-    table_snapshot = None
-    game_state = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-        if table.game.is_round_active():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot update rules during an active round",
-            )
-        if payload.min_bet is not None:
-            table.config.min_bet = payload.min_bet
-        if payload.max_bet is not None:
-            table.config.max_bet = max(payload.max_bet, table.config.min_bet)
-        if payload.decks is not None:
-            table.config.decks = payload.decks
-        if payload.starting_bank is not None:
-            table.config.starting_bank = payload.starting_bank
-        table.game = None
-        state.ensure_game(table)
-        table_snapshot = table.snapshot()
-        game_state = table.game.snapshot() if table.game else None
-
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
+    rules = payload.model_dump()
+    result = await run_table_admin("admin:rules", table_id, rules)
 
     add_admin_log(
         db,
         admin_user,
         "table.update_rules",
         target_table_id=table_id,
-        payload={
-            "min_bet": payload.min_bet,
-            "max_bet": payload.max_bet,
-            "decks": payload.decks,
-            "starting_bank": payload.starting_bank,
-        },
+        payload=rules,
     )
     db.commit()
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
+
+
+@table_command("admin:force-result")
+async def _force_result(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[list[dict], str | None, dict, dict]:
+        table = _admin_table(table_id)
+        game = table.game
+        error = game.force_result(payload["result"])
+        if error:
+            raise TableError("invalid", error)
+        events = game.consume_events()
+        return events, game.round_id, table.snapshot(), game.snapshot()
+
+    events, round_id, table_snapshot, game_state = await actors.run(table_id, apply)
+
+    await log_game_events(table_id, round_id, events)
+    return await _announce_table_change(table_id, table_snapshot, game_state)
 
 
 @router.post("/tables/{table_id}/force-result", response_model=AdminTableDetail)
@@ -732,27 +830,7 @@ async def admin_force_result(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ) -> AdminTableDetail:
-    events = []
-    round_id = None
-    table_snapshot = None
-    game_state = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-        game = table.game
-        error = game.force_result(payload.result)
-        if error:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
-        events = game.consume_events()
-        round_id = game.round_id
-        table_snapshot = table.snapshot()
-        game_state = game.snapshot()
-
-    await log_game_events(table_id, round_id, events)
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
+    result = await run_table_admin("admin:force-result", table_id, {"result": payload.result})
 
     add_admin_log(
         db,
@@ -762,7 +840,33 @@ async def admin_force_result(
         payload={"result": payload.result},
     )
     db.commit()
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
+
+
+@table_command("admin:kick")
+async def _kick_player(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    async with lobby_lock:
+        table = _admin_table(table_id, require_game=False)
+        player = table.players.get(payload["userId"])
+        if not player:
+            raise TableError("not_found", "Player not found")
+        removed_table_id, table, removed = state.remove_from_table(player)
+        if player.remote:
+            state.forget_player(player.sid)
+        table_snapshot = table.snapshot() if table and not removed else None
+        summary = build_table_summary(table).model_dump(mode="json") if table else None
+    await publish_lobby()
+
+    if removed_table_id:
+        await sio.leave_room(player.sid, table_room(removed_table_id, player.encoding))
+        await sio.emit("table:kicked", {"tableId": removed_table_id}, room=player.sid)
+        if payload.get("disconnect"):
+            await sio.disconnect(player.sid)
+    if removed_table_id and table_snapshot:
+        await sync_seats(removed_table_id)
+        await emit_table(removed_table_id, "table:state", table_snapshot)
+        await emit_game_state(removed_table_id)
+    return {"tableId": removed_table_id, "summary": summary}
 
 
 @router.post("/tables/{table_id}/kick", response_model=AdminTableSummary)
@@ -772,135 +876,94 @@ async def admin_table_kick(
     db: Session = Depends(get_db),
     admin_user: User = Depends(require_admin),
 ) -> AdminTableSummary:
-    table_snapshot = None
-    tables_payload = None
-    player_sid = None
-    token = None
-    removed_table_id = table_id
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-        player = table.players.get(payload.user_id)
-        if not player:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Player not found")
-        player_sid = player.sid
-        removed_table_id, table, removed = state.remove_from_table(player)
-        table_snapshot = table.snapshot() if table and not removed else None
-        tables_payload = state.list_tables()
-        if removed_table_id and table and table.game:
-            token = _set_turn_deadline(removed_table_id)
-        summary = build_table_summary(table) if table else None
-
-    if player_sid and removed_table_id:
-        await sio.leave_room(player_sid, table_room(removed_table_id))
-        await sio.emit("table:kicked", {"tableId": removed_table_id}, room=player_sid)
-    if removed_table_id and table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(removed_table_id))
-        await emit_game_state(removed_table_id)
-    if tables_payload is not None:
-        await sio.emit("lobby:snapshot", {"tables": tables_payload}, room=LOBBY_ROOM)
-    if token and removed_table_id:
-        asyncio.create_task(schedule_turn_timeout(removed_table_id, token))
+    result = await run_table_admin("admin:kick", table_id, {"userId": payload.user_id})
 
     add_admin_log(
         db,
         admin_user,
         "table.kick",
         target_user_id=parse_uuid(payload.user_id),
-        target_table_id=removed_table_id,
+        target_table_id=result["tableId"],
     )
     db.commit()
 
-    if summary:
-        return summary
+    if result["summary"]:
+        return AdminTableSummary.model_validate(result["summary"])
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
 
 
-@router.post("/tables/{table_id}/force-stand", response_model=AdminTableDetail)
-async def admin_force_stand(
-    table_id: str,
-    payload: AdminForceStandRequest,
-    db: Session = Depends(get_db),
-    admin_user: User = Depends(require_admin),
-) -> AdminTableDetail:
-    events = []
-    round_id = None
-    token = None
-    table_snapshot = None
-    game_state = None
-    target_user_id = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
+@table_command("admin:force-stand")
+async def _force_stand(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[str, list[dict], str | None, int | None, dict, dict]:
+        table = _admin_table(table_id)
         game = table.game
-        target_id = payload.user_id or game.active_player_id
+        target_id = payload.get("userId") or game.active_player_id
         if not target_id:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No active player")
+            raise TableError("invalid", "No active player")
         error = game.stand(target_id, auto=True)
         if error:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
-        target_user_id = target_id
+            raise TableError("invalid", error)
         events = game.consume_events()
-        round_id = game.round_id
         token = _set_turn_deadline(table_id)
         table_snapshot = table.snapshot()
-        game_state = game.snapshot()
+        return target_id, events, game.round_id, token, table_snapshot, game.snapshot()
+
+    target_id, events, round_id, token, table_snapshot, game_state = await actors.run(
+        table_id, apply
+    )
 
     await log_game_events(table_id, round_id, events)
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
-    if token:
-        asyncio.create_task(schedule_turn_timeout(table_id, token))
+    result = await _announce_table_change(table_id, table_snapshot, game_state, token=token)
+    return {**result, "userId": target_id}
+
+
+@router.post("/tables/{table_id}/force-stand", response_model=AdminTableDetail)
+async def admin_force_stand(
+    table_id: str,
+    payload: AdminForceStandRequest,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+) -> AdminTableDetail:
+    result = await run_table_admin("admin:force-stand", table_id, {"userId": payload.user_id})
 
     add_admin_log(
         db,
         admin_user,
         "table.force_stand",
-        target_user_id=parse_uuid(target_user_id),
+        target_user_id=parse_uuid(result["userId"]),
         target_table_id=table_id,
         payload={"action": "force_stand"},
     )
     db.commit()
-
-    if not table_snapshot:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
 
 
-@router.post("/tables/{table_id}/end-round", response_model=AdminTableDetail)
-async def admin_end_round(
-    table_id: str,
-    db: Session = Depends(get_db),
-    admin_user: User = Depends(require_admin),
-) -> AdminTableDetail:
-    events = []
-    round_id = None
-    token = None
-    table_snapshot = None
-    game_state = None
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
+@table_command("admin:end-round")
+async def _end_round(sid: str, user: dict, table_id: str, payload: dict) -> dict:
+    def apply() -> tuple[list[dict], str | None, int | None, dict, dict]:
+        table = _admin_table(table_id)
         game = table.game
         error = game.force_end_round()
         if error:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+            raise TableError("invalid", error)
         events = game.consume_events()
-        round_id = game.round_id
         token = _set_turn_deadline(table_id)
         table_snapshot = table.snapshot()
-        game_state = game.snapshot()
+        return events, game.round_id, token, table_snapshot, game.snapshot()
+
+    events, round_id, token, table_snapshot, game_state = await actors.run(table_id, apply)
 
     await log_game_events(table_id, round_id, events)
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-    await emit_game_state(table_id)
-    if token:
-        asyncio.create_task(schedule_turn_timeout(table_id, token))
+    return await _announce_table_change(table_id, table_snapshot, game_state, token=token)
+
+
+@router.post("/tables/{table_id}/end-round", response_model=AdminTableDetail)
+async def admin_end_round(
+    table_id: str,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(require_admin),
+) -> AdminTableDetail:
+    result = await run_table_admin("admin:end-round", table_id)
 
     add_admin_log(
         db,
@@ -909,10 +972,7 @@ async def admin_end_round(
         target_table_id=table_id,
     )
     db.commit()
-
-    if not table_snapshot:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found")
-    return build_table_detail_from_snapshot(table_snapshot, game_state)
+    return build_table_detail_from_snapshot(result["table"], result["game"])
 
 
 @router.get("/crypto/deposits", response_model=list[AdminCryptoDeposit])
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import uuid
 
+from anyio import from_thread
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.deps import get_current_user, get_db
 from app.db.models import Profile, User
+from app.realtime.server import invalidate_user
 from app.schemas.profile import ProfilePublic, ProfileUpdate
 
 router = APIRouter()
@@ -52,6 +54,8 @@ def update_profile(
         profile.bio = payload.bio
     db.commit()
     db.refresh(profile)
+    if payload.display_name is not None:
+        from_thread.run(invalidate_user, current_user.id)
     return ProfilePublic.model_validate(profile)
 
 
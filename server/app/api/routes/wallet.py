@@ -15,7 +15,8 @@ from app.db.models import (
     WalletDepositAddress,
     WalletTransaction,
 )
-from app.realtime.server import emit_game_state, state, state_lock
+from app.realtime.server import actors, call_table_command, current_table, state, table_command
+from app.realtime.state import TableError
 from app.schemas.wallet import (
     WalletLinkRequest,
     WalletResponse,
@@ -210,6 +211,39 @@ def request_withdrawal(
     return WalletWithdrawalResponse.model_validate(withdrawal)
 
 
+@table_command("wallet:credit")
+async def _credit_table_bank(sid: str, user: dict, table_id: str, payload: dict) -> int | None:
+    user_id = payload["userId"]
+
+    def credit() -> int | None:
+        table = state.tables.get(table_id)
+        if not table:
+            raise TableError("not_found", "Table not found.")
+        game = state.ensure_game(table)
+        error = game.credit_bank(user_id, payload["amount"])
+        if error:
+            raise TableError("invalid", error)
+        seat = game.players.get(user_id)
+        return seat.bank if seat else None
+
+    return await actors.run(table_id, credit)
+
+
+@table_command("wallet:rollback")
+async def _rollback_table_bank(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    user_id = payload["userId"]
+
+    def rollback() -> None:
+        table = state.tables.get(table_id)
+        if table and table.game:
+            seat = table.game.players.get(user_id)
+            if seat:
+                seat.bank = max(0, seat.bank - payload["amount"])
+                table.game.mark_dirty(user_id)
+
+    await actors.run(table_id, rollback)
+
+
 @router.post("/table/deposit", response_model=WalletTableDepositResponse)
 async def deposit_to_table(
     payload: WalletTableDepositRequest,
@@ -225,25 +259,21 @@ async def deposit_to_table(
         )
 
     user_id = str(current_user.id)
-    resolved_table_id: str | None = None
-    updated_bank: int | None = None
-
-    async with state_lock:
-        resolved_table_id = payload.table_id or state.get_user_table(user_id)
-        if not resolved_table_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Join a table before depositing.",
-            )
-        table = state.tables.get(resolved_table_id)
-        if not table:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Table not found.")
-        game = state.ensure_game(table)
-        error = game.credit_bank(user_id, amount)
-        if error:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
-        seat = game.players.get(user_id)
-        updated_bank = seat.bank if seat else None
+    resolved_table_id = payload.table_id or await current_table(user_id)
+    if not resolved_table_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Join a table before depositing.",
+        )
+
+    credit = {"userId": user_id, "amount": amount}
+    try:
+        updated_bank = await call_table_command("wallet:credit", resolved_table_id, credit)
+    except TableError as exc:
+        status_code = (
+            status.HTTP_404_NOT_FOUND if exc.code == "not_found" else status.HTTP_400_BAD_REQUEST
+        )
+        raise HTTPException(status_code=status_code, detail=str(exc)) from exc
 
     try:
         wallet.balance -= amount
@@ -259,19 +289,13 @@ async def deposit_to_table(
         db.refresh(wallet)
         db.refresh(transaction)
     except Exception as exc:
-        if resolved_table_id:
-            async with state_lock:
-                table = state.tables.get(resolved_table_id)
-                if table and table.game:
-                    seat = table.game.players.get(user_id)
-                    if seat:
-                        seat.bank = max(0, seat.bank - amount)
+        await call_table_command("wallet:rollback", resolved_table_id, credit)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Deposit failed.",
         ) from exc
 
-    await emit_game_state(resolved_table_id)
+    await call_table_command("game:refresh", resolved_table_id)
 
     return WalletTableDepositResponse(
         wallet=WalletSummary.model_validate(wallet),
@@ -1,4 +1,4 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from datetime import datetime, timezone
 import uuid
 
@@ -7,12 +7,14 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from redis import Redis
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.principals import detached_user, principal_cache, user_values
 from app.db.models import User
 from app.db.redis import get_redis as get_redis_client
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal, SessionLocal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.api_prefix}/auth/login")
 
@@ -25,6 +27,11 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
@@ -41,25 +48,48 @@ def get_current_user(
         if not subject:
             raise JWTError("Missing subject")
         user_id = uuid.UUID(subject)
+        token_expires = int(payload.get("exp") or 0)
     except (JWTError, ValueError, TypeError) as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         ) from exc
 
-    user = db.scalar(select(User).where(User.id == user_id))
+    now = datetime.now(timezone.utc)
+    values = principal_cache.get(user_id, token_expires)
+    if values is not None and not _ban_expired(values, now):
+        user = detached_user(values)
+        db.add(user)
+    else:
+        user = load_principal(db, user_id, token_expires, now)
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Inactive or missing user",
         )
-    now = datetime.now(timezone.utc)
     if user.is_banned and (user.banned_until is None or user.banned_until > now):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account banned")
-    if user.banned_until and user.banned_until <= now and user.is_banned:
+    return user
+
+
+def _ban_expired(values: dict, now: datetime) -> bool:
+    banned_until = values["banned_until"]
+    return bool(values["is_banned"] and banned_until and banned_until <= now)
+
+
+def load_principal(
+    db: Session, user_id: uuid.UUID, token_expires: int, now: datetime
+) -> User | None:
+    user = db.scalar(select(User).where(User.id == user_id))
+    if not user:
+        return None
+    values = user_values(user)
+    if user.is_active and _ban_expired(values, now):
         user.is_banned = False
         user.banned_until = None
+        values = user_values(user)
         db.commit()
+    principal_cache.put(user_id, token_expires, values)
     return user
 
 
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+import uuid
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.db.models import User
+
+PRINCIPAL_CACHE_LIMIT = 10000
+PRINCIPAL_FIELDS = (
+    "id",
+    "email",
+    "is_active",
+    "is_admin",
+    "is_banned",
+    "banned_until",
+    "muted_until",
+)
+
+
+def user_values(user: User) -> dict[str, Any]:
+    # Credentials and timestamps stay out of the cache and lazy-load from the session on access.
+    return {name: getattr(user, name) for name in PRINCIPAL_FIELDS}
+
+
+def detached_user(values: dict[str, Any]) -> User:
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+class PrincipalCache:
+    def __init__(self, ttl: float, limit: int = PRINCIPAL_CACHE_LIMIT) -> None:
+        self.ttl = ttl
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[uuid.UUID, dict[int, tuple[float, dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: uuid.UUID, token_expires: int) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(user_id, {}).get(token_expires)
+            if entry is None or entry[0] <= time.monotonic():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, user_id: uuid.UUID, token_expires: int, values: dict[str, Any]) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.limit and user_id not in self._entries:
+                self._evict()
+            self._entries.setdefault(user_id, {})[token_expires] = (
+                time.monotonic() + self.ttl,
+                values,
+            )
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for user_id, tokens in list(self._entries.items()):
+            for token_expires, (deadline, _) in list(tokens.items()):
+                if deadline <= now:
+                    del tokens[token_expires]
+            if not tokens:
+                del self._entries[user_id]
+        if len(self._entries) >= self.limit:
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache(settings.principal_cache_ttl_seconds)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from app.core.config import settings
 
 _redis_client: Redis | None = None
+_binary_redis_client: Redis | None = None
+_async_redis_client: AsyncRedis | None = None
 
 
 def get_redis() -> Redis:
@@ -12,3 +15,17 @@ def get_redis() -> Redis:
     if _redis_client is None:
         _redis_client = Redis.from_url(settings.redis_url, decode_responses=True)
     return _redis_client
+
+
+def get_binary_redis() -> Redis:
+    global _binary_redis_client
+    if _binary_redis_client is None:
+        _binary_redis_client = Redis.from_url(settings.redis_url, decode_responses=False)
+    return _binary_redis_client
+
+
+def get_async_redis() -> AsyncRedis:
+    global _async_redis_client
+    if _async_redis_client is None:
+        _async_redis_client = AsyncRedis.from_url(settings.redis_url, decode_responses=True)
+    return _async_redis_client
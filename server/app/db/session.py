@@ -1,7 +1,33 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
 engine = create_engine(settings.database_url, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "postgresql":
+        return parsed.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    if backend == "sqlite" and parsed.get_driver_name() == "pysqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    return url
+
+
+def async_engine_options(url: str) -> dict:
+    options: dict = {"pool_pre_ping": True}
+    # SQLite uses a pool without sizing arguments and rejects them.
+    if make_url(url).get_backend_name() == "postgresql":
+        options["pool_size"] = settings.async_db_pool_size
+        options["max_overflow"] = settings.async_db_max_overflow
+    return options
+
+
+ASYNC_DATABASE_URL = settings.async_database_url or async_database_url(settings.database_url)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **async_engine_options(ASYNC_DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
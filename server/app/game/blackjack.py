@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+from array import array
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
+import itertools
 import secrets
 import uuid
 from typing import Literal
 
+from app.game.events import EventBuffer, EventVerbosity
+from app.game.shoe_pool import ShoePool
+from app.game.shuffle import ShuffledShoe, commit_seed, new_server_seed, shuffle_cards
+from app.game.strategy import Action, StrategyTable, strategy_table
+
 
 RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
 SUITS = ["spades", "hearts", "diamonds", "clubs"]
@@ -25,60 +33,132 @@ CARD_VALUES = {
     "K": 10,
 }
 
+CARDS_PER_DECK = len(RANKS) * len(SUITS)
+MAX_DECKS = 8
+RANK_VALUES = tuple(CARD_VALUES[rank] for rank in RANKS)
+HARD_VALUES = (1,) + RANK_VALUES[1:]
+ACE_RANK = 0
+
 HandStatus = Literal["waiting", "playing", "stand", "bust", "blackjack"]
 HandResult = Literal["win", "lose", "push", "blackjack", "bust"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Card:
     rank: str
     suit: str
     index: int
 
 
-@dataclass
+# Cards are encoded as code = deck * 52 + suit * 13 + rank. The shoe stores the
+# codes in a flat uint16 array and hands reference the interned Card objects
+# below, so every table shares the same card instances.
+CARD_TABLE: tuple[Card, ...] = tuple(
+    Card(
+        rank=RANKS[code % len(RANKS)],
+        suit=SUITS[(code // len(RANKS)) % len(SUITS)],
+        index=code,
+    )
+    for code in range(MAX_DECKS * CARDS_PER_DECK)
+)
+
+_HAND_ID_PREFIX = secrets.token_hex(4)
+_hand_ids = itertools.count(1)
+
+
+def next_hand_id() -> str:
+    return f"{_HAND_ID_PREFIX}{next(_hand_ids):x}"
+
+
+@dataclass(slots=True)
 class HandState:
-    hand_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    hand_id: str = field(default_factory=next_hand_id)
     cards: list[Card] = field(default_factory=list)
     bet: int = 0
     status: HandStatus = "waiting"
     result: HandResult | None = None
     is_split: bool = False
     is_doubled: bool = False
-
-
-@dataclass
+    hard_total: int = field(default=0, init=False)
+    aces: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.cards:
+            self.set_cards(self.cards)
+
+    @property
+    def total(self) -> int:
+        if self.aces and self.hard_total <= 11:
+            return self.hard_total + 10
+        return self.hard_total
+
+    @property
+    def is_soft(self) -> bool:
+        return self.aces > 0 and self.hard_total <= 11
+
+    def add_card(self, card: Card) -> None:
+        self.cards.append(card)
+        rank = card.index % len(RANKS)
+        self.hard_total += HARD_VALUES[rank]
+        if rank == ACE_RANK:
+            self.aces += 1
+
+    def set_cards(self, cards: list[Card]) -> None:
+        self.cards = []
+        self.hard_total = 0
+        self.aces = 0
+        for card in cards:
+            self.add_card(card)
+
+
+@dataclass(slots=True)
 class SeatState:
     user_id: str
     display_name: str
     bank: int
     hands: list[HandState] = field(default_factory=list)
     active_hand_index: int = 0
+    cached_payload: dict | None = field(default=None, init=False, repr=False)
+
+
+def decode_card(code: int) -> Card:
+    return CARD_TABLE[code]
+
+
+def card_payload(card: Card) -> dict:
+    return {"rank": card.rank, "suit": card.suit, "index": card.index}
+
 
+def build_shoe(decks: int) -> array:
+    return array("H", range(decks * CARDS_PER_DECK))
 
-def build_shoe(decks: int) -> list[Card]:
-    cards: list[Card] = []
-    index = 0
-    for _ in range(decks):
-        for suit in SUITS:
-            for rank in RANKS:
-                cards.append(Card(rank=rank, suit=suit, index=index))
-                index += 1
-    return cards
 
+def build_shuffled_shoe(decks: int, seed: bytes | None = None) -> ShuffledShoe:
+    seed = seed or new_server_seed()
+    cards = build_shoe(decks)
+    shuffle_cards(cards, seed)
+    return ShuffledShoe(cards=cards, seed=seed, commitment=commit_seed(seed))
 
-def calculate_total(cards: list[Card]) -> int:
-    total = sum(CARD_VALUES[card.rank] for card in cards)
-    aces = sum(1 for card in cards if card.rank == "A")
-    while total > 21 and aces:
-        total -= 10
-        aces -= 1
-    return total
 
+shoe_pool = ShoePool(build_shuffled_shoe)
 
-def is_soft_total(cards: list[Card]) -> bool:
-    total = sum(CARD_VALUES[card.rank] for card in cards)
-    return any(card.rank == "A" for card in cards) and total <= 21
+
+def recommend_action(
+    strategy: StrategyTable,
+    hand: HandState,
+    upcard: Card,
+    seat: SeatState,
+) -> Action:
+    opening = len(hand.cards) == 2 and len(seat.hands) == 1 and seat.bank >= hand.bet
+    can_split = opening and hand.cards[0].rank == hand.cards[1].rank
+    return strategy.action(
+        hand.total,
+        hand.is_soft,
+        CARD_VALUES[hand.cards[0].rank] if can_split else 0,
+        CARD_VALUES[upcard.rank],
+        opening,
+        can_split,
+    )
 
 
 class BlackjackGame:
@@ -89,15 +169,28 @@ class BlackjackGame:
         max_bet: int = 500,
         decks: int = 6,
         default_bank: int = 2500,
+        shoe_source: Callable[[int], ShuffledShoe] | None = None,
+        blackjack_payout: float = 1.5,
+        dealer_hits_soft_17: bool = False,
+        headless: bool = False,
+        event_verbosity: EventVerbosity = "full",
     ) -> None:
         self.table_id = table_id
         self.min_bet = min_bet
         self.max_bet = max_bet
         self.decks = decks
         self.default_bank = default_bank
-        self.random = secrets.SystemRandom()
-
-        self.shoe: list[Card] = []
+        self.blackjack_payout = blackjack_payout
+        self.dealer_hits_soft_17 = dealer_hits_soft_17
+        self.headless = headless
+        self.strategy = strategy_table(decks, dealer_hits_soft_17)
+        self.rounds_played = 0
+        self.shoe_source = shoe_source or shoe_pool.take
+
+        self.shoe: array = array("H")
+        self.shoe_commitment: str | None = None
+        self.revealed_shoe: dict | None = None
+        self._shoe_seed: bytes | None = None
         self.cards_played = 0
         self.players: dict[str, SeatState] = {}
         self.seat_order: list[str] = []
@@ -109,47 +202,90 @@ class BlackjackGame:
         self.active_hand_id: str | None = None
         self.round_id: str | None = None
         self.turn_token = 0
-        self.turn_ends_at: datetime | None = None
-        self.events: list[dict] = []
+        self.version = 0
+        self._turn_ends_at: datetime | None = None
+        self._snapshot: dict | None = None
+        self._snapshot_version = -1
+        self.events = EventBuffer(table_id, event_verbosity)
 
         self._reset_shoe()
 
     def _reset_shoe(self) -> None:
-        self.shoe = build_shoe(self.decks)
-        self.random.shuffle(self.shoe)
+        if self._shoe_seed is not None:
+            self.revealed_shoe = {
+                "commitment": self.shoe_commitment,
+                "seed": self._shoe_seed.hex(),
+                "decks": self.decks,
+                "cardsPlayed": self.cards_played,
+            }
+            self._log_event("shoe_retired", None, dict(self.revealed_shoe))
+        shoe = self.shoe_source(self.decks)
+        self.shoe = shoe.cards
+        self.shoe_commitment = shoe.commitment
+        self._shoe_seed = shoe.seed
         self.cards_played = 0
 
     def _maybe_reshuffle(self) -> None:
         remaining = len(self.shoe)
-        total = self.decks * 52
+        total = self.decks * CARDS_PER_DECK
         if remaining / total <= 0.25:
             self._reset_shoe()
             self._log_event("shuffle", None, {"remaining": remaining})
 
     def _draw_card(self) -> Card:
-        self._maybe_reshuffle()
-        card = self.shoe.pop()
+        if not self.shoe:
+            self._reset_shoe()
+            self._log_event("shuffle", None, {"remaining": 0})
+        card = CARD_TABLE[self.shoe.pop()]
         self.cards_played += 1
         return card
 
     def _log_event(self, action: str, user_id: str | None, payload: dict | None = None) -> None:
-        self.events.append(
-            {
-                "table_id": self.table_id,
-                "round_id": self.round_id,
-                "user_id": user_id,
-                "action": action,
-                "payload": payload or {},
-                "created_at": datetime.now(timezone.utc),
-            }
-        )
+        if self.headless:
+            return
+        self.events.record(self.round_id, action, user_id, payload)
+
+    def _log_detail(self, action: str, user_id: str, hand_id: str) -> None:
+        if self.headless:
+            return
+        if self.events.summarizes(action):
+            self.events.count(action, user_id)
+            return
+        self.events.record(self.round_id, action, user_id, {"hand_id": hand_id})
 
     def consume_events(self) -> list[dict]:
-        events = self.events
-        self.events = []
-        return events
+        return self.events.flush()
+
+    @property
+    def shoe_seed(self) -> bytes | None:
+        return self._shoe_seed
+
+    @property
+    def turn_ends_at(self) -> datetime | None:
+        return self._turn_ends_at
+
+    @turn_ends_at.setter
+    def turn_ends_at(self, value: datetime | None) -> None:
+        if value != self._turn_ends_at:
+            self._turn_ends_at = value
+            self.touch()
+
+    def touch(self) -> None:
+        self.version += 1
+
+    def mark_dirty(self, user_id: str | None = None) -> None:
+        if user_id is None:
+            for seat in self.players.values():
+                seat.cached_payload = None
+            self.dealer.cached_payload = None
+        elif user_id == self.dealer.user_id:
+            self.dealer.cached_payload = None
+        elif user_id in self.players:
+            self.players[user_id].cached_payload = None
+        self.touch()
 
     def sync_players(self, players: list[tuple[str, str]]) -> None:
+        self.mark_dirty()
         existing = set(self.players.keys())
         incoming = {user_id for user_id, _ in players}
 
@@ -190,7 +326,9 @@ class BlackjackGame:
         if not self.players:
             return "No players available."
 
-        self.round_id = uuid.uuid4().hex
+        self.mark_dirty()
+        self.rounds_played += 1
+        self.round_id = f"{self.rounds_played:x}" if self.headless else uuid.uuid4().hex
         self.status = "dealing"
         self.show_dealer_hole_card = False
         self.turn_token += 1
@@ -212,7 +350,12 @@ class BlackjackGame:
             self.status = "waiting"
             return "Players do not have enough balance."
 
-        self._log_event("round_start", None, {"min_bet": self.min_bet})
+        self._maybe_reshuffle()
+        self._log_event(
+            "round_start",
+            None,
+            {"min_bet": self.min_bet, "shoe_commitment": self.shoe_commitment},
+        )
         self._deal_initial_cards()
         self._mark_natural_blackjacks()
 
@@ -228,6 +371,7 @@ class BlackjackGame:
     def force_end_round(self) -> str | None:
         if not self.is_round_active():
             return "No round in progress."
+        self.mark_dirty()
         self.show_dealer_hole_card = True
         self._dealer_turn()
         return None
@@ -235,6 +379,7 @@ class BlackjackGame:
     def force_result(self, result: str) -> str | None:
         if not self.is_round_active():
             return "No round in progress."
+        self.mark_dirty()
         self.show_dealer_hole_card = True
         summary: dict[str, dict[str, int]] = {}
 
@@ -260,12 +405,7 @@ class BlackjackGame:
                 summary.setdefault(user_id, {"delta": 0})
                 summary[user_id]["delta"] += payout - hand.bet
 
-        self._log_event("force_result", None, {"result": result, "summary": summary})
-        self.status = "round_end"
-        self.active_player_id = None
-        self.active_hand_id = None
-        self.turn_token += 1
-        self.turn_ends_at = None
+        self._end_round("force_result", {"result": result, "summary": summary})
         return None
 
     def credit_bank(self, user_id: str, amount: int) -> str | None:
@@ -274,6 +414,7 @@ class BlackjackGame:
         seat = self.players.get(user_id)
         if not seat:
             return "Seat not found."
+        self.mark_dirty(user_id)
         seat.bank += amount
         self._log_event("wallet_deposit", user_id, {"amount": amount})
         return None
@@ -287,22 +428,22 @@ class BlackjackGame:
                 if not seat.hands or seat.hands[0].bet == 0:
                     continue
                 card = self._draw_card()
-                seat.hands[0].cards.append(card)
-                self._log_event("deal", user_id, {"hand_id": seat.hands[0].hand_id})
+                seat.hands[0].add_card(card)
+                self._log_detail("deal", user_id, seat.hands[0].hand_id)
             dealer_card = self._draw_card()
-            self.dealer.hands[0].cards.append(dealer_card)
-            self._log_event("deal", "dealer", {"hand_id": self.dealer.hands[0].hand_id})
+            self.dealer.hands[0].add_card(dealer_card)
+            self._log_detail("deal", "dealer", self.dealer.hands[0].hand_id)
 
     def _dealer_has_blackjack(self) -> bool:
         hand = self.dealer.hands[0]
-        return len(hand.cards) == 2 and calculate_total(hand.cards) == 21
+        return len(hand.cards) == 2 and hand.total == 21
 
     def _mark_natural_blackjacks(self) -> None:
         for user_id, seat in self.players.items():
             for hand in seat.hands:
                 if hand.bet == 0 or len(hand.cards) != 2:
                     continue
-                if calculate_total(hand.cards) == 21:
+                if hand.total == 21:
                     hand.status = "blackjack"
                     hand.result = "blackjack"
                     self._log_event("blackjack", user_id, {"hand_id": hand.hand_id})
@@ -361,7 +502,7 @@ class BlackjackGame:
 
         self._dealer_turn()
 
-    def _current_hand(self) -> HandState | None:
+    def current_hand(self) -> HandState | None:
         if not self.active_player_id:
             return None
         seat = self.players.get(self.active_player_id)
@@ -371,20 +512,30 @@ class BlackjackGame:
             return None
         return seat.hands[seat.active_hand_index]
 
+    def hint(self, user_id: str) -> Action | None:
+        if self.status != "player" or user_id != self.active_player_id:
+            return None
+        seat = self.players.get(user_id)
+        hand = self.current_hand()
+        if not seat or not hand or hand.status != "playing":
+            return None
+        return recommend_action(self.strategy, hand, self.dealer.hands[0].cards[0], seat)
+
     def hit(self, user_id: str) -> str | None:
         if self.status != "player":
             return "Round is not accepting actions."
         if user_id != self.active_player_id:
             return "Not your turn."
-        hand = self._current_hand()
+        hand = self.current_hand()
         if not hand or hand.status != "playing":
             return "Hand is not active."
 
+        self.mark_dirty(user_id)
         card = self._draw_card()
-        hand.cards.append(card)
+        hand.add_card(card)
         self._log_event("hit", user_id, {"hand_id": hand.hand_id})
 
-        total = calculate_total(hand.cards)
+        total = hand.total
         if total > 21:
             hand.status = "bust"
             hand.result = "bust"
@@ -400,9 +551,10 @@ class BlackjackGame:
             return "Round is not accepting actions."
         if user_id != self.active_player_id:
             return "Not your turn."
-        hand = self._current_hand()
+        hand = self.current_hand()
         if not hand or hand.status != "playing":
             return "Hand is not active."
+        self.mark_dirty(user_id)
         hand.status = "stand"
         self._log_event("auto_stand" if auto else "stand", user_id, {"hand_id": hand.hand_id})
         self._advance_turn()
@@ -414,7 +566,7 @@ class BlackjackGame:
         if user_id != self.active_player_id:
             return "Not your turn."
         seat = self.players.get(user_id)
-        hand = self._current_hand()
+        hand = self.current_hand()
         if not seat or not hand:
             return "Hand is not active."
         if hand.status != "playing":
@@ -422,14 +574,15 @@ class BlackjackGame:
         if len(hand.cards) != 2 or seat.bank < hand.bet or len(seat.hands) > 1:
             return "Cannot double down."
 
+        self.mark_dirty(user_id)
         seat.bank -= hand.bet
         hand.bet *= 2
         hand.is_doubled = True
         self._log_event("double", user_id, {"hand_id": hand.hand_id})
 
         card = self._draw_card()
-        hand.cards.append(card)
-        total = calculate_total(hand.cards)
+        hand.add_card(card)
+        total = hand.total
         if total > 21:
             hand.status = "bust"
             hand.result = "bust"
@@ -444,7 +597,7 @@ class BlackjackGame:
         if user_id != self.active_player_id:
             return "Not your turn."
         seat = self.players.get(user_id)
-        hand = self._current_hand()
+        hand = self.current_hand()
         if not seat or not hand:
             return "Hand is not active."
         if len(seat.hands) > 1 or len(hand.cards) != 2:
@@ -454,10 +607,11 @@ class BlackjackGame:
         if seat.bank < hand.bet:
             return "Not enough balance to split."
 
+        self.mark_dirty(user_id)
         seat.bank -= hand.bet
         left_card = hand.cards[0]
         right_card = hand.cards[1]
-        hand.cards = [left_card]
+        hand.set_cards([left_card])
         hand.is_split = True
         split_hand = HandState(
             bet=hand.bet,
@@ -473,24 +627,22 @@ class BlackjackGame:
         return None
 
     def _dealer_turn(self) -> None:
+        self.mark_dirty()
         self.status = "dealer"
         self.show_dealer_hole_card = True
         hand = self.dealer.hands[0]
-        while True:
-            total = calculate_total(hand.cards)
-            soft = is_soft_total(hand.cards)
-        if total < 17:
+        while hand.total < 17 or (
+            self.dealer_hits_soft_17 and hand.total == 17 and hand.is_soft
+        ):
             card = self._draw_card()
-            hand.cards.append(card)
-            self._log_event("dealer_hit", "dealer", {"hand_id": hand.hand_id})
-            continue
-            break
+            hand.add_card(card)
+            self._log_detail("dealer_hit", "dealer", hand.hand_id)
         self._settle_round()
 
     def _settle_round(self) -> None:
         self.status = "settle"
         dealer_hand = self.dealer.hands[0]
-        dealer_total = calculate_total(dealer_hand.cards)
+        dealer_total = dealer_hand.total
         dealer_bust = dealer_total > 21
         dealer_blackjack = dealer_total == 21 and len(dealer_hand.cards) == 2
 
@@ -502,7 +654,7 @@ class BlackjackGame:
                     continue
                 if hand.result == "bust":
                     continue
-                total = calculate_total(hand.cards)
+                total = hand.total
                 if hand.result == "blackjack" and dealer_blackjack:
                     hand.result = "push"
                 elif total == 21 and len(hand.cards) == 2 and not dealer_blackjack:
@@ -522,7 +674,7 @@ class BlackjackGame:
 
                 payout = 0
                 if hand.result == "blackjack":
-                    payout = int(hand.bet * 2.5)
+                    payout = hand.bet + int(hand.bet * self.blackjack_payout)
                 elif hand.result == "win":
                     payout = hand.bet * 2
                 elif hand.result == "push":
@@ -532,73 +684,65 @@ class BlackjackGame:
                 summary.setdefault(user_id, {"delta": 0})
                 summary[user_id]["delta"] += payout - hand.bet
 
-        self._log_event("round_end", None, {"summary": summary})
+        self._end_round("round_end", {"summary": summary})
+
+    def _end_round(self, action: str, payload: dict) -> None:
+        self.events.summarize(self.round_id)
+        self._log_event(action, None, payload)
         self.status = "round_end"
         self.active_player_id = None
         self.active_hand_id = None
         self.turn_token += 1
         self.turn_ends_at = None
 
-    def snapshot(self) -> dict:
-        players_payload: list[dict] = []
-        for user_id in self.seat_order:
-            seat = self.players.get(user_id)
-            if not seat:
-                continue
-            players_payload.append(
-                {
-                    "userId": seat.user_id,
-                    "displayName": seat.display_name,
-                    "isDealer": False,
-                    "bank": seat.bank,
-                    "hands": [
-                        {
-                            "id": hand.hand_id,
-                            "cards": [
-                                {"rank": card.rank, "suit": card.suit, "index": card.index}
-                                for card in hand.cards
-                            ],
-                            "bet": hand.bet,
-                            "result": hand.result,
-                            "status": hand.status,
-                        }
-                        for hand in seat.hands
-                    ],
-                }
-            )
-
-        players_payload.append(
-            {
-                "userId": self.dealer.user_id,
-                "displayName": self.dealer.display_name,
-                "isDealer": True,
-                "bank": 0,
+    def _seat_payload(self, seat: SeatState) -> dict:
+        if seat.cached_payload is None:
+            is_dealer = seat is self.dealer
+            seat.cached_payload = {
+                "userId": seat.user_id,
+                "displayName": seat.display_name,
+                "isDealer": is_dealer,
+                "bank": 0 if is_dealer else seat.bank,
                 "hands": [
                     {
                         "id": hand.hand_id,
-                        "cards": [
-                            {"rank": card.rank, "suit": card.suit, "index": card.index}
-                            for card in hand.cards
-                        ],
-                        "bet": 0,
+                        "cards": [card_payload(card) for card in hand.cards],
+                        "bet": 0 if is_dealer else hand.bet,
                         "result": hand.result,
                         "status": hand.status,
                     }
-                    for hand in self.dealer.hands
+                    for hand in seat.hands
                 ],
             }
-        )
+        return seat.cached_payload
+
+    def snapshot(self) -> dict:
+        if self._snapshot is not None and self._snapshot_version == self.version:
+            return self._snapshot
+
+        players_payload: list[dict] = []
+        for user_id in self.seat_order:
+            seat = self.players.get(user_id)
+            if not seat:
+                continue
+            players_payload.append(self._seat_payload(seat))
+        players_payload.append(self._seat_payload(self.dealer))
 
-        return {
+        self._snapshot = {
             "tableId": self.table_id,
+            "version": self.version,
             "status": self.status,
             "minBet": self.min_bet,
             "maxBet": self.max_bet,
             "cardsPlayed": self.cards_played,
             "shoeCount": len(self.shoe),
+            "shoeCommitment": self.shoe_commitment,
+            "revealedShoe": self.revealed_shoe,
             "showDealerHoleCard": self.show_dealer_hole_card,
             "activePlayerId": self.active_player_id,
             "activeHandId": self.active_hand_id,
             "turnEndsAt": self.turn_ends_at.isoformat() if self.turn_ends_at else None,
             "players": players_payload,
         }
+        self._snapshot_version = self.version
+        return self._snapshot
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import heapq
+import logging
+from operator import attrgetter
+import time
+from typing import Literal
+
+
+logger = logging.getLogger(__name__)
+
+EVENT_BUFFER_SIZE = 512
+SUMMARIZED_ACTIONS = frozenset({"deal", "dealer_hit"})
+ROUND_BOUNDARY_ACTIONS = frozenset({"round_start", "round_end"})
+
+EventVerbosity = Literal["full", "summary"]
+
+
+@dataclass(slots=True)
+class GameEvent:
+    round_id: str | None
+    user_id: str | None
+    action: str
+    payload: dict | None
+    at: float
+    seq: int
+
+
+class EventBuffer:
+    __slots__ = (
+        "table_id",
+        "verbosity",
+        "size",
+        "dropped",
+        "_ring",
+        "_head",
+        "_length",
+        "_boundaries",
+        "_seq",
+        "_round_dropped",
+        "_counts",
+    )
+
+    def __init__(
+        self,
+        table_id: str,
+        verbosity: EventVerbosity = "full",
+        size: int = EVENT_BUFFER_SIZE,
+    ) -> None:
+        self.table_id = table_id
+        self.verbosity = verbosity
+        self.size = size
+        self.dropped = 0
+        # Round boundaries sit outside the ring so eviction never has to skip them;
+        # the ring and the boundaries together never hold more than ``size`` events.
+        self._ring: list[GameEvent | None] = [None] * size
+        self._head = 0
+        self._length = 0
+        self._boundaries: deque[GameEvent] = deque()
+        self._seq = 0
+        self._round_dropped = 0
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        return self._length + len(self._boundaries)
+
+    def summarizes(self, action: str) -> bool:
+        return self.verbosity == "summary" and action in SUMMARIZED_ACTIONS
+
+    def record(
+        self,
+        round_id: str | None,
+        action: str,
+        user_id: str | None,
+        payload: dict | None = None,
+    ) -> None:
+        if len(self) >= self.size:
+            self._evict()
+        event = GameEvent(round_id, user_id, action, payload, time.monotonic(), self._seq)
+        self._seq += 1
+        if action in ROUND_BOUNDARY_ACTIONS:
+            self._boundaries.append(event)
+            return
+        self._ring[(self._head + self._length) % self.size] = event
+        self._length += 1
+
+    def _evict(self) -> None:
+        if self._length:
+            self._ring[self._head] = None
+            self._head = (self._head + 1) % self.size
+            self._length -= 1
+        else:
+            self._boundaries.popleft()
+        self.dropped += 1
+        self._round_dropped += 1
+
+    def count(self, action: str, user_id: str | None) -> None:
+        per_user = self._counts.setdefault(action, {})
+        key = user_id or "system"
+        per_user[key] = per_user.get(key, 0) + 1
+
+    def summarize(self, round_id: str | None) -> None:
+        if not self._counts and not self._round_dropped:
+            return
+        payload: dict = {"counts": self._counts}
+        if self._round_dropped:
+            payload["dropped"] = self._round_dropped
+            logger.warning(
+                "Game event buffer for table %s dropped %d events before round %s ended",
+                self.table_id,
+                self._round_dropped,
+                round_id,
+            )
+        self._counts = {}
+        self._round_dropped = 0
+        self.record(round_id, "round_detail", None, payload)
+
+    def flush(self) -> list[dict]:
+        if not len(self):
+            return []
+        ring = self._ring
+        regular = []
+        for position in range(self._length):
+            index = (self._head + position) % self.size
+            regular.append(ring[index])
+            ring[index] = None
+        events = list(heapq.merge(regular, self._boundaries, key=attrgetter("seq")))
+        self._boundaries.clear()
+        self._head = 0
+        self._length = 0
+        offset = time.time() - time.monotonic()
+        table_id = self.table_id
+        return [
+            {
+                "table_id": table_id,
+                "round_id": event.round_id,
+                "user_id": event.user_id,
+                "action": event.action,
+                "payload": event.payload or {},
+                "created_at": datetime.fromtimestamp(event.at + offset, timezone.utc),
+            }
+            for event in events
+        ]
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import json
+
+import numpy as np
+
+from app.game.strategy import strategy_table
+
+
+ODDS_SAMPLE_HANDS = 200_000
+ODDS_BATCH_HANDS = 50_000
+MAX_PLAYER_DRAWS = 10
+
+# Rank slots: 0 = ace, 1..8 = 2..9, 9 = ten-valued cards.
+RANK_HARD_VALUES = np.arange(1, 11, dtype=np.int16)
+
+
+@dataclass(frozen=True, slots=True)
+class OddsEstimate:
+    hands: int
+    house_edge: float
+    variance: float
+    std_error: float
+    win_rate: float
+    push_rate: float
+    loss_rate: float
+
+
+def config_hash(decks: int, blackjack_payout: float, dealer_hits_soft_17: bool) -> str:
+    encoded = json.dumps(
+        {"decks": decks, "payout": blackjack_payout, "h17": dealer_hits_soft_17},
+        sort_keys=True,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def initial_counts(decks: int, hands: int) -> np.ndarray:
+    per_rank = np.full(10, 4 * decks, dtype=np.int16)
+    per_rank[9] = 16 * decks
+    return np.tile(per_rank, (hands, 1))
+
+
+def draw(rng: np.random.Generator, counts: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    cumulative = counts.cumsum(axis=1)
+    target = (rng.random(len(counts)) * cumulative[:, -1]).astype(np.int32)
+    slots = (cumulative <= target[:, None]).sum(axis=1)
+    rows = np.flatnonzero(mask)
+    counts[rows, slots[rows]] -= 1
+    return slots
+
+
+def totals(hard: np.ndarray, aces: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    soft = (aces > 0) & (hard <= 11)
+    return np.where(soft, hard + 10, hard), soft
+
+
+STAND, HIT, DOUBLE = 0, 1, 2
+ACTION_CODES = {"stand": STAND, "hit": HIT, "double": DOUBLE}
+
+
+@lru_cache(maxsize=32)
+def policy_tables(
+    decks: int, dealer_hits_soft_17: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    strategy = strategy_table(decks, dealer_hits_soft_17)
+    opening = np.zeros((2, 22, 12), dtype=np.int8)
+    later = np.zeros((2, 22, 12), dtype=np.int8)
+    splits = np.zeros((12, 12), dtype=bool)
+    for upcard in range(2, 12):
+        for soft in (0, 1):
+            for total in range(2, 22):
+                opening[soft, total, upcard] = ACTION_CODES[
+                    strategy.action(total, bool(soft), 0, upcard, True, False)
+                ]
+                later[soft, total, upcard] = ACTION_CODES[
+                    strategy.action(total, bool(soft), 0, upcard, False, False)
+                ]
+        for value in range(2, 12):
+            total = 12 if value == 11 else value * 2
+            splits[value, upcard] = (
+                strategy.action(total, value == 11, value, upcard, True, True) == "split"
+            )
+    return opening, later, splits
+
+
+def play_hand(
+    rng: np.random.Generator,
+    counts: np.ndarray,
+    hard: np.ndarray,
+    aces: np.ndarray,
+    cards: np.ndarray,
+    playing: np.ndarray,
+    later: np.ndarray,
+    upcard: np.ndarray,
+) -> None:
+    for _ in range(MAX_PLAYER_DRAWS):
+        total, soft = totals(hard, aces)
+        playing &= total < 21
+        action = later[soft.astype(np.int8), np.minimum(total, 21), upcard]
+        hitting = playing & (action == HIT)
+        if not hitting.any():
+            break
+        slots = draw(rng, counts, hitting)
+        hard += np.where(hitting, RANK_HARD_VALUES[slots], 0)
+        aces += hitting & (slots == 0)
+        cards += hitting
+        playing &= hitting
+
+
+def play_batch(
+    rng: np.random.Generator,
+    hands: int,
+    decks: int,
+    blackjack_payout: float,
+    dealer_hits_soft_17: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    opening, later, splits = policy_tables(decks, dealer_hits_soft_17)
+    counts = initial_counts(decks, hands)
+    everyone = np.ones(hands, dtype=bool)
+
+    player_slots = []
+    dealer_hard = np.zeros(hands, dtype=np.int16)
+    dealer_aces = np.zeros(hands, dtype=np.int16)
+    upcard_slot = np.zeros(hands, dtype=np.int16)
+
+    for position in range(2):
+        player_slots.append(draw(rng, counts, everyone))
+        slots = draw(rng, counts, everyone)
+        dealer_hard += RANK_HARD_VALUES[slots]
+        dealer_aces += slots == 0
+        if position == 0:
+            upcard_slot = slots
+
+    upcard = np.where(upcard_slot == 0, 11, RANK_HARD_VALUES[upcard_slot])
+    first_slot, second_slot = player_slots
+    opening_hard = RANK_HARD_VALUES[first_slot] + RANK_HARD_VALUES[second_slot]
+    opening_aces = (first_slot == 0).astype(np.int16) + (second_slot == 0)
+    opening_total, opening_soft = totals(opening_hard, opening_aces)
+    dealer_total, dealer_soft = totals(dealer_hard, dealer_aces)
+    player_natural = opening_total == 21
+    dealer_natural = dealer_total == 21
+    active = ~player_natural & ~dealer_natural
+
+    pair_value = np.where(first_slot == 0, 11, RANK_HARD_VALUES[first_slot])
+    split = active & (first_slot == second_slot) & splits[pair_value, upcard]
+    first_action = opening[opening_soft.astype(np.int8), opening_total, upcard]
+    double = active & ~split & (first_action == DOUBLE)
+
+    # Two hand slots per round: the second is only used after a split.
+    hard = np.zeros((2, hands), dtype=np.int16)
+    aces = np.zeros((2, hands), dtype=np.int16)
+    cards = np.zeros((2, hands), dtype=np.int16)
+    bets = np.zeros((2, hands))
+    hard[0] = np.where(split, RANK_HARD_VALUES[first_slot], opening_hard)
+    aces[0] = np.where(split, first_slot == 0, opening_aces)
+    cards[0] = np.where(split, 1, 2)
+    hard[1] = np.where(split, RANK_HARD_VALUES[second_slot], 0)
+    aces[1] = split & (second_slot == 0)
+    cards[1] = split
+    bets[0] = np.where(double, 2.0, 1.0)
+    bets[1] = np.where(split, 1.0, 0.0)
+
+    if double.any():
+        slots = draw(rng, counts, double)
+        hard[0] += np.where(double, RANK_HARD_VALUES[slots], 0)
+        aces[0] += double & (slots == 0)
+        cards[0] += double
+
+    play_hand(rng, counts, hard[0], aces[0], cards[0], active & ~double, later, upcard)
+    play_hand(rng, counts, hard[1], aces[1], cards[1], split.copy(), later, upcard)
+
+    hand_totals = np.stack([totals(hard[index], aces[index])[0] for index in range(2)])
+    busted = hand_totals > 21
+    dealer_active = active & ((~busted[0]) | (split & ~busted[1]))
+    while True:
+        needs_card = dealer_total < 17
+        if dealer_hits_soft_17:
+            needs_card |= (dealer_total == 17) & dealer_soft
+        hitting = dealer_active & needs_card
+        if not hitting.any():
+            break
+        slots = draw(rng, counts, hitting)
+        dealer_hard += np.where(hitting, RANK_HARD_VALUES[slots], 0)
+        dealer_aces += hitting & (slots == 0)
+        dealer_total, dealer_soft = totals(dealer_hard, dealer_aces)
+
+    dealer_bust = dealer_total > 21
+    outcome = np.where(hand_totals > dealer_total, 1.0, 0.0)
+    outcome = np.where(hand_totals < dealer_total, -1.0, outcome)
+    outcome = np.where(dealer_bust, 1.0, outcome)
+    # Settlement pays any two-card 21 as a blackjack, split hands included.
+    outcome = np.where((cards == 2) & (hand_totals == 21), blackjack_payout, outcome)
+    outcome = np.where(busted, -1.0, outcome)
+    payoff = (outcome * bets).sum(axis=0)
+
+    payoff = np.where(dealer_natural, np.where(player_natural, 0.0, -1.0), payoff)
+    payoff = np.where(player_natural & ~dealer_natural, blackjack_payout, payoff)
+    wagered = np.where(active, bets.sum(axis=0), 1.0)
+    return payoff, wagered
+
+
+def estimate_house_edge(
+    decks: int,
+    blackjack_payout: float = 1.5,
+    dealer_hits_soft_17: bool = False,
+    hands: int = ODDS_SAMPLE_HANDS,
+    seed: int | None = None,
+) -> OddsEstimate:
+    rng = np.random.default_rng(seed)
+    payoffs = []
+    wagers = []
+    remaining = hands
+    while remaining > 0:
+        size = min(remaining, ODDS_BATCH_HANDS)
+        payoff, wagered = play_batch(rng, size, decks, blackjack_payout, dealer_hits_soft_17)
+        payoffs.append(payoff)
+        wagers.append(wagered)
+        remaining -= size
+    payoff = np.concatenate(payoffs)
+    average_wager = float(np.concatenate(wagers).mean())
+    variance = float(payoff.var())
+    return OddsEstimate(
+        hands=hands,
+        house_edge=float(-payoff.mean()) / average_wager,
+        variance=variance,
+        std_error=float(np.sqrt(variance / hands)) / average_wager,
+        win_rate=float((payoff > 0).mean()),
+        push_rate=float((payoff == 0).mean()),
+        loss_rate=float((payoff < 0).mean()),
+    )
+
+
+@lru_cache(maxsize=64)
+def cached_house_edge(
+    decks: int,
+    blackjack_payout: float,
+    dealer_hits_soft_17: bool,
+) -> OddsEstimate:
+    return estimate_house_edge(decks, blackjack_payout, dealer_hits_soft_17)
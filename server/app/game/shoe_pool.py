@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import threading
+
+from app.game.shuffle import ShuffledShoe
+
+
+SHOE_POOL_SIZE = 4
+
+
+class ShoePool:
+    def __init__(self, factory: Callable[[int], ShuffledShoe], size: int = SHOE_POOL_SIZE) -> None:
+        self.factory = factory
+        self.size = size
+        self._ready: dict[int, deque[ShuffledShoe]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._worker: threading.Thread | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def take(self, decks: int) -> ShuffledShoe:
+        with self._lock:
+            ready = self._ready.setdefault(decks, deque())
+            shoe = ready.popleft() if ready else None
+            if shoe is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self._ensure_worker()
+            self._wakeup.notify()
+        if shoe is None:
+            shoe = self.factory(decks)
+        return shoe
+
+    def stats(self) -> dict[str, int | dict[int, int]]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "ready": {decks: len(ready) for decks, ready in self._ready.items()},
+            }
+
+    def _ensure_worker(self) -> None:
+        if self._worker and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._run, name="shoe-pool", daemon=True)
+        self._worker.start()
+
+    def _next_short(self) -> int | None:
+        for decks, ready in self._ready.items():
+            if len(ready) < self.size:
+                return decks
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                decks = self._next_short()
+                while decks is None:
+                    self._wakeup.wait()
+                    decks = self._next_short()
+            shoe = self.factory(decks)
+            with self._lock:
+                ready = self._ready[decks]
+                if len(ready) < self.size:
+                    ready.append(shoe)
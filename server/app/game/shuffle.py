@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import hashlib
+import hmac
+import os
+import struct
+from collections.abc import Sequence
+
+
+CARDS_PER_DECK = 52
+SEED_BYTES = 32
+WORD_BYTES = 4
+WORD_RANGE = 1 << (8 * WORD_BYTES)
+
+
+@dataclass(slots=True)
+class ShuffledShoe:
+    cards: array
+    seed: bytes
+    commitment: str
+
+
+class HmacDrbg:
+    def __init__(self, seed: bytes) -> None:
+        self._key = b"\x00" * 32
+        self._value = b"\x01" * 32
+        self._update(seed)
+
+    def _update(self, data: bytes = b"") -> None:
+        self._key = hmac.digest(self._key, self._value + b"\x00" + data, "sha256")
+        self._value = hmac.digest(self._key, self._value, "sha256")
+        if data:
+            self._key = hmac.digest(self._key, self._value + b"\x01" + data, "sha256")
+            self._value = hmac.digest(self._key, self._value, "sha256")
+
+    def generate(self, length: int) -> bytes:
+        output = bytearray()
+        while len(output) < length:
+            self._value = hmac.digest(self._key, self._value, "sha256")
+            output += self._value
+        self._update()
+        return bytes(output[:length])
+
+
+class WordStream:
+    def __init__(self, drbg: HmacDrbg, batch: int) -> None:
+        self.drbg = drbg
+        self.batch = max(batch, 8)
+        self._words: tuple[int, ...] = ()
+        self._position = 0
+
+    def _refill(self) -> None:
+        block = self.drbg.generate(self.batch * WORD_BYTES)
+        self._words = struct.unpack(f"<{self.batch}I", block)
+        self._position = 0
+
+    def below(self, bound: int) -> int:
+        limit = WORD_RANGE - WORD_RANGE % bound
+        while True:
+            if self._position >= len(self._words):
+                self._refill()
+            word = self._words[self._position]
+            self._position += 1
+            if word < limit:
+                return word % bound
+
+
+def new_server_seed() -> bytes:
+    return os.urandom(SEED_BYTES)
+
+
+def commit_seed(seed: bytes) -> str:
+    return hashlib.sha256(seed).hexdigest()
+
+
+def shuffle_cards(cards: array, seed: bytes) -> None:
+    words = WordStream(HmacDrbg(seed), len(cards))
+    for index in range(len(cards) - 1, 0, -1):
+        swap = words.below(index + 1)
+        cards[index], cards[swap] = cards[swap], cards[index]
+
+
+def verify_shoe(
+    seed: bytes,
+    commitment: str,
+    cards: array,
+    decks: int | None = None,
+    dealt: Sequence[int] = (),
+) -> bool:
+    # Cards are drawn from the end: the remainder is a prefix of the shuffled
+    # deck and the dealt cards, in deal order, are its reversed suffix.
+    if not hmac.compare_digest(commit_seed(seed), commitment):
+        return False
+    total = len(cards) + len(dealt)
+    if decks is None:
+        if not total or total % CARDS_PER_DECK:
+            return False
+        decks = total // CARDS_PER_DECK
+    size = decks * CARDS_PER_DECK
+    if total > size:
+        return False
+    expected = array(cards.typecode or "H", range(size))
+    shuffle_cards(expected, seed)
+    if expected[: len(cards)] != cards:
+        return False
+    return all(expected[size - 1 - index] == code for index, code in enumerate(dealt))
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+import hashlib
+import json
+import os
+import time
+
+from app.game.blackjack import (
+    BlackjackGame,
+    Card,
+    HandState,
+    SeatState,
+    build_shuffled_shoe,
+    recommend_action,
+)
+from app.game.shuffle import SEED_BYTES, HmacDrbg
+from app.game.strategy import strategy_table
+
+
+Strategy = Callable[[HandState, Card, SeatState], str]
+
+SIMULATION_BANK = 1_000_000_000
+
+
+def stand_on_17(hand: HandState, upcard: Card, seat: SeatState) -> str:
+    return "hit" if hand.total < 17 else "stand"
+
+
+def never_bust(hand: HandState, upcard: Card, seat: SeatState) -> str:
+    return "hit" if hand.total < 12 else "stand"
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    decks: int = 6
+    players: int = 1
+    min_bet: int = 10
+    blackjack_payout: float = 1.5
+    dealer_hits_soft_17: bool = False
+    strategy: str = "basic"
+
+
+def basic_strategy(config: SimulationConfig) -> Strategy:
+    table = strategy_table(config.decks, config.dealer_hits_soft_17)
+
+    def decide(hand: HandState, upcard: Card, seat: SeatState) -> str:
+        return recommend_action(table, hand, upcard, seat)
+
+    return decide
+
+
+STRATEGIES: dict[str, Callable[[SimulationConfig], Strategy]] = {
+    "basic": basic_strategy,
+    "stand17": lambda config: stand_on_17,
+    "never-bust": lambda config: never_bust,
+}
+
+
+@dataclass
+class SimulationStats:
+    rounds: int = 0
+    hands: int = 0
+    wagered: int = 0
+    net: int = 0
+    wins: int = 0
+    losses: int = 0
+    pushes: int = 0
+    blackjacks: int = 0
+    busts: int = 0
+
+    def merge(self, other: SimulationStats) -> None:
+        for item in fields(self):
+            setattr(self, item.name, getattr(self, item.name) + getattr(other, item.name))
+
+    @property
+    def house_edge(self) -> float:
+        return -self.net / self.wagered if self.wagered else 0.0
+
+
+def worker_seed(seed: int, worker: int) -> bytes:
+    return hashlib.sha256(f"simulate:{seed}:{worker}".encode("utf-8")).digest()
+
+
+def build_game(config: SimulationConfig, seed: bytes) -> BlackjackGame:
+    drbg = HmacDrbg(seed)
+    game = BlackjackGame(
+        table_id="simulation",
+        min_bet=config.min_bet,
+        max_bet=config.min_bet,
+        decks=config.decks,
+        default_bank=SIMULATION_BANK,
+        shoe_source=lambda decks: build_shuffled_shoe(decks, drbg.generate(SEED_BYTES)),
+        blackjack_payout=config.blackjack_payout,
+        dealer_hits_soft_17=config.dealer_hits_soft_17,
+        headless=True,
+    )
+    game.sync_players([(f"seat-{index}", f"Seat {index}") for index in range(config.players)])
+    return game
+
+
+def play_round(game: BlackjackGame, strategy: Strategy, stats: SimulationStats) -> None:
+    for seat in game.players.values():
+        seat.bank = SIMULATION_BANK
+    game.start_round()
+    upcard = game.dealer.hands[0].cards[0]
+    while game.status == "player":
+        user_id = game.active_player_id
+        hand = game.current_hand()
+        seat = game.players[user_id]
+        action = strategy(hand, upcard, seat)
+        if action == "double":
+            error = game.double_down(user_id)
+        elif action == "split":
+            error = game.split(user_id)
+        elif action == "hit":
+            error = game.hit(user_id)
+        else:
+            error = game.stand(user_id)
+        if error:
+            game.stand(user_id)
+
+    stats.rounds += 1
+    for seat in game.players.values():
+        stats.net += seat.bank - SIMULATION_BANK
+        for hand in seat.hands:
+            if hand.bet == 0:
+                continue
+            stats.hands += 1
+            stats.wagered += hand.bet
+            if hand.result == "blackjack":
+                stats.blackjacks += 1
+            elif hand.result == "win":
+                stats.wins += 1
+            elif hand.result == "push":
+                stats.pushes += 1
+            elif hand.result == "bust":
+                stats.busts += 1
+            else:
+                stats.losses += 1
+
+
+def run_batch(config: SimulationConfig, rounds: int, seed: bytes) -> SimulationStats:
+    strategy = STRATEGIES[config.strategy](config)
+    game = build_game(config, seed)
+    stats = SimulationStats()
+    for _ in range(rounds):
+        play_round(game, strategy, stats)
+    return stats
+
+
+def simulate(
+    config: SimulationConfig,
+    rounds: int,
+    workers: int | None = None,
+    seed: int = 0,
+) -> SimulationStats:
+    workers = max(1, min(workers or os.cpu_count() or 1, rounds))
+    shares = [rounds // workers + (1 if index < rounds % workers else 0) for index in range(workers)]
+    seeds = [worker_seed(seed, index) for index in range(workers)]
+
+    total = SimulationStats()
+    if workers == 1:
+        total.merge(run_batch(config, shares[0], seeds[0]))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for stats in executor.map(run_batch, [config] * workers, shares, seeds):
+            total.merge(stats)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run headless blackjack simulations.")
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--players", type=int, default=1)
+    parser.add_argument("--min-bet", type=int, default=10)
+    parser.add_argument("--blackjack-payout", type=float, default=1.5)
+    parser.add_argument("--dealer-hits-soft-17", action="store_true")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="basic")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    config = SimulationConfig(
+        decks=args.decks,
+        players=args.players,
+        min_bet=args.min_bet,
+        blackjack_payout=args.blackjack_payout,
+        dealer_hits_soft_17=args.dealer_hits_soft_17,
+        strategy=args.strategy,
+    )
+    started = time.perf_counter()
+    stats = simulate(config, args.rounds, args.workers, args.seed)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps({**asdict(stats), "houseEdge": stats.house_edge, "seconds": elapsed}))
+        return
+    print(f"Rounds:     {stats.rounds} in {elapsed:.2f}s ({stats.rounds / elapsed * 60:,.0f}/min)")
+    print(f"Hands:      {stats.hands}")
+    print(f"Wagered:    {stats.wagered}")
+    print(f"Net:        {stats.net}")
+    print(f"House edge: {stats.house_edge * 100:.3f}%")
+    print(
+        f"Results:    {stats.wins} win / {stats.losses} lose / {stats.pushes} push / "
+        f"{stats.blackjacks} blackjack / {stats.busts} bust"
+    )
+
+
+if __name__ == "__main__":
+    main()
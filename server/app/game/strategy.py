@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Literal
+
+
+Action = Literal["hit", "stand", "double", "split"]
+
+UPCARDS = range(2, 12)
+
+# Chart codes: H hit, S stand, D double else hit, Ds double else stand, P split.
+Chart = dict[int, tuple[str, ...]]
+
+
+def _row(default: str, **overrides: str) -> tuple[str, ...]:
+    row = []
+    for upcard in UPCARDS:
+        row.append(overrides.get(f"u{upcard}", default))
+    return tuple(row)
+
+
+def _span(code: str, *upcards: int) -> dict[str, str]:
+    return {f"u{upcard}": code for upcard in upcards}
+
+
+def _hard_chart(decks: int, dealer_hits_soft_17: bool) -> Chart:
+    chart: Chart = {total: _row("H") for total in range(4, 9)}
+    chart[9] = _row("H", **_span("D", 3, 4, 5, 6))
+    chart[10] = _row("H", **_span("D", 2, 3, 4, 5, 6, 7, 8, 9))
+    eleven_vs_ace = "D" if decks <= 2 or dealer_hits_soft_17 else "H"
+    chart[11] = _row("D", u11=eleven_vs_ace)
+    chart[12] = _row("H", **_span("S", 4, 5, 6))
+    for total in range(13, 17):
+        chart[total] = _row("H", **_span("S", 2, 3, 4, 5, 6))
+    for total in range(17, 22):
+        chart[total] = _row("S")
+    return chart
+
+
+def _soft_chart(dealer_hits_soft_17: bool) -> Chart:
+    chart: Chart = {}
+    chart[12] = _row("H")
+    chart[13] = _row("H", **_span("D", 5, 6))
+    chart[14] = _row("H", **_span("D", 5, 6))
+    chart[15] = _row("H", **_span("D", 4, 5, 6))
+    chart[16] = _row("H", **_span("D", 4, 5, 6))
+    chart[17] = _row("H", **_span("D", 3, 4, 5, 6))
+    soft_18_doubles = (2, 3, 4, 5, 6) if dealer_hits_soft_17 else (3, 4, 5, 6)
+    chart[18] = _row("S", **_span("H", 9, 10, 11), **_span("Ds", *soft_18_doubles))
+    chart[19] = _row("S", **(_span("Ds", 6) if dealer_hits_soft_17 else {}))
+    chart[20] = _row("S")
+    chart[21] = _row("S")
+    return chart
+
+
+def _pair_chart() -> Chart:
+    chart: Chart = {}
+    chart[11] = _row("P")
+    chart[10] = _row("S")
+    chart[9] = _row("P", **_span("S", 7, 10, 11))
+    chart[8] = _row("P")
+    chart[7] = _row("H", **_span("P", 2, 3, 4, 5, 6, 7))
+    chart[6] = _row("H", **_span("P", 3, 4, 5, 6))
+    chart[4] = _row("H")
+    chart[3] = _row("H", **_span("P", 4, 5, 6, 7))
+    chart[2] = _row("H", **_span("P", 4, 5, 6, 7))
+    return chart
+
+
+class StrategyTable:
+    def __init__(self, decks: int, dealer_hits_soft_17: bool) -> None:
+        self.decks = decks
+        self.dealer_hits_soft_17 = dealer_hits_soft_17
+        self.hard = _hard_chart(decks, dealer_hits_soft_17)
+        self.soft = _soft_chart(dealer_hits_soft_17)
+        self.pairs = _pair_chart()
+
+    def lookup(self, total: int, soft: bool, pair_rank: int, upcard: int) -> str:
+        column = upcard - 2
+        if pair_rank and pair_rank in self.pairs:
+            code = self.pairs[pair_rank][column]
+            if code == "P":
+                return code
+        if soft and total in self.soft:
+            return self.soft[total][column]
+        return self.hard[min(max(total, 4), 21)][column]
+
+    def action(
+        self,
+        total: int,
+        soft: bool,
+        pair_rank: int,
+        upcard: int,
+        can_double: bool,
+        can_split: bool,
+    ) -> Action:
+        code = self.lookup(total, soft, pair_rank if can_split else 0, upcard)
+        if code == "P":
+            return "split"
+        if code == "D":
+            return "double" if can_double else "hit"
+        if code == "Ds":
+            return "double" if can_double else "stand"
+        return "hit" if code == "H" else "stand"
+
+
+@lru_cache(maxsize=32)
+def strategy_table(decks: int, dealer_hits_soft_17: bool = False) -> StrategyTable:
+    return StrategyTable(decks, dealer_hits_soft_17)
@@ -12,8 +12,16 @@ from app.api.routes import admin, auth, health, profile, wallet, webhooks
 from app.core.config import settings
 from app.core.security import hash_password
 from app.db.models import Profile, User, Wallet
-from app.db.session import SessionLocal
-from app.realtime.server import sio
+from app.db.session import SessionLocal, async_engine
+from app.game.probability import shutdown_odds_executor
+from app.realtime.server import (
+    restore_checkpoints,
+    sio,
+    start_sharding,
+    stop_checkpoints,
+    stop_game_logs,
+    stop_sharding,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +49,25 @@ def ensure_upload_paths() -> None:
     ensure_default_admin()
 
 
+@fastapi_app.on_event("startup")
+async def restore_tables() -> None:
+    await start_sharding()
+    await restore_checkpoints()
+
+
+@fastapi_app.on_event("shutdown")
+def stop_odds_executor() -> None:
+    shutdown_odds_executor()
+
+
+@fastapi_app.on_event("shutdown")
+async def flush_checkpoints() -> None:
+    await stop_checkpoints()
+    await stop_game_logs()
+    await stop_sharding()
+    await async_engine.dispose()
+
+
 def ensure_default_admin() -> None:
     if not settings.default_admin_email or not settings.default_admin_password:
         return
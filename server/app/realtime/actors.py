@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import inspect
+from typing import Awaitable, Callable, TypeVar, Union
+
+T = TypeVar("T")
+Command = Callable[[], Union[T, Awaitable[T]]]
+
+
+class TableActor:
+    __slots__ = ("table_id", "_queue", "_task", "_on_idle")
+
+    def __init__(self, table_id: str, on_idle: Callable[[TableActor], None] | None = None) -> None:
+        self.table_id = table_id
+        self._queue: deque[tuple[Command, asyncio.Future]] = deque()
+        self._task: asyncio.Task | None = None
+        self._on_idle = on_idle
+
+    @property
+    def busy(self) -> bool:
+        return self._task is not None
+
+    async def call(self, command: Command[T]) -> T:
+        if self._task is not None and asyncio.current_task() is self._task:
+            result = command()
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((command, future))
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain(), name=f"table-actor:{self.table_id}")
+        return await future
+
+    async def _drain(self) -> None:
+        try:
+            while self._queue:
+                command, future = self._queue.popleft()
+                if future.done():
+                    continue
+                try:
+                    result = command()
+                    if inspect.isawaitable(result):
+                        result = await result
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._task = None
+            for _, future in self._queue:
+                future.cancel()
+            self._queue.clear()
+            if self._on_idle:
+                self._on_idle(self)
+
+
+class ActorRegistry:
+    def __init__(self) -> None:
+        self._actors: dict[str, TableActor] = {}
+
+    def __len__(self) -> int:
+        return len(self._actors)
+
+    def get(self, table_id: str) -> TableActor:
+        actor = self._actors.get(table_id)
+        if actor is None:
+            actor = TableActor(table_id, on_idle=self._release)
+            self._actors[table_id] = actor
+        return actor
+
+    async def run(self, table_id: str, command: Command[T]) -> T:
+        return await self.get(table_id).call(command)
+
+    def _release(self, actor: TableActor) -> None:
+        if self._actors.get(actor.table_id) is actor and not actor.busy:
+            del self._actors[actor.table_id]
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+import json
+import logging
+import time
 import uuid
 
 from jose import JWTError, jwt
+from redis.exceptions import RedisError
 from sqlalchemy import select
 
 from app.core.config import settings
 from app.db.models import Profile, User
-from app.db.session import SessionLocal
+from app.db.redis import get_async_redis
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_KEY_PREFIX = "vlackjack:socket_principal:"
+GENERATION_KEY_PREFIX = "vlackjack:socket_principal_gen:"
+
+STORE_SCRIPT = """
+if (redis.call('GET', KEYS[1]) or '0') == ARGV[1] then
+    redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
 
 
 @dataclass(frozen=True)
@@ -19,7 +37,158 @@ class SocketUser:
     muted_until: datetime | None = None
 
 
-def get_socket_user(token: str | None) -> SocketUser | None:
+@dataclass(frozen=True)
+class SocketPrincipal:
+    user_id: str
+    display_name: str
+    is_active: bool
+    is_banned: bool
+    banned_until: datetime | None = None
+    muted_until: datetime | None = None
+
+    def ban_expired(self, now: datetime) -> bool:
+        return (
+            self.is_active
+            and self.is_banned
+            and self.banned_until is not None
+            and self.banned_until <= now
+        )
+
+    def socket_user(self) -> SocketUser | None:
+        if not self.is_active or self.is_banned:
+            return None
+        return SocketUser(
+            user_id=self.user_id,
+            display_name=self.display_name,
+            muted_until=self.muted_until,
+        )
+
+    def dumps(self) -> str:
+        data = asdict(self)
+        for name in ("banned_until", "muted_until"):
+            if data[name] is not None:
+                data[name] = data[name].isoformat()
+        return json.dumps(data, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, raw: str) -> SocketPrincipal:
+        data = json.loads(raw)
+        for name in ("banned_until", "muted_until"):
+            if data[name] is not None:
+                data[name] = datetime.fromisoformat(data[name])
+        return cls(**data)
+
+
+_principals: dict[str, tuple[float, SocketPrincipal]] = {}
+_generations: dict[str, int] = {}
+
+
+def _principal_key(user_id: str) -> str:
+    return f"{PRINCIPAL_KEY_PREFIX}{user_id}"
+
+
+def _generation_key(user_id: str) -> str:
+    return f"{GENERATION_KEY_PREFIX}{user_id}"
+
+
+def forget_socket_user(user_id: str) -> None:
+    _generations[user_id] = _generations.get(user_id, 0) + 1
+    _principals.pop(user_id, None)
+
+
+async def invalidate_socket_user(user_id: str | uuid.UUID) -> None:
+    user_id = str(user_id)
+    forget_socket_user(user_id)
+    pipeline = get_async_redis().pipeline(transaction=True)
+    pipeline.incr(_generation_key(user_id))
+    pipeline.expire(_generation_key(user_id), settings.socket_principal_redis_ttl_seconds)
+    pipeline.delete(_principal_key(user_id))
+    try:
+        await pipeline.execute()
+    except RedisError:
+        logger.warning("Failed to invalidate socket principal %s", user_id, exc_info=True)
+
+
+async def _generation(user_id: str) -> tuple[int, str | None]:
+    try:
+        shared = await get_async_redis().get(_generation_key(user_id)) or "0"
+    except RedisError:
+        logger.warning("Failed to read socket principal generation %s", user_id, exc_info=True)
+        shared = None
+    return _generations.get(user_id, 0), shared
+
+
+async def _cached_principal(user_id: str) -> SocketPrincipal | None:
+    cached = _principals.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    try:
+        raw = await get_async_redis().get(_principal_key(user_id))
+    except RedisError:
+        logger.warning("Failed to read socket principal %s", user_id, exc_info=True)
+        return None
+    if raw is None:
+        return None
+    try:
+        principal = SocketPrincipal.loads(raw)
+    except (TypeError, ValueError, KeyError):
+        return None
+    _principals[user_id] = (time.monotonic() + settings.socket_principal_ttl_seconds, principal)
+    return principal
+
+
+async def _load_principal(user_id: uuid.UUID) -> SocketPrincipal | None:
+    async with AsyncSessionLocal() as db:
+        row = (
+            await db.execute(
+                select(User, Profile.display_name)
+                .outerjoin(Profile, Profile.user_id == User.id)
+                .where(User.id == user_id)
+            )
+        ).first()
+        if row is None:
+            return None
+        user, display_name = row
+        now = datetime.now(timezone.utc)
+        if user.is_active and user.is_banned and user.banned_until and user.banned_until <= now:
+            user.is_banned = False
+            user.banned_until = None
+            await db.commit()
+        return SocketPrincipal(
+            user_id=str(user.id),
+            display_name=display_name or user.email.split("@")[0],
+            is_active=user.is_active,
+            is_banned=user.is_banned,
+            banned_until=user.banned_until,
+            muted_until=user.muted_until,
+        )
+
+
+async def _store_principal(principal: SocketPrincipal, generation: tuple[int, str | None]) -> None:
+    local, shared = generation
+    if _generations.get(principal.user_id, 0) != local:
+        return
+    _principals[principal.user_id] = (
+        time.monotonic() + settings.socket_principal_ttl_seconds,
+        principal,
+    )
+    if shared is None:
+        return
+    try:
+        await get_async_redis().eval(
+            STORE_SCRIPT,
+            2,
+            _generation_key(principal.user_id),
+            _principal_key(principal.user_id),
+            shared,
+            principal.dumps(),
+            settings.socket_principal_redis_ttl_seconds,
+        )
+    except RedisError:
+        logger.warning("Failed to cache socket principal %s", principal.user_id, exc_info=True)
+
+
+async def get_socket_user(token: str | None) -> SocketUser | None:
     if not token:
         return None
 
@@ -38,24 +207,12 @@ def get_socket_user(token: str | None) -> SocketUser | None:
     except (JWTError, ValueError, TypeError):
         return None
 
-    db = SessionLocal()
-    try:
-        user = db.scalar(select(User).where(User.id == user_id))
-        if not user or not user.is_active:
+    now = datetime.now(timezone.utc)
+    principal = await _cached_principal(str(user_id))
+    if principal is None or principal.ban_expired(now):
+        generation = await _generation(str(user_id))
+        principal = await _load_principal(user_id)
+        if principal is None:
             return None
-        now = datetime.now(timezone.utc)
-        if user.is_banned and (user.banned_until is None or user.banned_until > now):
-            return None
-        if user.banned_until and user.banned_until <= now and user.is_banned:
-            user.is_banned = False
-            user.banned_until = None
-            db.commit()
-        profile = db.scalar(select(Profile).where(Profile.user_id == user.id))
-        display_name = profile.display_name if profile else user.email.split("@")[0]
-        return SocketUser(
-            user_id=str(user.id),
-            display_name=display_name,
-            muted_until=user.muted_until,
-        )
-    finally:
-        db.close()
+        await _store_principal(principal, generation)
+    return principal.socket_user()
@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+from array import array
+import asyncio
+from dataclasses import asdict, astuple
+import logging
+from typing import Awaitable, Callable
+
+import msgpack
+from redis import Redis
+from redis.exceptions import RedisError
+
+from app.game.blackjack import (
+    BlackjackGame,
+    HandState,
+    SeatState,
+    decode_card,
+    shoe_pool,
+)
+from app.game.shuffle import ShuffledShoe
+from app.realtime.state import LobbyState, PlayerState, TableConfig, TableState
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT = 1
+CHECKPOINT_KEY = "vlackjack:checkpoints"
+
+
+def _pack_cards(cards: list) -> bytes:
+    return array("H", [card.index for card in cards]).tobytes()
+
+
+def _unpack_cards(data: bytes) -> list:
+    codes = array("H")
+    codes.frombytes(data)
+    return [decode_card(code) for code in codes]
+
+
+def _encode_seat(seat: SeatState) -> list:
+    return [
+        seat.user_id,
+        seat.display_name,
+        seat.bank,
+        seat.active_hand_index,
+        [
+            [
+                hand.hand_id,
+                _pack_cards(hand.cards),
+                hand.bet,
+                hand.status,
+                hand.result,
+                hand.is_split,
+                hand.is_doubled,
+            ]
+            for hand in seat.hands
+        ],
+    ]
+
+
+def _decode_seat(data: list) -> SeatState:
+    user_id, display_name, bank, active_hand_index, hands = data
+    return SeatState(
+        user_id=user_id,
+        display_name=display_name,
+        bank=bank,
+        active_hand_index=active_hand_index,
+        hands=[
+            HandState(
+                hand_id=hand_id,
+                cards=_unpack_cards(cards),
+                bet=bet,
+                status=status,
+                result=result,
+                is_split=is_split,
+                is_doubled=is_doubled,
+            )
+            for hand_id, cards, bet, status, result, is_split, is_doubled in hands
+        ],
+    )
+
+
+def encode_game(game: BlackjackGame) -> list:
+    return [
+        game.min_bet,
+        game.max_bet,
+        game.decks,
+        game.default_bank,
+        game.blackjack_payout,
+        game.dealer_hits_soft_17,
+        game.rounds_played,
+        game.shoe.tobytes(),
+        game.shoe_commitment,
+        game.shoe_seed,
+        game.revealed_shoe,
+        game.cards_played,
+        [_encode_seat(game.players[user_id]) for user_id in game.seat_order],
+        _encode_seat(game.dealer),
+        game.status,
+        game.show_dealer_hole_card,
+        game.active_player_id,
+        game.active_hand_id,
+        game.round_id,
+        game.turn_token,
+        game.version,
+    ]
+
+
+def decode_game(table_id: str, data: list, event_verbosity: str) -> BlackjackGame:
+    (
+        min_bet,
+        max_bet,
+        decks,
+        default_bank,
+        blackjack_payout,
+        dealer_hits_soft_17,
+        rounds_played,
+        shoe,
+        commitment,
+        seed,
+        revealed_shoe,
+        cards_played,
+        seats,
+        dealer,
+        status,
+        show_dealer_hole_card,
+        active_player_id,
+        active_hand_id,
+        round_id,
+        turn_token,
+        version,
+    ) = data
+    cards = array("H")
+    cards.frombytes(shoe)
+    game = BlackjackGame(
+        table_id=table_id,
+        min_bet=min_bet,
+        max_bet=max_bet,
+        decks=decks,
+        default_bank=default_bank,
+        shoe_source=lambda _: ShuffledShoe(cards=cards, seed=seed, commitment=commitment),
+        blackjack_payout=blackjack_payout,
+        dealer_hits_soft_17=dealer_hits_soft_17,
+        event_verbosity=event_verbosity,
+    )
+    game.shoe_source = shoe_pool.take
+    game.rounds_played = rounds_played
+    game.revealed_shoe = revealed_shoe
+    game.cards_played = cards_played
+    for seat_data in seats:
+        seat = _decode_seat(seat_data)
+        game.players[seat.user_id] = seat
+        game.seat_order.append(seat.user_id)
+    game.dealer = _decode_seat(dealer)
+    game.status = status
+    game.show_dealer_hole_card = show_dealer_hole_card
+    game.active_player_id = active_player_id
+    game.active_hand_id = active_hand_id
+    game.round_id = round_id
+    game.turn_token = turn_token
+    game.version = version
+    return game
+
+
+def encode_table(table: TableState) -> bytes:
+    return msgpack.packb(
+        [
+            CHECKPOINT_FORMAT,
+            table.table_id,
+            table.name,
+            table.is_private,
+            table.max_players,
+            table.invite_code,
+            asdict(table.config),
+            table.is_paused,
+            table.betting_locked,
+            [
+                [player.user_id, player.display_name, player.is_ready]
+                for player in table.players.values()
+            ],
+            encode_game(table.game) if table.game else None,
+        ],
+        use_bin_type=True,
+    )
+
+
+def decode_table(data: bytes, event_verbosity: str = "full") -> TableState:
+    (
+        checkpoint_format,
+        table_id,
+        name,
+        is_private,
+        max_players,
+        invite_code,
+        config,
+        is_paused,
+        betting_locked,
+        players,
+        game,
+    ) = msgpack.unpackb(data, raw=False)
+    if checkpoint_format != CHECKPOINT_FORMAT:
+        raise ValueError(f"Unsupported checkpoint format {checkpoint_format}")
+    table = TableState(
+        table_id=table_id,
+        name=name,
+        is_private=is_private,
+        max_players=max_players,
+        invite_code=invite_code,
+        config=TableConfig(**config),
+        is_paused=is_paused,
+        betting_locked=betting_locked,
+    )
+    for user_id, display_name, is_ready in players:
+        table.players[user_id] = PlayerState(
+            user_id=user_id,
+            display_name=display_name,
+            sid="",
+            is_ready=is_ready,
+        )
+    if game is not None:
+        table.game = decode_game(table_id, game, event_verbosity)
+    return table
+
+
+def table_version(table: TableState) -> tuple:
+    game = table.game
+    return (
+        id(game),
+        game.version if game else None,
+        table.name,
+        table.is_private,
+        table.max_players,
+        table.invite_code,
+        table.is_paused,
+        table.betting_locked,
+        astuple(table.config),
+        tuple(
+            (player.user_id, player.display_name, player.is_ready)
+            for player in table.players.values()
+        ),
+    )
+
+
+class CheckpointStore:
+    def __init__(self, state: LobbyState, redis: Redis, event_verbosity: str = "full") -> None:
+        self.state = state
+        self.redis = redis
+        self.event_verbosity = event_verbosity
+        self._versions: dict[str, tuple] = {}
+        self._task: asyncio.Task | None = None
+        self._on_tick: Callable[[], Awaitable[None]] | None = None
+
+    def _changed(self) -> tuple[dict[str, bytes], list[str]]:
+        changed: dict[str, bytes] = {}
+        for table_id, table in self.state.tables.items():
+            version = table_version(table)
+            if self._versions.get(table_id) != version:
+                self._versions[table_id] = version
+                changed[table_id] = encode_table(table)
+        removed = [table_id for table_id in self._versions if table_id not in self.state.tables]
+        for table_id in removed:
+            self._versions.pop(table_id, None)
+        return changed, removed
+
+    def _write(self, changed: dict[str, bytes], removed: list[str]) -> None:
+        pipeline = self.redis.pipeline(transaction=False)
+        if changed:
+            pipeline.hset(CHECKPOINT_KEY, mapping=changed)
+        if removed:
+            pipeline.hdel(CHECKPOINT_KEY, *removed)
+        pipeline.execute()
+
+    async def save_all(self) -> int:
+        changed, removed = self._changed()
+        if not changed and not removed:
+            return 0
+        try:
+            await asyncio.to_thread(self._write, changed, removed)
+        except RedisError:
+            logger.warning("Failed to write table checkpoints", exc_info=True)
+            for table_id in changed:
+                self._versions.pop(table_id, None)
+            for table_id in removed:
+                self._versions[table_id] = ()
+            return 0
+        return len(changed) + len(removed)
+
+    async def save_table(self, table_id: str) -> None:
+        table = self.state.tables.get(table_id)
+        if not table:
+            return
+        data = encode_table(table)
+        self._versions[table_id] = table_version(table)
+        try:
+            await asyncio.to_thread(self.redis.hset, CHECKPOINT_KEY, table_id, data)
+        except RedisError:
+            self._versions.pop(table_id, None)
+            logger.warning("Failed to checkpoint table %s", table_id, exc_info=True)
+
+    def table_ids(self) -> list[str]:
+        try:
+            return [raw_id.decode() for raw_id in self.redis.hkeys(CHECKPOINT_KEY)]
+        except RedisError:
+            logger.warning("Failed to list table checkpoints", exc_info=True)
+            return []
+
+    def fetch(self, table_ids: list[str] | None = None) -> dict[bytes, bytes]:
+        try:
+            if table_ids is None:
+                return self.redis.hgetall(CHECKPOINT_KEY)
+            values = self.redis.hmget(CHECKPOINT_KEY, table_ids)
+        except RedisError:
+            logger.warning("Failed to load table checkpoints", exc_info=True)
+            return {}
+        return {
+            table_id.encode(): data for table_id, data in zip(table_ids, values) if data is not None
+        }
+
+    def restore(self, stored: dict[bytes, bytes]) -> list[TableState]:
+        restored = []
+        for raw_id, data in stored.items():
+            try:
+                table = decode_table(data, self.event_verbosity)
+            except (ValueError, TypeError, msgpack.UnpackException):
+                logger.warning("Discarding unreadable checkpoint %r", raw_id, exc_info=True)
+                continue
+            self.state.restore_table(table)
+            self._versions[table.table_id] = table_version(table)
+            restored.append(table)
+        return restored
+
+    def start(
+        self, interval: float, on_tick: Callable[[], Awaitable[None]] | None = None
+    ) -> None:
+        if interval <= 0 or self._task:
+            return
+        self._on_tick = on_tick
+        self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await self.save_all()
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.save_all()
+            if self._on_tick:
+                try:
+                    await self._on_tick()
+                except RedisError:
+                    logger.warning("Failed to adopt orphaned checkpoints", exc_info=True)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+import heapq
+from itertools import islice
+import json
+from typing import Any, Iterable, NamedTuple
+
+from app.realtime.encoding import EncodedJSON
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+PAGE_CACHE_LIMIT = 256
+
+
+class IndexKey(NamedTuple):
+    decks: int
+    min_bet: int
+    max_bet: int
+    full: bool
+
+
+@dataclass(frozen=True, slots=True)
+class LobbyFilter:
+    decks: int | None = None
+    min_bet: int | None = None
+    max_bet: int | None = None
+    has_seats: bool = False
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> LobbyFilter:
+        return cls(
+            decks=_optional_int(payload.get("decks")),
+            min_bet=_optional_int(payload.get("minBet")),
+            max_bet=_optional_int(payload.get("maxBet")),
+            has_seats=bool(payload.get("hasSeats", False)),
+        )
+
+    def matches(self, key: IndexKey) -> bool:
+        if self.decks is not None and key.decks != self.decks:
+            return False
+        if self.min_bet is not None and key.min_bet < self.min_bet:
+            return False
+        if self.max_bet is not None and key.max_bet > self.max_bet:
+            return False
+        if self.has_seats and key.full:
+            return False
+        return True
+
+    def payload(self) -> dict:
+        return {
+            "decks": self.decks,
+            "minBet": self.min_bet,
+            "maxBet": self.max_bet,
+            "hasSeats": self.has_seats,
+        }
+
+
+def _optional_int(value: Any) -> int | None:
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def index_key(summary: dict) -> IndexKey:
+    return IndexKey(
+        decks=summary.get("decks", 0),
+        min_bet=summary.get("minBet", 0),
+        max_bet=summary.get("maxBet", 0),
+        full=summary["playerCount"] >= summary["maxPlayers"],
+    )
+
+
+class TableDirectory:
+    def __init__(self, journal: bool = False) -> None:
+        self.entries: dict[str, dict] = {}
+        self._keys: dict[str, IndexKey] = {}
+        self._buckets: dict[IndexKey, list[str]] = {}
+        self._pages: dict[tuple, EncodedJSON] = {}
+        # Ids touched since the last drain(); only kept when something drains them.
+        self._changed: set[str] | None = set() if journal else None
+        self._announced: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def tables(self) -> list[dict]:
+        return list(self.entries.values())
+
+    def update(self, summary: dict) -> bool:
+        table_id = summary["id"]
+        if self.entries.get(table_id) == summary:
+            return False
+        key = index_key(summary)
+        previous = self._keys.get(table_id)
+        if previous != key:
+            if previous is not None:
+                self._unlink(table_id, previous)
+            bisect.insort(self._buckets.setdefault(key, []), table_id)
+            self._keys[table_id] = key
+        self.entries[table_id] = summary
+        self._touch(table_id)
+        return True
+
+    def discard(self, table_id: str) -> bool:
+        if self.entries.pop(table_id, None) is None:
+            return False
+        self._unlink(table_id, self._keys.pop(table_id))
+        self._touch(table_id)
+        return True
+
+    def sync(self, summaries: Iterable[dict]) -> None:
+        current = {summary["id"]: summary for summary in summaries}
+        for table_id in [table_id for table_id in self.entries if table_id not in current]:
+            self.discard(table_id)
+        for summary in current.values():
+            self.update(summary)
+
+    def drain(self) -> tuple[list[dict], list[dict], list[str]]:
+        added: list[dict] = []
+        updated: list[dict] = []
+        removed: list[str] = []
+        if not self._changed:
+            return added, updated, removed
+        for table_id in sorted(self._changed):
+            summary = self.entries.get(table_id)
+            if summary is None:
+                if table_id in self._announced:
+                    self._announced.discard(table_id)
+                    removed.append(table_id)
+            elif table_id in self._announced:
+                updated.append(summary)
+            else:
+                self._announced.add(table_id)
+                added.append(summary)
+        self._changed.clear()
+        return added, updated, removed
+
+    def page(
+        self,
+        filters: LobbyFilter,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> EncodedJSON:
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        cache_key = (filters, cursor, limit)
+        cached = self._pages.get(cache_key)
+        if cached is not None:
+            return cached
+        runs = []
+        for key, table_ids in self._buckets.items():
+            if not filters.matches(key):
+                continue
+            start = bisect.bisect_right(table_ids, cursor) if cursor else 0
+            runs.append(table_ids[start : start + limit + 1])
+        table_ids = list(islice(heapq.merge(*runs), limit + 1))
+        result = EncodedJSON(
+            json.dumps(
+                {
+                    "filters": filters.payload(),
+                    "cursor": cursor,
+                    "tables": [self.entries[table_id] for table_id in table_ids[:limit]],
+                    "nextCursor": table_ids[limit - 1] if len(table_ids) > limit else None,
+                },
+                separators=(",", ":"),
+            )
+        )
+        if len(self._pages) >= PAGE_CACHE_LIMIT:
+            self._pages.clear()
+        self._pages[cache_key] = result
+        return result
+
+    def _touch(self, table_id: str) -> None:
+        self._pages.clear()
+        if self._changed is not None:
+            self._changed.add(table_id)
+
+    def _unlink(self, table_id: str, key: IndexKey) -> None:
+        bucket = self._buckets[key]
+        del bucket[bisect.bisect_left(bucket, table_id)]
+        if not bucket:
+            del self._buckets[key]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import secrets
+from typing import Any
+
+import msgpack
+
+from app.game.blackjack import card_payload, decode_card
+
+
+class EncodedJSON:
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+
+
+class PacketJSON:
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        fragments: list[str] = []
+        nonce = ""
+
+        def splice(value: Any) -> str:
+            nonlocal nonce
+            if isinstance(value, EncodedJSON):
+                nonce = nonce or secrets.token_hex(8)
+                fragments.append(value.raw)
+                return f"\x00{nonce}:{len(fragments) - 1}"
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+        encoded = json.dumps(obj, default=splice, **kwargs)
+        for index, raw in enumerate(fragments):
+            encoded = encoded.replace(f'"\\u0000{nonce}:{index}"', raw, 1)
+        return encoded
+
+    @staticmethod
+    def loads(data: str | bytes, **kwargs: Any) -> Any:
+        return json.loads(data, **kwargs)
+
+
+JSON = "json"
+MSGPACK = "msgpack"
+ENCODINGS = (JSON, MSGPACK)
+PACKED_EVENTS = frozenset({"game:state", "table:state", "lobby:snapshot", "chat:history"})
+
+COMPACT_KEYS = {
+    "activeHandId": "ah",
+    "activePlayerId": "ap",
+    "bank": "b",
+    "bet": "bt",
+    "bettingLocked": "bl",
+    "cards": "c",
+    "cardsPlayed": "cp",
+    "commitment": "cm",
+    "createdAt": "ca",
+    "decks": "dk",
+    "displayName": "n",
+    "hands": "h",
+    "hint": "hi",
+    "hints": "hs",
+    "id": "i",
+    "inviteCode": "ic",
+    "isDealer": "d",
+    "isPaused": "pa",
+    "isPrivate": "pr",
+    "isReady": "rd",
+    "maxBet": "mx",
+    "maxPlayers": "mp",
+    "message": "m",
+    "messages": "ms",
+    "minBet": "mn",
+    "name": "nm",
+    "playerCount": "pc",
+    "players": "p",
+    "result": "r",
+    "revealedShoe": "rs",
+    "seed": "sd",
+    "seq": "q",
+    "shoeCommitment": "sh",
+    "shoeCount": "sc",
+    "showDealerHoleCard": "hc",
+    "startingBank": "sb",
+    "status": "s",
+    "system": "sy",
+    "tableId": "t",
+    "tables": "ts",
+    "turnEndsAt": "te",
+    "userId": "u",
+    "version": "v",
+    "viewer": "vw",
+}
+EXPANDED_KEYS = {short: key for key, short in COMPACT_KEYS.items()}
+
+
+def compact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            COMPACT_KEYS.get(key, key): (
+                [card["index"] for card in item] if key == "cards" else compact(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [compact(item) for item in value]
+    return value
+
+
+def expand(value: Any, key: str | None = None) -> Any:
+    if isinstance(value, dict):
+        expanded = {}
+        for short, item in value.items():
+            name = EXPANDED_KEYS.get(short, short)
+            expanded[name] = expand(item, name)
+        return expanded
+    if isinstance(value, list):
+        if key == "cards":
+            return [
+                card_payload(decode_card(code))
+                if code >= 0
+                else {"rank": None, "suit": None, "index": code}
+                for code in value
+            ]
+        return [expand(item) for item in value]
+    return value
+
+
+def pack(value: Any) -> bytes:
+    return msgpack.packb(compact(value))
+
+
+def pack_entries(value: dict) -> bytes:
+    packer = msgpack.Packer()
+    return b"".join(packer.pack(key) + packer.pack(item) for key, item in compact(value).items())
+
+
+def extend_packed(entries: bytes, size: int, extra: dict) -> bytes:
+    packer = msgpack.Packer()
+    return b"".join(
+        [
+            packer.pack_map_header(size + len(extra)),
+            entries,
+            *(
+                packer.pack(COMPACT_KEYS.get(key, key)) + packer.pack(compact(value))
+                for key, value in extra.items()
+            ),
+        ]
+    )
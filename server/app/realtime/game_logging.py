@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
+import logging
+import time
 import uuid
 
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
 from app.db.models import GameActionLog, GameRound
-from app.db.session import SessionLocal
+from app.game.events import ROUND_BOUNDARY_ACTIONS
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Round rows are upserted, which needs a dialect with ON CONFLICT support.
+UPSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
 
 
 def _coerce_uuid(value: str | None) -> uuid.UUID | None:
@@ -19,51 +34,174 @@ def _coerce_uuid(value: str | None) -> uuid.UUID | None:
             return None
 
 
-def record_round_start(table_id: str, round_id: str, started_at: datetime | None = None) -> None:
-    session = SessionLocal()
-    try:
-        session.add(
-            GameRound(
-                id=_coerce_uuid(round_id) or uuid.uuid4(),
-                table_id=table_id,
-                started_at=started_at or datetime.now(timezone.utc),
-                ended_at=None,
-                summary=None,
+def build_rows(events: list[dict]) -> tuple[list[dict], list[dict]]:
+    rounds: dict[uuid.UUID, dict] = {}
+    actions = []
+    now = datetime.now(timezone.utc)
+    for event in events:
+        table_id = event.get("table_id") or "unknown"
+        round_id = _coerce_uuid(event.get("round_id"))
+        action = event.get("action") or "unknown"
+        payload = event.get("payload") or {}
+        created_at = event.get("created_at") or now
+        if round_id and action in ROUND_BOUNDARY_ACTIONS:
+            record = rounds.setdefault(
+                round_id,
+                {
+                    "id": round_id,
+                    "table_id": table_id,
+                    "started_at": None,
+                    "ended_at": None,
+                    "summary": None,
+                },
             )
+            if action == "round_start":
+                record["started_at"] = created_at
+            else:
+                record["ended_at"] = created_at
+                record["summary"] = payload.get("summary", {})
+        actions.append(
+            {
+                "id": uuid.uuid4(),
+                "table_id": table_id,
+                "round_id": round_id,
+                "user_id": _coerce_uuid(event.get("user_id")),
+                "action": action,
+                "payload": payload,
+                "created_at": created_at,
+            }
         )
-        session.commit()
-    finally:
-        session.close()
+    for record in rounds.values():
+        record["started_at"] = record["started_at"] or record["ended_at"]
+    return list(rounds.values()), actions
 
 
-def record_round_end(table_id: str, round_id: str, summary: dict) -> None:
-    session = SessionLocal()
-    try:
-        round_uuid = _coerce_uuid(round_id)
-        if round_uuid:
-            record = session.get(GameRound, round_uuid)
-        else:
-            record = None
-        if record:
-            record.ended_at = datetime.now(timezone.utc)
-            record.summary = summary
-            session.commit()
-    finally:
-        session.close()
-
-
-def record_action(event: dict) -> None:
-    session = SessionLocal()
-    try:
-        session.add(
-            GameActionLog(
-                table_id=event.get("table_id") or "unknown",
-                round_id=_coerce_uuid(event.get("round_id")),
-                user_id=_coerce_uuid(event.get("user_id")),
-                action=event.get("action") or "unknown",
-                payload=event.get("payload") or {},
+async def write_batch(session: AsyncSession, events: list[dict]) -> None:
+    rounds, actions = build_rows(events)
+    if rounds:
+        dialect = session.get_bind().dialect.name
+        upsert = UPSERTS.get(dialect)
+        if upsert is None:
+            raise NotImplementedError(f"Game logs cannot upsert rounds on {dialect}")
+        statement = upsert(GameRound).values(rounds)
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[GameRound.id],
+                set_={
+                    "ended_at": func.coalesce(statement.excluded.ended_at, GameRound.ended_at),
+                    "summary": func.coalesce(statement.excluded.summary, GameRound.summary),
+                },
             )
         )
-        session.commit()
-    finally:
-        session.close()
+    if actions:
+        await session.execute(insert(GameActionLog), actions)
+    await session.commit()
+
+
+class GameLogWriter:
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        flush_seconds: float = 0.5,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.session_factory = session_factory
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.full_waits = 0
+        self.wait_seconds = 0.0
+        self.max_depth = 0
+        self.last_batch_ms = 0.0
+        self._queue: asyncio.Queue[dict | None] = asyncio.Queue(max_queue)
+        self._filled = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    async def submit(self, events: list[dict]) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        queue = self._queue
+        for event in events:
+            if queue.full():
+                self._filled.set()
+                self.full_waits += 1
+                started = time.perf_counter()
+                await queue.put(event)
+                self.wait_seconds += time.perf_counter() - started
+            else:
+                queue.put_nowait(event)
+        depth = queue.qsize()
+        self.max_depth = max(self.max_depth, depth)
+        if depth >= self.batch_size:
+            self._filled.set()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        self._filled.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            event = await queue.get()
+            if event is None:
+                return
+            if queue.qsize() + 1 < self.batch_size:
+                self._filled.clear()
+                try:
+                    await asyncio.wait_for(self._filled.wait(), self.flush_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            batch = [event]
+            while len(batch) < self.batch_size and not queue.empty():
+                event = queue.get_nowait()
+                if event is None:
+                    await self._write(batch)
+                    return
+                batch.append(event)
+            await self._write(batch)
+
+    async def _write(self, batch: list[dict]) -> None:
+        started = time.perf_counter()
+        if not await self._attempt(batch) and not await self._attempt(batch):
+            # One bad round (say, actions whose round row is missing) must not take
+            # the rest of the batch down with it.
+            rounds: dict[str | None, list[dict]] = {}
+            for event in batch:
+                rounds.setdefault(event.get("round_id"), []).append(event)
+            if len(rounds) == 1:
+                self.failed += len(batch)
+                logger.error("Dropped %d game log events", len(batch))
+                return
+            for round_id, events in rounds.items():
+                if await self._attempt(events):
+                    self.written += len(events)
+                else:
+                    self.failed += len(events)
+                    logger.error("Dropped %d game log events for round %s", len(events), round_id)
+            return
+        self.written += len(batch)
+        self.batches += 1
+        self.last_batch_ms = (time.perf_counter() - started) * 1000
+
+    async def _attempt(self, events: list[dict]) -> bool:
+        try:
+            async with self.session_factory() as session:
+                await write_batch(session, events)
+        except SQLAlchemyError:
+            logger.warning("Failed to write %d game log events", len(events), exc_info=True)
+            return False
+        except Exception:
+            logger.exception("Failed to write %d game log events", len(events))
+            return False
+        return True
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable
+
+import socketio
+
+from app.realtime.directory import LobbyFilter, TableDirectory
+from app.realtime.encoding import EncodedJSON
+
+
+class LobbyBroadcaster:
+    def __init__(
+        self,
+        sio: socketio.AsyncServer,
+        room: str,
+        interval: float,
+        index: TableDirectory,
+        source: Callable[[], Awaitable[list[dict]]] | None = None,
+        local_only: bool = False,
+    ) -> None:
+        self.sio = sio
+        self.room = room
+        self.interval = interval
+        self.index = index
+        self.source = source
+        self.local_only = local_only
+        self.version = 0
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def mark(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.interval)
+        self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            await self._flush()
+
+    async def snapshot(self) -> dict:
+        async with self._lock:
+            await self._flush()
+            return {"version": self.version, "tables": self.index.tables()}
+
+    def page(self, filters: LobbyFilter, cursor: str | None, limit: int) -> EncodedJSON:
+        encoded = self.index.page(filters, cursor, limit)
+        return EncodedJSON(f'{{"version":{self.version},{encoded.raw[1:]}')
+
+    async def _flush(self) -> None:
+        # Without a source the index is the live table directory, so only changed ids are read.
+        if self.source is not None:
+            self.index.sync(await self.source())
+        added, updated, removed = self.index.drain()
+        for event, payload in (
+            ("lobby:table_added", {"tables": added}),
+            ("lobby:table_updated", {"tables": updated}),
+            ("lobby:table_removed", {"tableIds": removed}),
+        ):
+            if not next(iter(payload.values())):
+                continue
+            self.version += 1
+            await self.sio.emit(
+                event,
+                {"version": self.version, **payload},
+                room=self.room,
+                ignore_queue=self.local_only,
+            )
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+import uuid
+
+TABLE_OUTBOX_SIZE = 256
+
+
+class TableOutbox:
+    __slots__ = ("epoch", "seq", "_events")
+
+    def __init__(self, size: int = TABLE_OUTBOX_SIZE) -> None:
+        # Sequence numbers only compare within one epoch; a restored table starts a new one.
+        self.epoch = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self._events: deque[tuple[int, str, Any]] = deque(maxlen=size)
+
+    def append(self, event: str, payload: Any) -> int:
+        self.seq += 1
+        self._events.append((self.seq, event, payload))
+        return self.seq
+
+    def since(self, epoch: str, seq: int) -> list[tuple[int, str, Any]] | None:
+        if epoch != self.epoch or seq > self.seq:
+            return None
+        if seq == self.seq:
+            return []
+        if not self._events or seq < self._events[0][0] - 1:
+            return None
+        return [entry for entry in self._events if entry[0] > seq]
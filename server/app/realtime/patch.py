@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def diff_state(previous: Any, current: Any, path: str = "") -> list[dict]:
+    if previous == current:
+        return []
+    if isinstance(previous, dict) and isinstance(current, dict):
+        ops: list[dict] = []
+        for key, value in current.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in previous:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_state(previous[key], value, child))
+        for key in previous.keys() - current.keys():
+            ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        return ops
+    if isinstance(previous, list) and isinstance(current, list):
+        if len(current) == len(previous):
+            ops = []
+            for index, (before, after) in enumerate(zip(previous, current)):
+                ops.extend(diff_state(before, after, f"{path}/{index}"))
+            return ops
+        if len(current) > len(previous) and current[: len(previous)] == previous:
+            return [
+                {"op": "add", "path": f"{path}/-", "value": value}
+                for value in current[len(previous) :]
+            ]
+    return [{"op": "replace", "path": path, "value": current}]
+
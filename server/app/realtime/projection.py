@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+from app.game.blackjack import BlackjackGame
+from app.realtime.encoding import EncodedJSON, extend_packed, pack_entries
+from app.realtime.patch import diff_state
+
+
+HIDDEN_CARD = {"rank": None, "suit": None, "index": -1}
+
+
+def public_state(snapshot: dict) -> dict:
+    players = []
+    for seat in snapshot["players"]:
+        if seat["isDealer"] and not snapshot["showDealerHoleCard"]:
+            seat = {
+                **seat,
+                "hands": [
+                    {**hand, "cards": hand["cards"][:1] + [HIDDEN_CARD] * (len(hand["cards"]) - 1)}
+                    for hand in seat["hands"]
+                ],
+            }
+        players.append(seat)
+    return {**snapshot, "players": players}
+
+
+def viewer_state(game: BlackjackGame, user_id: str, hints: bool) -> dict:
+    seat = game.players.get(user_id)
+    return {
+        "userId": user_id,
+        "bank": seat.bank if seat else None,
+        "hint": game.hint(user_id) if hints else None,
+    }
+
+
+class TableProjection:
+    __slots__ = ("game", "version", "public", "_public_json", "_public_packed", "_patch")
+
+    def __init__(self) -> None:
+        self.game: BlackjackGame | None = None
+        self.version = -1
+        self.public: dict | None = None
+        self._public_json: str | None = None
+        self._public_packed: bytes | None = None
+        self._patch: dict | None = None
+
+    def refresh(self, game: BlackjackGame) -> bool:
+        if game is self.game and game.version == self.version:
+            return False
+        previous = self.public if game is self.game else None
+        base_version = self.version
+        self.game = game
+        self.version = game.version
+        self.public = public_state(game.snapshot())
+        self._public_json = None
+        self._public_packed = None
+        self._patch = None
+        if previous is not None:
+            ops = [op for op in diff_state(previous, self.public) if op["path"] != "/version"]
+            self._patch = {
+                "tableId": self.public["tableId"],
+                "baseVersion": base_version,
+                "version": self.version,
+                "ops": EncodedJSON(json.dumps(ops, separators=(",", ":"))),
+            }
+        return True
+
+    @property
+    def patch(self) -> dict | None:
+        return self._patch
+
+    @property
+    def public_json(self) -> str:
+        if self._public_json is None:
+            self._public_json = json.dumps(self.public, separators=(",", ":"))
+        return self._public_json
+
+    def state_for(self, viewer: dict, seq: int | None = None) -> EncodedJSON:
+        encoded = json.dumps(viewer, separators=(",", ":"))
+        if seq is None:
+            return EncodedJSON(f'{self.public_json[:-1]},"viewer":{encoded}}}')
+        return EncodedJSON(f'{self.public_json[:-1]},"viewer":{encoded},"seq":{seq}}}')
+
+    def packed_state_for(self, viewer: dict, seq: int | None = None) -> bytes:
+        if self._public_packed is None:
+            self._public_packed = pack_entries(self.public)
+        extra = {"viewer": viewer} if seq is None else {"viewer": viewer, "seq": seq}
+        return extend_packed(self._public_packed, len(self.public), extra)
+
+    def patch_for(self, viewer: dict) -> dict | None:
+        if self._patch is None:
+            return None
+        return {**self._patch, "viewer": viewer}
@@ -1,21 +1,40 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
+import logging
+from typing import Any, Awaitable, Callable
 import uuid
 
+from redis.exceptions import RedisError
 import socketio
 
 from app.core.config import settings
-from app.realtime.auth import get_socket_user
-from app.realtime.game_logging import record_action, record_round_end, record_round_start
+from app.core.principals import principal_cache
+from app.db.redis import get_async_redis, get_binary_redis
+from app.realtime.actors import ActorRegistry
+from app.realtime.auth import forget_socket_user, get_socket_user, invalidate_socket_user
+from app.realtime.checkpoint import CheckpointStore
+from app.realtime.directory import DEFAULT_PAGE_SIZE, LobbyFilter, TableDirectory
+from app.realtime.encoding import ENCODINGS, JSON, MSGPACK, PACKED_EVENTS, PacketJSON, pack
+from app.realtime.game_logging import GameLogWriter
+from app.realtime.lobby import LobbyBroadcaster
+from app.realtime.projection import viewer_state
+from app.realtime.sharding import ShardRegistry, default_worker_id
 from app.realtime.state import (
     MAX_TABLE_PLAYERS,
     ChatMessage,
     LobbyState,
+    PlayerState,
     TableConfig,
     TableError,
+    TableState,
+    new_table_id,
 )
+from app.realtime.timers import TimerWheel
+
+logger = logging.getLogger(__name__)
 
 LOBBY_ROOM = "lobby"
 TURN_TIMEOUT_SECONDS = 25
@@ -25,11 +44,51 @@ CHAT_RATE_LIMIT_SECONDS = 0.5
 sio = socketio.AsyncServer(
     async_mode="asgi",
     cors_allowed_origins=settings.allowed_origins,
-    client_manager=socketio.AsyncRedisManager(settings.redis_url),
+    client_manager=socketio.AsyncRedisManager(settings.redis_url, json=PacketJSON),
+    json=PacketJSON,
 )
 
 state = LobbyState()
-state_lock = asyncio.Lock()
+lobby_lock = asyncio.Lock()
+actors = ActorRegistry()
+turn_timers = TimerWheel()
+seat_timers = TimerWheel()
+lobby = (
+    LobbyBroadcaster(
+        sio,
+        LOBBY_ROOM,
+        settings.lobby_broadcast_interval_seconds,
+        TableDirectory(journal=True),
+        lambda: lobby_tables(),
+        local_only=True,
+    )
+    if settings.sharding_enabled
+    else LobbyBroadcaster(
+        sio, LOBBY_ROOM, settings.lobby_broadcast_interval_seconds, state.directory
+    )
+)
+checkpoints = CheckpointStore(state, get_binary_redis(), settings.game_event_verbosity)
+game_logs = GameLogWriter(
+    settings.game_log_queue_size,
+    settings.game_log_batch_size,
+    settings.game_log_flush_seconds,
+)
+shards = ShardRegistry(
+    get_async_redis(),
+    settings.worker_id or default_worker_id(),
+    settings.shard_heartbeat_seconds,
+    settings.shard_forward_timeout_seconds,
+)
+
+TableCommand = Callable[[str, dict, str, dict], Awaitable[Any]]
+TABLE_COMMANDS: dict[str, TableCommand] = {}
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _background_finished(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task failed", exc_info=task.exception())
 
 
 def _parse_int(value: object, default: int, min_value: int, max_value: int) -> int:
@@ -41,16 +100,14 @@ def _parse_int(value: object, default: int, min_value: int, max_value: int) -> i
 
 
 async def emit_chat_history(sid: str, table_id: str) -> None:
-    async with state_lock:
-        messages = state.get_chat_history(table_id)
-    await sio.emit("chat:history", {"tableId": table_id, "messages": messages}, room=sid)
+    messages = await actors.run(table_id, lambda: state.get_chat_history(table_id))
+    await emit_to(sid, "chat:history", {"tableId": table_id, "messages": messages})
 
 
 async def broadcast_chat_message(table_id: str, message: ChatMessage) -> None:
-    async with state_lock:
-        payload = state.add_chat_message(table_id, message)
+    payload = await actors.run(table_id, lambda: state.add_chat_message(table_id, message))
     if payload:
-        await sio.emit("chat:message", payload, room=table_room(table_id))
+        await emit_table(table_id, "chat:message", payload)
 
 
 async def broadcast_system_message(table_id: str, message: str) -> None:
@@ -66,28 +123,100 @@ async def broadcast_system_message(table_id: str, message: str) -> None:
     await broadcast_chat_message(table_id, system_message)
 
 
+async def emit_to(sid: str, event: str, payload: Any, encoding: str | None = None) -> None:
+    if encoding is None:
+        player = state.get_player(sid)
+        encoding = player.encoding if player else JSON
+    if encoding == MSGPACK and event in PACKED_EVENTS:
+        payload = pack(payload)
+    await sio.emit(event, payload, room=sid)
+
+
+async def emit_table(table_id: str, event: str, payload: dict) -> None:
+    table = state.tables.get(table_id)
+    if table:
+        payload = {**payload, "seq": table.outbox.append(event, payload)}
+    await _emit_rooms(table_id, event, payload)
+
+
+async def _emit_rooms(table_id: str, event: str, payload: dict) -> None:
+    await sio.emit(event, payload, room=table_room(table_id))
+    table = state.tables.get(table_id)
+    if table and not any(player.encoding == MSGPACK for player in table.players.values()):
+        return
+    if event in PACKED_EVENTS:
+        payload = pack(payload)
+    await sio.emit(event, payload, room=table_room(table_id, MSGPACK))
+
+
 async def emit_game_state(table_id: str) -> None:
+    await actors.run(table_id, lambda: _emit_game_state(table_id))
+
+
+async def _emit_game_state(table_id: str, skip_sid: str | None = None) -> None:
     table = state.tables.get(table_id)
     if not table or not table.game:
         return
-    snapshot = table.game.snapshot()
-    await sio.emit("game:state", snapshot, room=table_room(table_id))
+    game = table.game
+    projection = table.projection
+    if not projection.refresh(game):
+        return
+    if projection.patch:
+        seq = table.outbox.append("game:patch", projection.patch)
+    else:
+        seq = table.outbox.append("game:state", None)
+    frames = []
+    for player in table.players.values():
+        if not player.sid or not player.connected or player.sid == skip_sid:
+            continue
+        viewer = viewer_state(game, player.user_id, table.config.hints)
+        patch = projection.patch_for(viewer)
+        if patch:
+            patch["seq"] = seq
+            frames.append((player, "game:patch", patch))
+        elif player.encoding == MSGPACK:
+            frames.append((player, "game:state", projection.packed_state_for(viewer, seq)))
+        else:
+            frames.append((player, "game:state", projection.state_for(viewer, seq)))
+    for player, event, payload in frames:
+        await _emit_player(player, event, payload)
+
+
+async def _emit_player(player: PlayerState, event: str, payload: Any) -> None:
+    # Sockets served by this worker skip the Redis manager; only remote seats need it.
+    await sio.emit(event, payload, room=player.sid, ignore_queue=not player.remote)
+
+
+async def send_game_state(sid: str, table_id: str) -> None:
+    await actors.run(table_id, lambda: _send_game_state(sid, table_id))
+
+
+async def _send_game_state(sid: str, table_id: str) -> None:
+    await _emit_game_state(table_id, skip_sid=sid)
+    table = state.tables.get(table_id)
+    player = state.get_player(sid)
+    if not table or not table.game or not player or table.projection.public is None:
+        return
+    viewer = viewer_state(table.game, player.user_id, table.config.hints)
+    await _emit_player(player, "game:state", _game_state_for(table, player, viewer))
+
+
+def _game_state_for(table: TableState, player: PlayerState, viewer: dict) -> Any:
+    # A full frame reflects everything recorded so far, so it carries the latest seq.
+    seq = table.outbox.seq
+    if player.encoding == MSGPACK:
+        return table.projection.packed_state_for(viewer, seq)
+    return table.projection.state_for(viewer, seq)
 
 
 async def log_game_events(table_id: str, round_id: str | None, events: list[dict]) -> None:
     if not events:
         return
-    for event in events:
-        if event.get("action") == "round_start" and round_id:
-            await asyncio.to_thread(record_round_start, table_id, round_id, event.get("created_at"))
-        if event.get("action") == "round_end" and round_id:
-            await asyncio.to_thread(
-                record_round_end,
-                table_id,
-                round_id,
-                event.get("payload", {}).get("summary", {}),
-            )
-        await asyncio.to_thread(record_action, event)
+    if settings.checkpoint_enabled and any(
+        event.get("action") in {"round_end", "force_result"} for event in events
+    ):
+        await checkpoints.save_table(table_id)
+    await game_logs.submit(events)
 
 
 def _set_turn_deadline(table_id: str) -> int | None:
@@ -97,55 +226,692 @@ def _set_turn_deadline(table_id: str) -> int | None:
     game = table.game
     if not game.active_player_id:
         game.turn_ends_at = None
+        turn_timers.cancel(table_id)
         return None
     game.turn_ends_at = datetime.now(timezone.utc) + timedelta(seconds=TURN_TIMEOUT_SECONDS)
     return game.turn_token
 
 
-async def schedule_turn_timeout(table_id: str, token: int | None) -> None:
+async def sync_seats(table_id: str) -> None:
+    token = await actors.run(table_id, lambda: _sync_seats(table_id))
+    schedule_turn_timeout(table_id, token)
+
+
+def _sync_seats(table_id: str) -> int | None:
+    table = state.tables.get(table_id)
+    if not table:
+        return None
+    state.ensure_game(table)
+    return _set_turn_deadline(table_id)
+
+
+def schedule_turn_timeout(table_id: str, token: int | None) -> None:
     if token is None:
         return
+    turn_timers.schedule(table_id, TURN_TIMEOUT_SECONDS, _fire_turn_timeout, table_id, token)
 
-    await asyncio.sleep(TURN_TIMEOUT_SECONDS)
-    async with state_lock:
-        table = state.tables.get(table_id)
-        if not table or not table.game:
+
+async def _fire_turn_timeout(table_id: str, token: int) -> None:
+    await actors.run(table_id, lambda: _expire_turn(table_id, token))
+
+
+async def _expire_turn(table_id: str, token: int) -> None:
+    table = state.tables.get(table_id)
+    if not table or not table.game or table.is_paused:
+        return
+    game = table.game
+    if game.turn_token != token or not game.active_player_id:
+        return
+    error = game.stand(game.active_player_id, auto=True)
+    events = game.consume_events()
+    round_id = game.round_id
+    next_token = _set_turn_deadline(table_id)
+
+    if error:
+        await _emit_rooms(table_id, "game:error", {"message": error})
+    await log_game_events(table_id, round_id, events)
+    await emit_game_state(table_id)
+    if next_token:
+        schedule_turn_timeout(table_id, next_token)
+
+
+def table_room(table_id: str, encoding: str = JSON) -> str:
+    if encoding == JSON:
+        return f"table:{table_id}"
+    return f"table:{table_id}:{encoding}"
+
+
+def table_command(name: str) -> Callable[[TableCommand], TableCommand]:
+    def register(command: TableCommand) -> TableCommand:
+        TABLE_COMMANDS[name] = command
+        return command
+
+    return register
+
+
+def _user_payload(player: PlayerState) -> dict:
+    return {
+        "userId": player.user_id,
+        "displayName": player.display_name,
+        "mutedUntil": player.muted_until.isoformat() if player.muted_until else None,
+        "encoding": player.encoding,
+    }
+
+
+def _seat_player(sid: str, user: dict) -> PlayerState:
+    player = state.get_player(sid)
+    if player:
+        return player
+    muted_until = user.get("mutedUntil")
+    return state.register_player(
+        sid,
+        user["userId"],
+        user["displayName"],
+        datetime.fromisoformat(muted_until) if muted_until else None,
+        remote=True,
+        encoding=user.get("encoding", JSON),
+    )
+
+
+async def lobby_tables() -> list[dict]:
+    if not settings.sharding_enabled:
+        return state.list_tables()
+    try:
+        return await shards.directory()
+    except RedisError:
+        logger.warning("Failed to read the shared lobby directory", exc_info=True)
+        return state.list_tables()
+
+
+async def publish_lobby() -> None:
+    if settings.sharding_enabled:
+        await shards.publish(state)
+    lobby.mark()
+
+
+async def current_table(user_id: str) -> str | None:
+    if settings.sharding_enabled:
+        return await shards.user_table(user_id)
+    return state.get_user_table(user_id)
+
+
+async def run_table_command(
+    name: str,
+    sid: str,
+    table_id: str,
+    payload: dict | None = None,
+    owner: str | None = None,
+) -> Any:
+    player = state.get_player(sid)
+    if not player:
+        return None
+    user = _user_payload(player)
+    payload = payload or {}
+    if settings.sharding_enabled:
+        owner = owner or await shards.owner_of(table_id)
+        if owner != shards.worker_id:
+            try:
+                return await shards.forward(owner, name, [sid, user, table_id, payload])
+            except TableError as exc:
+                await sio.emit("table:error", {"code": exc.code, "message": str(exc)}, room=sid)
+                return None
+    return await TABLE_COMMANDS[name](sid, user, table_id, payload)
+
+
+async def call_table_command(name: str, table_id: str, payload: dict | None = None) -> Any:
+    if settings.sharding_enabled:
+        return await _call_worker(await shards.owner_of(table_id), name, table_id, payload)
+    return await TABLE_COMMANDS[name]("", {}, table_id, payload or {})
+
+
+async def call_worker_commands(name: str, payload: dict | None = None) -> list[Any]:
+    if not settings.sharding_enabled:
+        return [await TABLE_COMMANDS[name]("", {}, "", payload or {})]
+    results = await asyncio.gather(
+        *(_call_worker(worker_id, name, "", payload) for worker_id in shards.ring.nodes),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, TableError):
+            logger.warning("Worker command %s failed: %s", name, result)
+        elif isinstance(result, BaseException):
+            raise result
+    return [result for result in results if not isinstance(result, BaseException)]
+
+
+async def _call_worker(worker_id: str, name: str, table_id: str, payload: dict | None) -> Any:
+    args = ["", {}, table_id, payload or {}]
+    if worker_id == shards.worker_id:
+        return await TABLE_COMMANDS[name](*args)
+    return await shards.forward(worker_id, name, args)
+
+
+async def serve_table_command(name: str, args: list) -> Any:
+    command = TABLE_COMMANDS.get(name)
+    if not command:
+        raise TableError("invalid", f"Unknown table command {name}")
+    return await command(*args)
+
+
+async def _leave_previous_shard(sid: str, previous: str | None, owner: str | None) -> None:
+    if previous and await shards.owner_of(previous) != owner:
+        await run_table_command("table:leave", sid, previous)
+
+
+async def _route(sid: str, name: str, payload: dict | None = None) -> None:
+    player = state.get_player(sid)
+    if not player:
+        return
+    table_id = await current_table(player.user_id)
+    if table_id:
+        await run_table_command(name, sid, table_id, payload)
+
+
+async def set_user_muted(user_id: str, muted_until: datetime | None) -> None:
+    value = muted_until.isoformat() if muted_until else None
+    if settings.sharding_enabled:
+        try:
+            await shards.cast("user:muted", [user_id, value])
             return
-        if table.is_paused:
+        except RedisError:
+            logger.warning("Failed to broadcast mute for %s", user_id, exc_info=True)
+    await _apply_user_muted(user_id, value)
+
+
+async def _apply_user_muted(user_id: str, muted_until: str | None) -> None:
+    value = datetime.fromisoformat(muted_until) if muted_until else None
+    async with lobby_lock:
+        for player in state.sid_to_player.values():
+            if player.user_id == user_id:
+                player.muted_until = value
+
+
+async def invalidate_user(user_id: str | uuid.UUID) -> None:
+    user_id = str(user_id)
+    await invalidate_socket_user(user_id)
+    _forget_user(user_id)
+    if settings.sharding_enabled:
+        try:
+            await shards.cast("user:invalidate", [user_id])
+        except RedisError:
+            logger.warning("Failed to broadcast invalidation for %s", user_id, exc_info=True)
+
+
+def _forget_user(user_id: str) -> None:
+    forget_socket_user(user_id)
+    principal_cache.invalidate(uuid.UUID(user_id))
+
+
+async def serve_broadcast(name: str, args: list) -> None:
+    if name == "user:muted":
+        await _apply_user_muted(*args)
+    elif name == "user:invalidate":
+        _forget_user(*args)
+
+
+async def start_sharding() -> None:
+    if settings.sharding_enabled:
+        await shards.start(serve_table_command, lobby.mark, serve_broadcast)
+
+
+async def stop_sharding() -> None:
+    if settings.sharding_enabled:
+        await shards.stop()
+
+
+async def restore_checkpoints() -> None:
+    if not settings.checkpoint_enabled:
+        return
+    await adopt_checkpoints()
+    checkpoints.start(
+        settings.checkpoint_interval_seconds,
+        adopt_checkpoints if settings.sharding_enabled else None,
+    )
+
+
+async def adopt_checkpoints() -> None:
+    if settings.sharding_enabled:
+        table_ids = await asyncio.to_thread(checkpoints.table_ids)
+        orphaned = await shards.orphaned(
+            table_id for table_id in table_ids if table_id not in state.tables
+        )
+        claimed = [table_id for table_id in orphaned if await shards.claim(table_id)]
+        if not claimed:
             return
-        game = table.game
-        if game.turn_token != token or not game.active_player_id:
+        stored = await asyncio.to_thread(checkpoints.fetch, claimed)
+    else:
+        stored = await asyncio.to_thread(checkpoints.fetch)
+    async with lobby_lock:
+        restored = checkpoints.restore(stored)
+    for table in restored:
+        await sync_seats(table.table_id)
+    if restored:
+        await publish_lobby()
+        task = asyncio.create_task(
+            release_unclaimed_seats([table.table_id for table in restored])
+        )
+        _background_tasks.add(task)
+        task.add_done_callback(_background_finished)
+
+
+async def stop_checkpoints() -> None:
+    if settings.checkpoint_enabled:
+        await checkpoints.stop()
+
+
+async def stop_game_logs() -> None:
+    await game_logs.stop()
+
+
+async def release_unclaimed_seats(table_ids: list[str]) -> None:
+    await asyncio.sleep(settings.checkpoint_claim_seconds)
+    updates = []
+    async with lobby_lock:
+        for table_id, table, removed in state.release_unclaimed_seats(table_ids):
+            if removed:
+                continue
+            updates.append((table_id, table.snapshot()))
+
+    for table_id, table_snapshot in updates:
+        await sync_seats(table_id)
+        await emit_table(table_id, "table:state", table_snapshot)
+        await emit_game_state(table_id)
+    await publish_lobby()
+
+
+@table_command("table:reclaim")
+async def _reclaim_seat(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    async with lobby_lock:
+        player = _seat_player(sid, user)
+        table = state.reclaim_seat(player)
+        if not table and player.remote:
+            state.forget_player(sid)
+        table_snapshot = table.snapshot() if table else None
+    if not table:
+        return
+
+    seat_timers.cancel(player.user_id)
+    await sio.enter_room(sid, table_room(table.table_id, player.encoding))
+    last_seq = payload.get("lastSeq")
+    epoch = payload.get("epoch")
+    if isinstance(last_seq, int) and isinstance(epoch, str) and await actors.run(
+        table.table_id, lambda: _replay_missed(sid, table, player, epoch, last_seq)
+    ):
+        return
+    await sio.emit("table:joined", _joined(table), room=sid)
+    await emit_to(sid, "table:state", table_snapshot, player.encoding)
+    await send_game_state(sid, table.table_id)
+
+
+def _joined(table: TableState, seq: int | None = None) -> dict:
+    return {
+        "tableId": table.table_id,
+        "epoch": table.outbox.epoch,
+        "seq": table.outbox.seq if seq is None else seq,
+    }
+
+
+async def _replay_missed(
+    sid: str, table: TableState, player: PlayerState, epoch: str, last_seq: int
+) -> bool:
+    # Publish pending game changes first so the replay ends at the current version.
+    await _emit_game_state(table.table_id, skip_sid=sid)
+    missed = table.outbox.since(epoch, last_seq)
+    if missed is None:
+        return False
+    await sio.emit("table:joined", _joined(table, last_seq), room=sid)
+    reset = any(event == "game:state" for _, event, _ in missed)
+    last_table_state = max(
+        (seq for seq, event, _ in missed if event == "table:state"), default=None
+    )
+    last_patch = max((seq for seq, event, _ in missed if event == "game:patch"), default=None)
+    viewer = (
+        viewer_state(table.game, player.user_id, table.config.hints)
+        if table.game and table.projection.public is not None
+        else None
+    )
+    for seq, event, payload in missed:
+        if event == "game:state" or (event == "table:state" and seq != last_table_state):
+            continue
+        if event == "game:patch":
+            if reset:
+                continue
+            if seq == last_patch and viewer is not None:
+                # The viewer's private fields ride on the patch that reaches the current version.
+                payload = {**payload, "viewer": viewer}
+        await emit_to(sid, event, {**payload, "seq": seq}, player.encoding)
+    if reset and viewer is not None:
+        await _emit_player(player, "game:state", _game_state_for(table, player, viewer))
+    return True
+
+
+@table_command("table:create")
+async def _create_table(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    async with lobby_lock:
+        player = _seat_player(sid, user)
+        prev_table_id, prev_table, prev_removed = state.remove_from_table(player)
+        table = state.create_table(
+            player,
+            payload["name"],
+            payload["isPrivate"],
+            payload["maxPlayers"],
+            TableConfig(**payload["config"]),
+            table_id=table_id,
+        )
+        table_snapshot = table.snapshot()
+        prev_snapshot = prev_table.snapshot() if prev_table and not prev_removed else None
+    await publish_lobby()
+
+    if prev_table_id:
+        await sio.leave_room(sid, table_room(prev_table_id, player.encoding))
+        if prev_snapshot:
+            await sync_seats(prev_table_id)
+            await emit_table(prev_table_id, "table:state", prev_snapshot)
+
+    await sync_seats(table.table_id)
+
+    await sio.enter_room(sid, table_room(table.table_id, player.encoding))
+    await sio.emit("table:joined", _joined(table), room=sid)
+    await emit_table(table.table_id, "table:state", table_snapshot)
+    await send_game_state(sid, table.table_id)
+    await emit_chat_history(sid, table.table_id)
+    await broadcast_system_message(table.table_id, f"{player.display_name} created the table.")
+
+
+@table_command("table:join")
+async def _join_table(sid: str, user: dict, table_id: str, payload: dict) -> bool:
+    invite_code = payload.get("inviteCode") or ""
+    error = None
+    prev_table_id = None
+    prev_snapshot = None
+    table_snapshot = None
+    async with lobby_lock:
+        player = _seat_player(sid, user)
+        try:
+            table = state.tables.get(table_id)
+            if not table:
+                raise TableError("not_found", "Table not found")
+
+            current_table_id = state.get_user_table(player.user_id)
+            if table.is_private and not invite_code and current_table_id != table_id:
+                raise TableError("private", "Invite code required")
+
+            table, prev_table_id, prev_table, prev_removed = state.move_to_table(player, table_id)
+            table_snapshot = table.snapshot()
+            prev_snapshot = prev_table.snapshot() if prev_table and not prev_removed else None
+        except TableError as exc:
+            error = {"code": exc.code, "message": str(exc)}
+            if player.remote and not state.get_user_table(player.user_id):
+                state.forget_player(sid)
+    await publish_lobby()
+
+    if error:
+        await sio.emit("table:error", error, room=sid)
+        await emit_to(sid, "lobby:snapshot", await lobby.snapshot(), player.encoding)
+        return False
+
+    if prev_table_id:
+        await sio.leave_room(sid, table_room(prev_table_id, player.encoding))
+        if prev_snapshot:
+            await sync_seats(prev_table_id)
+            await emit_table(prev_table_id, "table:state", prev_snapshot)
+
+    await sync_seats(table_id)
+    await sio.enter_room(sid, table_room(table_id, player.encoding))
+    if table_snapshot:
+        await emit_table(table_id, "table:state", table_snapshot)
+    await sio.emit("table:joined", _joined(table), room=sid)
+    await send_game_state(sid, table_id)
+    await emit_chat_history(sid, table_id)
+    await broadcast_system_message(table_id, f"{player.display_name} joined the table.")
+    return True
+
+
+@table_command("table:leave")
+async def _leave_table(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    async with lobby_lock:
+        player = state.get_player(sid)
+        if not player:
+            return
+        if player.remote:
+            table_id, table, removed = state.unregister_player(sid)
+        else:
+            table_id, table, removed = state.remove_from_table(player)
+        table_snapshot = table.snapshot() if table and not removed else None
+
+    if table_id and not payload.get("disconnected"):
+        await sio.leave_room(sid, table_room(table_id, player.encoding))
+    await _announce_leave(player, table_id, table_snapshot)
+
+
+@table_command("table:disconnect")
+async def _disconnect_seat(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    grace = settings.reconnect_grace_seconds
+    if grace <= 0:
+        await _leave_table(sid, user, table_id, {"disconnected": True})
+        return
+    async with lobby_lock:
+        player = state.get_player(sid)
+        seated_table_id = state.get_user_table(player.user_id) if player else None
+        table = state.tables.get(seated_table_id) if seated_table_id else None
+        held = bool(table and table.players.get(player.user_id) is player)
+        if held:
+            player.connected = False
+            state.forget_player(sid)
+    if not held:
+        await _leave_table(sid, user, table_id, {"disconnected": True})
+        return
+    seat_timers.schedule(player.user_id, grace, _expire_seat, seated_table_id, player)
+
+
+async def _expire_seat(table_id: str, player: PlayerState) -> None:
+    async with lobby_lock:
+        table = state.tables.get(table_id)
+        if player.connected or not table or table.players.get(player.user_id) is not player:
             return
-        error = game.stand(game.active_player_id, auto=True)
+        table_id, table, removed = state.remove_from_table(player)
+        table_snapshot = table.snapshot() if table and not removed else None
+    await _announce_leave(player, table_id, table_snapshot)
+
+
+async def _announce_leave(
+    player: PlayerState, table_id: str | None, table_snapshot: dict | None
+) -> None:
+    await publish_lobby()
+    if not table_id or not table_snapshot:
+        return
+    await sync_seats(table_id)
+    await emit_table(table_id, "table:state", table_snapshot)
+    await broadcast_system_message(table_id, f"{player.display_name} left the table.")
+    await emit_game_state(table_id)
+
+
+@table_command("table:ready")
+async def _set_ready(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    player = state.get_player(sid)
+    if not player:
+        return
+
+    def apply() -> dict | None:
+        table = state.set_ready(player, bool(payload.get("ready", False)))
+        return table.snapshot() if table else None
+
+    table_snapshot = await actors.run(table_id, apply)
+    if table_snapshot:
+        await emit_table(table_snapshot["id"], "table:state", table_snapshot)
+
+
+@table_command("chat:sync")
+async def _sync_chat(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    await emit_chat_history(sid, table_id)
+
+
+@table_command("chat:send")
+async def _send_chat(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    player = state.get_player(sid)
+    if not player:
+        await sio.emit("chat:error", {"message": "Chat session not found."}, room=sid)
+        return
+    message = payload["message"]
+
+    def apply() -> tuple[str | None, dict | None]:
+        now = datetime.now(timezone.utc)
+        if player.muted_until and player.muted_until > now:
+            return "You are muted.", None
+        if player.muted_until and player.muted_until <= now:
+            player.muted_until = None
+            return None, None
+        if player.last_chat_at and (
+            now - player.last_chat_at
+        ).total_seconds() < CHAT_RATE_LIMIT_SECONDS:
+            return "You're sending messages too fast.", None
+        player.last_chat_at = now
+        chat_message = ChatMessage(
+            message_id=uuid.uuid4().hex,
+            table_id=table_id,
+            user_id=player.user_id,
+            display_name=player.display_name,
+            message=message,
+            created_at=now,
+        )
+        return None, state.add_chat_message(table_id, chat_message)
+
+    error_message, chat_payload = await actors.run(table_id, apply)
+    if error_message:
+        await sio.emit("chat:error", {"message": error_message}, room=sid)
+        return
+    if chat_payload:
+        await emit_table(table_id, "chat:message", chat_payload)
+
+
+@table_command("game:sync")
+async def _sync_game(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    await send_game_state(sid, table_id)
+
+
+@table_command("game:refresh")
+async def _refresh_game(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    await emit_game_state(table_id)
+
+
+@table_command("game:hint")
+async def _send_hint(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    user_id = user["userId"]
+
+    def apply() -> tuple[str | None, str | None] | str | None:
+        table = state.tables.get(table_id)
+        if not table or not table.game:
+            return None
+        if not table.config.hints:
+            return "Hints are disabled at this table."
+        hint = table.game.hint(user_id)
+        return hint, table.game.active_hand_id if hint else None
+
+    result = await actors.run(table_id, apply)
+    if result is None:
+        return
+    if isinstance(result, str):
+        await sio.emit("game:error", {"message": result}, room=sid)
+        return
+    hint, hand_id = result
+    await sio.emit(
+        "game:hint",
+        {"tableId": table_id, "handId": hand_id, "action": hint},
+        room=sid,
+    )
+
+
+@table_command("game:start")
+async def _start_game(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    await actors.run(table_id, lambda: _start_round(sid, table_id))
+
+
+async def _start_round(sid: str, table_id: str) -> None:
+    table = state.tables.get(table_id)
+    if not table:
+        return
+    if table.is_paused:
+        error = "Table is paused."
+    elif table.betting_locked:
+        error = "Betting is locked."
+    elif any(not player.is_ready for player in table.players.values()):
+        error = "All players must be ready."
+    else:
+        game = state.ensure_game(table)
+        error = game.start_round()
         events = game.consume_events()
         round_id = game.round_id
-        if error:
-            await sio.emit("game:error", {"message": error}, room=table_room(table_id))
         token = _set_turn_deadline(table_id)
-
+    if error:
+        await sio.emit("game:error", {"message": error}, room=sid)
+        return
     await log_game_events(table_id, round_id, events)
     await emit_game_state(table_id)
     if token:
-        asyncio.create_task(schedule_turn_timeout(table_id, token))
+        schedule_turn_timeout(table_id, token)
+
+
+@table_command("game:action")
+async def _game_action(sid: str, user: dict, table_id: str, payload: dict) -> None:
+    await actors.run(
+        table_id,
+        lambda: _apply_action(sid, table_id, user["userId"], payload["action"]),
+    )
+
+
+async def _apply_action(sid: str, table_id: str, user_id: str, action: str) -> None:
+    table = state.tables.get(table_id)
+    if not table or not table.game:
+        return
+    events: list[dict] = []
+    token: int | None = None
+    if table.is_paused:
+        error = "Table is paused."
+        round_id = table.game.round_id
+        table.game.turn_ends_at = None
+        turn_timers.cancel(table_id)
+    else:
+        game = table.game
+        if action == "hit":
+            error = game.hit(user_id)
+        elif action == "stand":
+            error = game.stand(user_id)
+        elif action == "double":
+            error = game.double_down(user_id)
+        elif action == "split":
+            error = game.split(user_id)
+        else:
+            error = "Unknown action."
 
+        events = game.consume_events()
+        round_id = game.round_id
+        token = _set_turn_deadline(table_id)
 
-def table_room(table_id: str) -> str:
-    return f"table:{table_id}"
+    if error:
+        await sio.emit("game:error", {"message": error}, room=sid)
+    await log_game_events(table_id, round_id, events)
+    await emit_game_state(table_id)
+    if token:
+        schedule_turn_timeout(table_id, token)
 
 
 @sio.event
 async def connect(sid: str, environ: dict, auth: dict | None) -> bool:
     token = None
+    encoding = JSON
     if isinstance(auth, dict):
         token = auth.get("token") or auth.get("accessToken")
+        if auth.get("encoding") in ENCODINGS:
+            encoding = auth["encoding"]
 
-    user = await asyncio.to_thread(get_socket_user, token)
+    user = await get_socket_user(token)
     if not user:
         return False
 
-    async with state_lock:
-        player = state.register_player(sid, user.user_id, user.display_name, user.muted_until)
-        tables = state.list_tables()
+    async with lobby_lock:
+        player = state.register_player(
+            sid, user.user_id, user.display_name, user.muted_until, encoding=encoding
+        )
 
     await sio.save_session(
         sid,
@@ -155,37 +921,48 @@ async def connect(sid: str, environ: dict, auth: dict | None) -> bool:
         },
     )
     await sio.enter_room(sid, LOBBY_ROOM)
-    await sio.emit("lobby:snapshot", {"tables": tables}, room=sid)
+    await emit_to(sid, "lobby:snapshot", await lobby.snapshot())
+    table_id = await current_table(player.user_id)
+    if table_id:
+        last_seq = auth.get("lastSeq")
+        epoch = auth.get("epoch")
+        reclaim = (
+            {"lastSeq": last_seq, "epoch": epoch}
+            if isinstance(last_seq, int) and isinstance(epoch, str)
+            else {}
+        )
+        await run_table_command("table:reclaim", sid, table_id, reclaim)
     return True
 
 
 @sio.event
 async def disconnect(sid: str) -> None:
-    token = None
-    display_name = None
-    async with state_lock:
-        player = state.get_player(sid)
-        display_name = player.display_name if player else None
-        table_id, table, removed = state.unregister_player(sid)
-        tables = state.list_tables()
-        table_snapshot = table.snapshot() if table and not removed else None
-        if table_id and table and table.game:
-            token = _set_turn_deadline(table_id)
-
-    if table_id and table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-        if display_name:
-            await broadcast_system_message(table_id, f"{display_name} left the table.")
-    await sio.emit("lobby:snapshot", {"tables": tables}, room=LOBBY_ROOM)
-    if table_id and token:
-        asyncio.create_task(schedule_turn_timeout(table_id, token))
+    player = state.get_player(sid)
+    if not player:
+        return
+    table_id = await current_table(player.user_id)
+    if table_id:
+        await run_table_command("table:disconnect", sid, table_id)
+    async with lobby_lock:
+        state.unregister_player(sid)
 
 
 @sio.on("lobby:list")
-async def lobby_list(sid: str) -> None:
-    async with state_lock:
-        tables = state.list_tables()
-    await sio.emit("lobby:snapshot", {"tables": tables}, room=sid)
+async def lobby_list(sid: str, payload: dict | None = None) -> None:
+    if not payload:
+        await emit_to(sid, "lobby:snapshot", await lobby.snapshot())
+        return
+    try:
+        limit = int(payload.get("limit") or DEFAULT_PAGE_SIZE)
+    except (TypeError, ValueError):
+        limit = DEFAULT_PAGE_SIZE
+    cursor = payload.get("cursor")
+    page = lobby.page(
+        LobbyFilter.from_payload(payload),
+        str(cursor) if cursor else None,
+        limit,
+    )
+    await sio.emit("lobby:page", page, room=sid)
 
 
 @sio.on("table:create")
@@ -210,37 +987,32 @@ async def table_create(sid: str, payload: dict | None) -> None:
         max_bet=max_bet,
         decks=decks,
         starting_bank=starting_bank,
+        hints=bool(payload.get("hints", False)),
     )
 
-    player_display_name = None
-    async with state_lock:
-        player = state.get_player(sid)
-        if not player:
-            return
-        player_display_name = player.display_name
-        prev_table_id, prev_table, prev_removed = state.remove_from_table(player)
-        table = state.create_table(player, name, is_private, max_players, table_config)
-        state.ensure_game(table)
-        tables = state.list_tables()
-        table_snapshot = table.snapshot()
-        prev_snapshot = prev_table.snapshot() if prev_table and not prev_removed else None
-
-    if prev_table_id:
-        await sio.leave_room(sid, table_room(prev_table_id))
-        if prev_snapshot:
-            await sio.emit("table:state", prev_snapshot, room=table_room(prev_table_id))
-
-    await sio.enter_room(sid, table_room(table.table_id))
-    await sio.emit("table:joined", {"tableId": table.table_id}, room=sid)
-    await sio.emit("table:state", table_snapshot, room=table_room(table.table_id))
-    await sio.emit("lobby:snapshot", {"tables": tables}, room=LOBBY_ROOM)
-    await emit_game_state(table.table_id)
-    await emit_chat_history(sid, table.table_id)
-    if player_display_name:
-        await broadcast_system_message(
-            table.table_id,
-            f"{player_display_name} created the table.",
-        )
+    player = state.get_player(sid)
+    if not player:
+        return
+    table_id = new_table_id()
+    owner = None
+    previous = None
+    if settings.sharding_enabled:
+        owner = shards.place(table_id)
+        previous = await shards.user_table(player.user_id)
+    await run_table_command(
+        "table:create",
+        sid,
+        table_id,
+        {
+            "name": name,
+            "isPrivate": is_private,
+            "maxPlayers": max_players,
+            "config": asdict(table_config),
+        },
+        owner=owner,
+    )
+    if previous:
+        await _leave_previous_shard(sid, previous, owner)
 
 
 @sio.on("table:join")
@@ -249,123 +1021,55 @@ async def table_join(sid: str, payload: dict | None) -> None:
     table_id = str(payload.get("tableId") or "").strip()
     invite_code = str(payload.get("inviteCode") or payload.get("code") or "").strip()
 
-    error = None
-    prev_table_id = None
-    prev_snapshot = None
-    table_snapshot = None
+    player = state.get_player(sid)
+    if not player:
+        return
     resolved_id = table_id
-    player_display_name = None
-    async with state_lock:
-        player = state.get_player(sid)
-        if not player:
-            return
-        player_display_name = player.display_name
-        try:
-            if not resolved_id and invite_code:
-                resolved_id = state.resolve_invite_code(invite_code)
-                if not resolved_id:
-                    raise TableError("invalid_code", "Invite code not found")
-            if not resolved_id:
-                raise TableError("invalid", "Missing table id")
-
-            table = state.tables.get(resolved_id)
-            if not table:
-                raise TableError("not_found", "Table not found")
-
-            current_table_id = state.get_user_table(player.user_id)
-            if table.is_private and not invite_code and current_table_id != resolved_id:
-                raise TableError("private", "Invite code required")
-
-            table, prev_table_id, prev_table, prev_removed = state.move_to_table(
-                player,
-                resolved_id,
-            )
-            state.ensure_game(table)
-            table_snapshot = table.snapshot()
-            prev_snapshot = prev_table.snapshot() if prev_table and not prev_removed else None
-        except TableError as exc:
-            error = {"code": exc.code, "message": str(exc)}
-        tables = state.list_tables()
-
+    error = None
+    if not resolved_id and invite_code:
+        if settings.sharding_enabled:
+            resolved_id = await shards.resolve_invite(invite_code)
+        else:
+            resolved_id = state.resolve_invite_code(invite_code)
+        if not resolved_id:
+            error = {"code": "invalid_code", "message": "Invite code not found"}
+    elif not resolved_id:
+        error = {"code": "invalid", "message": "Missing table id"}
     if error:
         await sio.emit("table:error", error, room=sid)
-        await sio.emit("lobby:snapshot", {"tables": tables}, room=sid)
+        await emit_to(sid, "lobby:snapshot", await lobby.snapshot())
         return
 
-    if prev_table_id:
-        await sio.leave_room(sid, table_room(prev_table_id))
-        if prev_snapshot:
-            await sio.emit("table:state", prev_snapshot, room=table_room(prev_table_id))
-
-    await sio.enter_room(sid, table_room(resolved_id))
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(resolved_id))
-    await sio.emit("table:joined", {"tableId": resolved_id}, room=sid)
-    await sio.emit("lobby:snapshot", {"tables": tables}, room=LOBBY_ROOM)
-    await emit_game_state(resolved_id)
-    await emit_chat_history(sid, resolved_id)
-    if player_display_name:
-        await broadcast_system_message(
-            resolved_id,
-            f"{player_display_name} joined the table.",
-        )
+    owner = None
+    previous = None
+    if settings.sharding_enabled:
+        owner = await shards.owner_of(resolved_id)
+        previous = await shards.user_table(player.user_id)
+    joined = await run_table_command(
+        "table:join",
+        sid,
+        resolved_id,
+        {"inviteCode": invite_code},
+        owner=owner,
+    )
+    if joined and previous and previous != resolved_id:
+        await _leave_previous_shard(sid, previous, owner)
 
 
 @sio.on("table:leave")
 async def table_leave(sid: str) -> None:
-    token = None
-    display_name = None
-    async with state_lock:
-        player = state.get_player(sid)
-        if not player:
-            return
-        display_name = player.display_name
-        table_id, table, removed = state.remove_from_table(player)
-        tables = state.list_tables()
-        table_snapshot = table.snapshot() if table and not removed else None
-        if table_id and table and table.game:
-            token = _set_turn_deadline(table_id)
-
-    if table_id:
-        await sio.leave_room(sid, table_room(table_id))
-        if table_snapshot:
-            await sio.emit("table:state", table_snapshot, room=table_room(table_id))
-            if display_name:
-                await broadcast_system_message(table_id, f"{display_name} left the table.")
-        await emit_game_state(table_id)
-    await sio.emit("lobby:snapshot", {"tables": tables}, room=LOBBY_ROOM)
-    if table_id and token:
-        asyncio.create_task(schedule_turn_timeout(table_id, token))
+    await _route(sid, "table:leave")
 
 
 @sio.on("table:ready")
 async def table_ready(sid: str, payload: dict | None) -> None:
     payload = payload or {}
-    is_ready = bool(payload.get("ready", False))
-
-    async with state_lock:
-        player = state.get_player(sid)
-        if not player:
-            return
-        table = state.set_ready(player, is_ready)
-        table_snapshot = table.snapshot() if table else None
-
-    if table_snapshot:
-        await sio.emit("table:state", table_snapshot, room=table_room(table_snapshot["id"]))
+    await _route(sid, "table:ready", {"ready": bool(payload.get("ready", False))})
 
 
 @sio.on("chat:sync")
 async def chat_sync(sid: str) -> None:
-    session = await sio.get_session(sid)
-    user_id = session.get("user_id") if session else None
-    if not user_id:
-        return
-    async with state_lock:
-        table_id = state.get_user_table(user_id)
-        if not table_id:
-            return
-        messages = state.get_chat_history(table_id)
-    await sio.emit("chat:history", {"tableId": table_id, "messages": messages}, room=sid)
+    await _route(sid, "chat:sync")
 
 
 @sio.on("chat:send")
@@ -382,96 +1086,34 @@ async def chat_send(sid: str, payload: dict | None) -> None:
         )
         return
 
-    error_message = None
-    table_id = None
-    chat_payload = None
-    async with state_lock:
-        player = state.get_player(sid)
-        if not player:
-            await sio.emit("chat:error", {"message": "Chat session not found."}, room=sid)
-            return
-        table_id = state.get_user_table(player.user_id)
-        if not table_id:
-            await sio.emit(
-                "chat:error",
-                {"message": "Join a table before sending chat messages."},
-                room=sid,
-            )
-            return
-        now = datetime.now(timezone.utc)
-        if player.muted_until and player.muted_until > now:
-            error_message = "You are muted."
-        elif player.muted_until and player.muted_until <= now:
-            player.muted_until = None
-        elif player.last_chat_at and (
-            now - player.last_chat_at
-        ).total_seconds() < CHAT_RATE_LIMIT_SECONDS:
-            error_message = "You're sending messages too fast."
-        else:
-            player.last_chat_at = now
-            chat_message = ChatMessage(
-                message_id=uuid.uuid4().hex,
-                table_id=table_id,
-                user_id=player.user_id,
-                display_name=player.display_name,
-                message=message,
-                created_at=now,
-            )
-            chat_payload = state.add_chat_message(table_id, chat_message)
-
-    if error_message:
-        await sio.emit("chat:error", {"message": error_message}, room=sid)
+    player = state.get_player(sid)
+    if not player:
+        await sio.emit("chat:error", {"message": "Chat session not found."}, room=sid)
+        return
+    table_id = await current_table(player.user_id)
+    if not table_id:
+        await sio.emit(
+            "chat:error",
+            {"message": "Join a table before sending chat messages."},
+            room=sid,
+        )
         return
-    if chat_payload and table_id:
-        await sio.emit("chat:message", chat_payload, room=table_room(table_id))
+    await run_table_command("chat:send", sid, table_id, {"message": message})
 
 
 @sio.on("game:sync")
 async def game_sync(sid: str) -> None:
-    session = await sio.get_session(sid)
-    user_id = session.get("user_id") if session else None
-    if not user_id:
-        return
-    async with state_lock:
-        table_id = state.get_user_table(user_id)
-    if table_id:
-        await emit_game_state(table_id)
+    await _route(sid, "game:sync")
+
+
+@sio.on("game:hint")
+async def game_hint(sid: str) -> None:
+    await _route(sid, "game:hint")
 
 
 @sio.on("game:start")
 async def game_start(sid: str) -> None:
-    session = await sio.get_session(sid)
-    user_id = session.get("user_id") if session else None
-    if not user_id:
-        return
-
-    error = None
-    async with state_lock:
-        table_id = state.get_user_table(user_id)
-        if not table_id:
-            return
-        table = state.tables.get(table_id)
-        if not table:
-            return
-        if table.is_paused:
-            error = "Table is paused."
-        elif table.betting_locked:
-            error = "Betting is locked."
-        elif any(not player.is_ready for player in table.players.values()):
-            error = "All players must be ready."
-        else:
-            game = state.ensure_game(table)
-            error = game.start_round()
-            events = game.consume_events()
-            round_id = game.round_id
-            token = _set_turn_deadline(table_id)
-    if error:
-        await sio.emit("game:error", {"message": error}, room=sid)
-        return
-    await log_game_events(table_id, round_id, events)
-    await emit_game_state(table_id)
-    if token:
-        asyncio.create_task(schedule_turn_timeout(table_id, token))
+    await _route(sid, "game:start")
 
 
 @sio.on("game:action")
@@ -480,49 +1122,4 @@ async def game_action(sid: str, payload: dict | None) -> None:
     action = str(payload.get("action") or "").strip().lower()
     if not action:
         return
-
-    session = await sio.get_session(sid)
-    user_id = session.get("user_id") if session else None
-    if not user_id:
-        return
-
-    error = None
-    token: int | None = None
-    table_id = None
-    events: list[dict] = []
-    round_id = None
-    async with state_lock:
-        table_id = state.get_user_table(user_id)
-        if not table_id:
-            return
-        table = state.tables.get(table_id)
-        if not table or not table.game:
-            return
-        if table.is_paused:
-            error = "Table is paused."
-            round_id = table.game.round_id
-            table.game.turn_ends_at = None
-            token = None
-        else:
-            game = table.game
-            if action == "hit":
-                error = game.hit(user_id)
-            elif action == "stand":
-                error = game.stand(user_id)
-            elif action == "double":
-                error = game.double_down(user_id)
-            elif action == "split":
-                error = game.split(user_id)
-            else:
-                error = "Unknown action."
-
-            events = game.consume_events()
-            round_id = game.round_id
-            token = _set_turn_deadline(table_id)
-
-    if error:
-        await sio.emit("game:error", {"message": error}, room=sid)
-    await log_game_events(table_id, round_id, events)
-    await emit_game_state(table_id)
-    if token:
-        asyncio.create_task(schedule_turn_timeout(table_id, token))
+    await _route(sid, "game:action", {"action": action})
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, Iterable
+import uuid
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.realtime.state import LobbyState, TableError
+
+logger = logging.getLogger(__name__)
+
+WORKERS_KEY = "vlackjack:workers"
+OWNERS_KEY = "vlackjack:table_owners"
+DIRECTORY_KEY = "vlackjack:lobby"
+INVITES_KEY = "vlackjack:invites"
+USERS_KEY = "vlackjack:user_tables"
+CHANNEL_PREFIX = "vlackjack:shard:"
+LOBBY_CHANNEL = "vlackjack:lobby_changes"
+RING_REPLICAS = 64
+WORKER_TTL_BEATS = 3
+
+CLAIM_SCRIPT = """
+local owner = redis.call('HGET', KEYS[1], ARGV[1])
+if owner and owner ~= ARGV[2] then
+    local seen = redis.call('HGET', KEYS[2], owner)
+    if seen and tonumber(seen) >= tonumber(ARGV[3]) then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+return 1
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('HGET', KEYS[1], ARGV[1]) == ARGV[2] then
+    return redis.call('HDEL', KEYS[1], ARGV[1])
+end
+return 0
+"""
+
+Handler = Callable[[str, list], Awaitable[Any]]
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _point(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = RING_REPLICAS) -> None:
+        self.nodes = frozenset(nodes)
+        points = sorted(
+            (_point(f"{node}#{replica}"), node)
+            for node in self.nodes
+            for replica in range(replicas)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [node for _, node in points]
+
+    def owner(self, key: str) -> str | None:
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, _point(key)) % len(self._points)
+        return self._owners[index]
+
+
+class ShardRegistry:
+    def __init__(
+        self,
+        redis: Redis,
+        worker_id: str,
+        heartbeat_seconds: float = 5.0,
+        forward_timeout: float = 5.0,
+    ) -> None:
+        self.redis = redis
+        self.worker_id = worker_id
+        self.heartbeat_seconds = heartbeat_seconds
+        self.forward_timeout = forward_timeout
+        self.ring = HashRing([worker_id])
+        self._handler: Handler | None = None
+        self._on_cast: Handler | None = None
+        self._on_lobby_change: Callable[[], None] | None = None
+        self._pending: dict[str, asyncio.Future] = {}
+        self._published: dict[str, dict[str, str]] = {
+            DIRECTORY_KEY: {},
+            OWNERS_KEY: {},
+            INVITES_KEY: {},
+            USERS_KEY: {},
+        }
+        self._publish_lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task] = []
+        self._running: set[asyncio.Task] = set()
+        self._pubsub = None
+
+    @property
+    def channel(self) -> str:
+        return f"{CHANNEL_PREFIX}{self.worker_id}"
+
+    def _cutoff(self) -> float:
+        return time.time() - self.heartbeat_seconds * WORKER_TTL_BEATS
+
+    async def start(
+        self,
+        handler: Handler,
+        on_lobby_change: Callable[[], None] | None = None,
+        on_cast: Handler | None = None,
+    ) -> None:
+        self._handler = handler
+        self._on_lobby_change = on_lobby_change
+        self._on_cast = on_cast
+        await self._beat()
+        self._pubsub = self.redis.pubsub()
+        await self._pubsub.subscribe(self.channel, LOBBY_CHANNEL)
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._heartbeat()),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        try:
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(self.channel, LOBBY_CHANNEL)
+                await self._pubsub.aclose()
+            await self.redis.hdel(WORKERS_KEY, self.worker_id)
+        except RedisError:
+            logger.warning("Failed to unregister shard worker %s", self.worker_id, exc_info=True)
+        self._pubsub = None
+
+    async def _beat(self) -> None:
+        await self.redis.hset(WORKERS_KEY, self.worker_id, time.time())
+        workers = await self.redis.hgetall(WORKERS_KEY)
+        cutoff = self._cutoff()
+        live = {worker for worker, seen in workers.items() if float(seen) >= cutoff}
+        live.add(self.worker_id)
+        if live != self.ring.nodes:
+            self.ring = HashRing(live)
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                await self._beat()
+            except RedisError:
+                logger.warning("Shard heartbeat failed", exc_info=True)
+
+    def place(self, table_id: str) -> str:
+        return self.ring.owner(table_id) or self.worker_id
+
+    async def owner_of(self, table_id: str) -> str:
+        return await self.redis.hget(OWNERS_KEY, table_id) or self.worker_id
+
+    async def user_table(self, user_id: str) -> str | None:
+        return await self.redis.hget(USERS_KEY, user_id)
+
+    async def resolve_invite(self, code: str) -> str | None:
+        return await self.redis.hget(INVITES_KEY, code.strip().upper())
+
+    async def claim(self, table_id: str) -> bool:
+        claimed = await self.redis.eval(
+            CLAIM_SCRIPT, 2, OWNERS_KEY, WORKERS_KEY, table_id, self.worker_id, self._cutoff()
+        )
+        return bool(claimed)
+
+    async def orphaned(self, table_ids: Iterable[str]) -> list[str]:
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.hgetall(OWNERS_KEY)
+        pipeline.hgetall(WORKERS_KEY)
+        owners, workers = await pipeline.execute()
+        cutoff = self._cutoff()
+        live = {worker for worker, seen in workers.items() if float(seen) >= cutoff}
+        live.discard(self.worker_id)
+        return [table_id for table_id in table_ids if owners.get(table_id) not in live]
+
+    async def publish(self, state: LobbyState) -> None:
+        async with self._publish_lock:
+            current = {
+                DIRECTORY_KEY: {
+                    table_id: json.dumps(summary, separators=(",", ":"))
+                    for table_id, summary in state.directory.entries.items()
+                },
+                OWNERS_KEY: {table_id: self.worker_id for table_id in state.tables},
+                INVITES_KEY: dict(state.invite_codes),
+                USERS_KEY: dict(state.user_to_table),
+            }
+            pipeline = self.redis.pipeline(transaction=False)
+            writes = 0
+            for key, values in current.items():
+                published = self._published[key]
+                changed = {
+                    field: value for field, value in values.items() if published.get(field) != value
+                }
+                if changed:
+                    pipeline.hset(key, mapping=changed)
+                    writes += 1
+                for field in published.keys() - values.keys():
+                    pipeline.eval(RELEASE_SCRIPT, 1, key, field, published[field])
+                    writes += 1
+            if not writes:
+                return
+            if current[DIRECTORY_KEY] != self._published[DIRECTORY_KEY]:
+                pipeline.publish(LOBBY_CHANNEL, self.worker_id)
+            try:
+                await pipeline.execute()
+            except RedisError:
+                logger.warning("Failed to publish lobby directory", exc_info=True)
+                return
+            self._published = current
+
+    async def directory(self) -> list[dict]:
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.hgetall(DIRECTORY_KEY)
+        pipeline.hgetall(OWNERS_KEY)
+        pipeline.hgetall(WORKERS_KEY)
+        tables, owners, workers = await pipeline.execute()
+        cutoff = self._cutoff()
+        live = {worker for worker, seen in workers.items() if float(seen) >= cutoff}
+        return [
+            json.loads(summary)
+            for table_id, summary in tables.items()
+            if owners.get(table_id) in live
+        ]
+
+    async def forward(self, worker_id: str, name: str, args: list) -> Any:
+        request_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message = {
+            "kind": "call",
+            "id": request_id,
+            "reply": self.channel,
+            "name": name,
+            "args": args,
+        }
+        try:
+            receivers = await self.redis.publish(
+                f"{CHANNEL_PREFIX}{worker_id}", json.dumps(message, separators=(",", ":"))
+            )
+            if not receivers:
+                raise TableError("unavailable", "Table is unavailable")
+            return await asyncio.wait_for(future, self.forward_timeout)
+        except asyncio.TimeoutError as exc:
+            raise TableError("unavailable", "Table is unavailable") from exc
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def cast(self, name: str, args: list) -> None:
+        message = json.dumps({"kind": "cast", "name": name, "args": args}, separators=(",", ":"))
+        pipeline = self.redis.pipeline(transaction=False)
+        for worker_id in self.ring.nodes:
+            pipeline.publish(f"{CHANNEL_PREFIX}{worker_id}", message)
+        await pipeline.execute()
+
+    async def _listen(self) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            if message.get("channel") == LOBBY_CHANNEL:
+                if self._on_lobby_change and message.get("data") != self.worker_id:
+                    self._on_lobby_change()
+                continue
+            try:
+                data = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            if data.get("kind") == "call":
+                self._spawn(self._serve(data))
+                continue
+            if data.get("kind") == "cast":
+                self._spawn(self._receive(data))
+                continue
+            future = self._pending.get(data.get("id"))
+            if not future or future.done():
+                continue
+            error = data.get("error")
+            if error:
+                future.set_exception(TableError(error["code"], error["message"]))
+            else:
+                future.set_result(data.get("result"))
+
+    def _spawn(self, coroutine: Awaitable[None]) -> None:
+        task = asyncio.create_task(coroutine)
+        self._running.add(task)
+        task.add_done_callback(self._finished)
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Shard message handler failed", exc_info=task.exception())
+
+    async def _receive(self, data: dict) -> None:
+        if not self._on_cast:
+            return
+        try:
+            await self._on_cast(data["name"], data["args"])
+        except Exception:
+            logger.exception("Broadcast %s failed", data.get("name"))
+
+    async def _serve(self, data: dict) -> None:
+        reply: dict[str, Any] = {"kind": "reply", "id": data["id"], "result": None, "error": None}
+        try:
+            reply["result"] = await self._handler(data["name"], data["args"])
+        except TableError as exc:
+            reply["error"] = {"code": exc.code, "message": str(exc)}
+        except Exception:
+            logger.exception("Forwarded table command %s failed", data.get("name"))
+            reply["error"] = {"code": "error", "message": "Table command failed"}
+        try:
+            await self.redis.publish(data["reply"], json.dumps(reply, separators=(",", ":")))
+        except RedisError:
+            logger.warning("Failed to reply to %s", data["reply"], exc_info=True)
@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Iterable
 import uuid
 
+from app.core.config import settings
 from app.game.blackjack import BlackjackGame
+from app.realtime.directory import TableDirectory
+from app.realtime.encoding import JSON
+from app.realtime.outbox import TableOutbox
+from app.realtime.projection import TableProjection
 
 
 MIN_TABLE_PLAYERS = 2
@@ -18,6 +24,9 @@ class TableConfig:
     max_bet: int = 500
     decks: int = 6
     starting_bank: int = 2500
+    blackjack_payout: float = 1.5
+    dealer_hits_soft_17: bool = False
+    hints: bool = False
 
 
 @dataclass
@@ -42,6 +51,10 @@ class ChatMessage:
         }
 
 
+def new_table_id() -> str:
+    return uuid.uuid4().hex[:8]
+
+
 class TableError(RuntimeError):
     def __init__(self, code: str, message: str) -> None:
         super().__init__(message)
@@ -56,6 +69,9 @@ class PlayerState:
     is_ready: bool = False
     last_chat_at: datetime | None = None
     muted_until: datetime | None = None
+    remote: bool = False
+    connected: bool = True
+    encoding: str = JSON
 
 
 @dataclass
@@ -71,6 +87,10 @@ class TableState:
     players: dict[str, PlayerState] = field(default_factory=dict)
     game: BlackjackGame | None = None
     chat_log: list[ChatMessage] = field(default_factory=list)
+    projection: TableProjection = field(default_factory=TableProjection, repr=False)
+    outbox: TableOutbox = field(
+        default_factory=lambda: TableOutbox(settings.table_outbox_size), repr=False
+    )
 
     def summary(self) -> dict:
         return {
@@ -79,6 +99,9 @@ class TableState:
             "isPrivate": self.is_private,
             "maxPlayers": self.max_players,
             "playerCount": len(self.players),
+            "minBet": self.config.min_bet,
+            "maxBet": self.config.max_bet,
+            "decks": self.config.decks,
         }
 
     def snapshot(self) -> dict:
@@ -94,6 +117,7 @@ class TableState:
             "maxBet": self.config.max_bet,
             "decks": self.config.decks,
             "startingBank": self.config.starting_bank,
+            "hints": self.config.hints,
             "players": [
                 {
                     "userId": player.user_id,
@@ -111,9 +135,16 @@ class LobbyState:
         self.sid_to_player: dict[str, PlayerState] = {}
         self.user_to_table: dict[str, str] = {}
         self.invite_codes: dict[str, str] = {}
+        self.directory = TableDirectory(journal=not settings.sharding_enabled)
 
     def list_tables(self) -> list[dict]:
-        return [table.summary() for table in self.tables.values() if not table.is_private]
+        return self.directory.tables()
+
+    def index_table(self, table: TableState) -> None:
+        if table.is_private or self.tables.get(table.table_id) is not table:
+            self.directory.discard(table.table_id)
+        else:
+            self.directory.update(table.summary())
 
     def resolve_invite_code(self, code: str) -> str | None:
         normalized = code.strip().upper()
@@ -138,6 +169,9 @@ class LobbyState:
                 max_bet=table.config.max_bet,
                 decks=table.config.decks,
                 default_bank=table.config.starting_bank,
+                blackjack_payout=table.config.blackjack_payout,
+                dealer_hits_soft_17=table.config.dealer_hits_soft_17,
+                event_verbosity=settings.game_event_verbosity,
             )
         table.game.sync_players(
             [(player.user_id, player.display_name) for player in table.players.values()]
@@ -150,16 +184,56 @@ class LobbyState:
         user_id: str,
         display_name: str,
         muted_until: datetime | None = None,
+        remote: bool = False,
+        encoding: str = JSON,
     ) -> PlayerState:
         player = PlayerState(
             user_id=user_id,
             display_name=display_name,
             sid=sid,
             muted_until=muted_until,
+            remote=remote,
+            encoding=encoding,
         )
         self.sid_to_player[sid] = player
         return player
 
+    def forget_player(self, sid: str) -> None:
+        self.sid_to_player.pop(sid, None)
+
+    def restore_table(self, table: TableState) -> None:
+        self.tables[table.table_id] = table
+        if table.invite_code:
+            self.invite_codes[table.invite_code] = table.table_id
+        for user_id in table.players:
+            self.user_to_table[user_id] = table.table_id
+        self.index_table(table)
+
+    def reclaim_seat(self, player: PlayerState) -> TableState | None:
+        table_id = self.user_to_table.get(player.user_id)
+        table = self.tables.get(table_id) if table_id else None
+        if not table:
+            return None
+        seated = table.players.get(player.user_id)
+        if not seated or seated.sid in self.sid_to_player:
+            return None
+        player.is_ready = seated.is_ready
+        table.players[player.user_id] = player
+        return table
+
+    def release_unclaimed_seats(
+        self, table_ids: Iterable[str]
+    ) -> list[tuple[str, TableState, bool]]:
+        released = []
+        for table in [self.tables[table_id] for table_id in table_ids if table_id in self.tables]:
+            for player in list(table.players.values()):
+                if player.sid in self.sid_to_player:
+                    continue
+                table_id, current, removed = self.remove_from_table(player)
+                if table_id and current:
+                    released.append((table_id, current, removed))
+        return released
+
     def get_player(self, sid: str) -> PlayerState | None:
         return self.sid_to_player.get(sid)
 
@@ -184,15 +258,12 @@ class LobbyState:
         if not table:
             return table_id, None, False
         table.players.pop(player.user_id, None)
-        if table.game:
-            table.game.sync_players(
-                [(seat.user_id, seat.display_name) for seat in table.players.values()]
-            )
         removed = False
         if not table.players:
             self._remove_invite_code(table)
             self.tables.pop(table_id, None)
             removed = True
+        self.index_table(table)
         return table_id, table, removed
 
     def create_table(
@@ -202,9 +273,10 @@ class LobbyState:
         is_private: bool,
         max_players: int,
         config: TableConfig | None = None,
+        table_id: str | None = None,
     ) -> TableState:
         normalized_max = min(max(max_players, MIN_TABLE_PLAYERS), MAX_TABLE_PLAYERS)
-        table_id = uuid.uuid4().hex[:8]
+        table_id = table_id or new_table_id()
         invite_code = self._register_invite_code(table_id) if is_private else None
         table = TableState(
             table_id=table_id,
@@ -218,6 +290,7 @@ class LobbyState:
         player.is_ready = False
         self.tables[table_id] = table
         self.user_to_table[player.user_id] = table_id
+        self.index_table(table)
         return table
 
     def get_chat_history(self, table_id: str) -> list[dict]:
@@ -246,10 +319,7 @@ class LobbyState:
         table.players[player.user_id] = player
         player.is_ready = False
         self.user_to_table[player.user_id] = table_id
-        if table.game:
-            table.game.sync_players(
-                [(seat.user_id, seat.display_name) for seat in table.players.values()]
-            )
+        self.index_table(table)
         return table
 
     def move_to_table(
@@ -274,10 +344,7 @@ class LobbyState:
                     self._remove_invite_code(prev_table)
                     self.tables.pop(prev_table_id, None)
                     prev_removed = True
-                elif prev_table.game:
-                    prev_table.game.sync_players(
-                        [(seat.user_id, seat.display_name) for seat in prev_table.players.values()]
-                    )
+                self.index_table(prev_table)
         return table, prev_table_id, prev_table, prev_removed
 
     def set_ready(self, player: PlayerState, is_ready: bool) -> TableState | None:
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+logger = logging.getLogger(__name__)
+
+TIMER_TICK_SECONDS = 0.1
+TIMER_WHEEL_SLOTS = 512
+
+
+@dataclass(slots=True)
+class Timer:
+    key: Hashable
+    tick: int
+    due: float
+    callback: Callable[..., Awaitable[Any]]
+    args: tuple
+
+
+class TimerWheel:
+    __slots__ = (
+        "tick",
+        "fired",
+        "lag",
+        "max_lag",
+        "_slots",
+        "_timers",
+        "_base",
+        "_ticks",
+        "_task",
+        "_running",
+    )
+
+    def __init__(self, tick: float = TIMER_TICK_SECONDS, slots: int = TIMER_WHEEL_SLOTS) -> None:
+        self.tick = tick
+        self.fired = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._slots: list[dict[Hashable, Timer]] = [{} for _ in range(slots)]
+        self._timers: dict[Hashable, Timer] = {}
+        self._base = 0.0
+        self._ticks = 0
+        self._task: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._timers)
+
+    def schedule(
+        self,
+        key: Hashable,
+        delay: float,
+        callback: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> None:
+        self.cancel(key)
+        now = time.monotonic()
+        if self._task is None:
+            self._base = now
+            self._ticks = 0
+            self._task = asyncio.create_task(self._run())
+        due = now + delay
+        tick = max(math.ceil((due - self._base) / self.tick), self._ticks + 1)
+        timer = Timer(key=key, tick=tick, due=due, callback=callback, args=args)
+        self._timers[key] = timer
+        self._slots[tick % len(self._slots)][key] = timer
+
+    def cancel(self, key: Hashable) -> bool:
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        del self._slots[timer.tick % len(self._slots)][key]
+        return True
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+        for slot in self._slots:
+            slot.clear()
+        self._timers.clear()
+
+    async def _run(self) -> None:
+        try:
+            while self._timers:
+                delay = self._base + (self._ticks + 1) * self.tick - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                now = time.monotonic()
+                target = int((now - self._base) / self.tick)
+                while self._ticks < target and self._timers:
+                    self._ticks += 1
+                    self._fire(now)
+        finally:
+            self._task = None
+
+    def _fire(self, now: float) -> None:
+        slot = self._slots[self._ticks % len(self._slots)]
+        if not slot:
+            return
+        due = [timer for timer in slot.values() if timer.tick <= self._ticks]
+        if not due:
+            return
+        lag = 0.0
+        for timer in due:
+            del slot[timer.key]
+            del self._timers[timer.key]
+            lag = max(lag, now - timer.due)
+            task = asyncio.create_task(timer.callback(*timer.args))
+            self._running.add(task)
+            task.add_done_callback(self._finished)
+        self.fired += len(due)
+        self.lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Timer callback failed", exc_info=task.exception())
@@ -14,6 +14,13 @@ class AdminOverview(BaseModel):
     active_sessions: int
     wallet_count: int
     recent_transactions: int
+    pending_turn_timers: int = 0
+    turn_timer_lag_ms: float = 0.0
+    game_log_queue_depth: int = 0
+    game_log_max_depth: int = 0
+    game_log_full_waits: int = 0
+    game_log_wait_ms: float = 0.0
+    game_log_failed: int = 0
     generated_at: datetime
 
 
@@ -109,6 +116,7 @@ class AdminTableDetail(BaseModel):
     table: AdminTableSummary
     players: list[AdminTablePlayer]
     game_state: dict | None = None
+    odds: dict | None = None
 
 
 class AdminTableKickRequest(BaseModel):
@@ -124,6 +132,23 @@ class AdminTableRulesUpdateRequest(BaseModel):
     max_bet: int | None = Field(default=None, ge=1)
     decks: int | None = Field(default=None, ge=1, le=8)
     starting_bank: int | None = Field(default=None, ge=1)
+    blackjack_payout: float | None = Field(default=None, ge=1, le=2)
+    dealer_hits_soft_17: bool | None = None
+
+
+class AdminTableOdds(BaseModel):
+    table_id: str
+    config_hash: str
+    decks: int
+    blackjack_payout: float
+    dealer_hits_soft_17: bool
+    hands: int
+    house_edge: float
+    variance: float
+    std_error: float
+    win_rate: float
+    push_rate: float
+    loss_rate: float
 
 
 class AdminForceResultRequest(BaseModel):
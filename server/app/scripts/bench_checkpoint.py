@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.game.blackjack import BlackjackGame
+from app.realtime.checkpoint import decode_table, encode_table
+from app.realtime.state import PlayerState, TableConfig, TableState
+
+
+def build_table(index: int, players: int, decks: int) -> TableState:
+    table = TableState(
+        table_id=f"bench{index:05d}",
+        name=f"Bench {index}",
+        is_private=False,
+        max_players=8,
+        config=TableConfig(decks=decks),
+    )
+    for seat in range(players):
+        user_id = f"user-{index}-{seat}"
+        table.players[user_id] = PlayerState(user_id=user_id, display_name=f"Player {seat}", sid="")
+    table.game = BlackjackGame(table_id=table.table_id, decks=decks)
+    table.game.sync_players([(player.user_id, player.display_name) for player in table.players.values()])
+    table.game.start_round()
+    table.game.consume_events()
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure table checkpoint encode/decode cost.")
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--decks", type=int, default=6)
+    args = parser.parse_args()
+
+    tables = [build_table(index, args.players, args.decks) for index in range(args.tables)]
+
+    started = time.perf_counter()
+    encoded = [encode_table(table) for table in tables]
+    encode_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for data in encoded:
+        decode_table(data)
+    decode_elapsed = time.perf_counter() - started
+
+    total_bytes = sum(len(data) for data in encoded)
+    print(f"Tables:  {len(tables)} ({args.players} players, {args.decks} decks, mid-round)")
+    print(f"Size:    {total_bytes / len(tables):.0f} B/table ({total_bytes / 1024:.1f} KiB total)")
+    print(f"Encode:  {encode_elapsed / len(tables) * 1e6:.1f} us/table")
+    print(f"Decode:  {decode_elapsed / len(tables) * 1e6:.1f} us/table")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import random
+import time
+import uuid
+
+from sqlalchemy import select
+
+from app.db.models import Profile, User
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine
+
+
+def lookup_sync(user_id: uuid.UUID) -> str | None:
+    db = SessionLocal()
+    try:
+        user = db.scalar(select(User).where(User.id == user_id))
+        if not user:
+            return None
+        profile = db.scalar(select(Profile).where(Profile.user_id == user.id))
+        return profile.display_name if profile else user.email
+    finally:
+        db.close()
+
+
+async def lookup_async(user_id: uuid.UUID) -> str | None:
+    async with AsyncSessionLocal() as db:
+        user = await db.scalar(select(User).where(User.id == user_id))
+        if not user:
+            return None
+        profile = await db.scalar(select(Profile).where(Profile.user_id == user.id))
+        return profile.display_name if profile else user.email
+
+
+async def run_threads(
+    user_ids: list[uuid.UUID], requests: int, concurrency: int, threads: int
+) -> float:
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=threads)
+    gate = asyncio.Semaphore(concurrency)
+
+    async def lookup(user_id: uuid.UUID) -> None:
+        async with gate:
+            await loop.run_in_executor(executor, lookup_sync, user_id)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(lookup(random.choice(user_ids)) for _ in range(requests)))
+        return time.perf_counter() - started
+    finally:
+        executor.shutdown()
+
+
+async def run_async(user_ids: list[uuid.UUID], requests: int, concurrency: int) -> float:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def lookup(user_id: uuid.UUID) -> None:
+        async with gate:
+            await lookup_async(user_id)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(lookup(random.choice(user_ids)) for _ in range(requests)))
+    return time.perf_counter() - started
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as db:
+        user_ids = list((await db.scalars(select(User.id).limit(1000))).all())
+    if not user_ids:
+        raise SystemExit("No users to look up; run app.scripts.seed_demo first.")
+
+    print(f"{'concurrency':>11} {'to_thread':>12} {'async':>12} {'speedup':>8}")
+    for concurrency in args.concurrency:
+        thread_elapsed = await run_threads(user_ids, args.requests, concurrency, args.threads)
+        async_elapsed = await run_async(user_ids, args.requests, concurrency)
+        print(
+            f"{concurrency:>11} {args.requests / thread_elapsed:>8.0f} q/s"
+            f" {args.requests / async_elapsed:>8.0f} q/s"
+            f" {thread_elapsed / async_elapsed:>7.1f}x"
+        )
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare thread-offloaded sync sessions with the async engine."
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=40,
+        help="Thread pool size for the sync path (Starlette's default is 40)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import argparse
+from array import array
+from dataclasses import dataclass, field
+import gc
+import secrets
+import sys
+import time
+import tracemalloc
+from typing import Any
+import uuid
+
+from app.game.blackjack import RANKS, SUITS, BlackjackGame, SeatState
+
+
+@dataclass
+class LegacyCard:
+    rank: str
+    suit: str
+    index: int
+
+
+@dataclass
+class LegacyHand:
+    hand_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    cards: list[LegacyCard] = field(default_factory=list)
+    bet: int = 0
+    status: str = "waiting"
+    result: str | None = None
+    is_split: bool = False
+    is_doubled: bool = False
+
+
+@dataclass
+class LegacySeat:
+    user_id: str
+    display_name: str
+    bank: int
+    hands: list[LegacyHand] = field(default_factory=list)
+    active_hand_index: int = 0
+
+
+def legacy_card(code: int) -> LegacyCard:
+    return LegacyCard(
+        rank=RANKS[code % len(RANKS)],
+        suit=SUITS[(code // len(RANKS)) % len(SUITS)],
+        index=code,
+    )
+
+
+def legacy_seat(seat: SeatState) -> LegacySeat:
+    return LegacySeat(
+        user_id=seat.user_id,
+        display_name=seat.display_name,
+        bank=seat.bank,
+        hands=[
+            LegacyHand(
+                cards=[legacy_card(card.index) for card in hand.cards],
+                bet=hand.bet,
+                status=hand.status,
+                result=hand.result,
+                is_split=hand.is_split,
+                is_doubled=hand.is_doubled,
+            )
+            for hand in seat.hands
+        ],
+        active_hand_index=seat.active_hand_index,
+    )
+
+
+def legacy_state(game: BlackjackGame) -> list:
+    # The pre-slots layout: a list of Card objects for the shoe and hands, uuid4 hand
+    # ids, and a SystemRandom (with its own Mersenne Twister state) per game.
+    return [
+        [legacy_card(code) for code in game.shoe],
+        {user_id: legacy_seat(seat) for user_id, seat in game.players.items()},
+        legacy_seat(game.dealer),
+        secrets.SystemRandom(),
+    ]
+
+
+def current_state(game: BlackjackGame) -> list:
+    return [game.shoe, game.players, game.dealer]
+
+
+def retained_size(roots: list[Any]) -> int:
+    seen: set[int] = set()
+    stack = list(roots)
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, (str, int, float, bool, array)) or obj is None:
+            continue
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+        else:
+            stack.extend(getattr(obj, name) for name in getattr(type(obj), "__slots__", ()))
+    return total
+
+
+def build_tables(count: int, players: int, decks: int) -> list[BlackjackGame]:
+    games: list[BlackjackGame] = []
+    for table_index in range(count):
+        game = BlackjackGame(table_id=f"bench{table_index:05d}", decks=decks)
+        game.sync_players(
+            [(f"user-{table_index}-{seat}", f"Player {seat}") for seat in range(players)]
+        )
+        game.start_round()
+        game.consume_events()
+        games.append(game)
+    return games
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure in-memory cost of live tables.")
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--decks", type=int, default=6)
+    args = parser.parse_args()
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    games = build_tables(args.tables, args.players, args.decks)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    used = current - baseline
+    legacy = retained_size([legacy_state(game) for game in games])
+    slotted = retained_size([current_state(game) for game in games])
+    print(f"Tables:          {len(games)} ({args.players} players, {args.decks} decks)")
+    print(f"Build time:      {elapsed * 1000:.1f} ms")
+    print(f"Retained memory: {used / 1024 / 1024:.2f} MiB ({used / len(games):.0f} B/table)")
+    print(f"Peak memory:     {(peak - baseline) / 1024 / 1024:.2f} MiB")
+    print("Shoe, seats and hands:")
+    print(f"  legacy layout: {legacy / len(games):.0f} B/table")
+    print(f"  current:       {slotted / len(games):.0f} B/table ({slotted / legacy:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import random
+import secrets
+import time
+
+from app.game.blackjack import build_shoe, build_shuffled_shoe
+from app.game.shuffle import verify_shoe
+
+
+class UrandomCounter:
+    def __init__(self) -> None:
+        self.calls = 0
+        self._urandom = random._urandom
+
+    def __call__(self, size: int) -> bytes:
+        self.calls += 1
+        return self._urandom(size)
+
+
+def bench_system_random(decks: int, rounds: int) -> tuple[float, float]:
+    counter = UrandomCounter()
+    random._urandom = counter
+    try:
+        rng = secrets.SystemRandom()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            shoe = build_shoe(decks)
+            rng.shuffle(shoe)
+        elapsed = time.perf_counter() - started
+    finally:
+        random._urandom = counter._urandom
+    return elapsed / rounds, counter.calls / rounds
+
+
+def bench_seeded(decks: int, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        build_shuffled_shoe(decks)
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare shoe shuffle engines.")
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    shoe = build_shuffled_shoe(args.decks)
+    if not verify_shoe(shoe.seed, shoe.commitment, shoe.cards):
+        raise SystemExit("Seeded shoe failed verification")
+
+    system_time, system_calls = bench_system_random(args.decks, args.rounds)
+    seeded_time = bench_seeded(args.decks, args.rounds)
+    print(f"Decks: {args.decks}, shoes: {args.rounds}")
+    print(f"SystemRandom.shuffle: {system_time * 1e6:8.1f} us/shoe, {system_calls:.0f} urandom calls/shoe")
+    print(f"HMAC-DRBG shuffle:    {seeded_time * 1e6:8.1f} us/shoe, 1 urandom call/shoe")
+    print(f"Speedup: {system_time / seeded_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
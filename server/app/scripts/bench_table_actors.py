@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from app.game.blackjack import BlackjackGame
+from app.realtime.actors import ActorRegistry
+from app.realtime.projection import TableProjection, viewer_state
+
+PROJECTIONS: dict[str, TableProjection] = {}
+
+
+def build_game(index: int, players: int) -> BlackjackGame:
+    game = BlackjackGame(table_id=f"bench{index:05d}")
+    game.sync_players([(f"user-{index}-{seat}", f"Player {seat}") for seat in range(players)])
+    PROJECTIONS[game.table_id] = TableProjection()
+    return game
+
+
+def step(game: BlackjackGame) -> None:
+    if game.active_player_id:
+        game.stand(game.active_player_id)
+    else:
+        game.start_round()
+    game.consume_events()
+    projection = PROJECTIONS[game.table_id]
+    projection.refresh(game)
+    for user_id in game.seat_order:
+        projection.state_for(viewer_state(game, user_id, False))
+
+
+# The awaited I/O is a fixed asyncio.sleep standing in for log writes and emits, not the real
+# command handlers. Holding it under the old global lock serializes every sleep, so the speedup
+# printed here is a synthetic upper bound: real handlers spend part of each action on CPU, which
+# the actors cannot overlap.
+async def run_global(games: list[BlackjackGame], actions: int, latency: float) -> float:
+    lock = asyncio.Lock()
+
+    async def command(game: BlackjackGame) -> None:
+        async with lock:
+            step(game)
+            await asyncio.sleep(latency)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(command(game) for game in games for _ in range(actions)))
+    return time.perf_counter() - started
+
+
+async def run_actors(games: list[BlackjackGame], actions: int, latency: float) -> float:
+    actors = ActorRegistry()
+
+    async def command(game: BlackjackGame) -> None:
+        step(game)
+        await asyncio.sleep(latency)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            actors.run(game.table_id, lambda game=game: command(game))
+            for game in games
+            for _ in range(actions)
+        )
+    )
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare a global state lock with per-table actors.")
+    parser.add_argument("--tables", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--actions", type=int, default=50, help="Actions per table")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=2.0,
+        help="Simulated I/O per action (asyncio.sleep standing in for log writes and emits)",
+    )
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    print(f"Simulated I/O: {args.latency_ms:g} ms asyncio.sleep per action (speedup is an upper bound)")
+    print(f"{'tables':>6} {'global lock':>14} {'table actors':>14} {'speedup':>8}")
+    for count in args.tables:
+        games = [build_game(index, args.players) for index in range(count)]
+        total = count * args.actions
+        global_elapsed = asyncio.run(run_global(games, args.actions, latency))
+        games = [build_game(index, args.players) for index in range(count)]
+        actor_elapsed = asyncio.run(run_actors(games, args.actions, latency))
+        print(
+            f"{count:>6} {total / global_elapsed:>10.0f} a/s {total / actor_elapsed:>10.0f} a/s"
+            f" {global_elapsed / actor_elapsed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
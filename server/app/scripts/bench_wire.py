@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+import msgpack
+from socketio import packet
+
+from app.game.blackjack import BlackjackGame
+from app.realtime.encoding import PacketJSON, expand, pack
+from app.realtime.projection import TableProjection, viewer_state
+from app.realtime.state import PlayerState, TableConfig, TableState
+
+
+def build_table(players: int, decks: int) -> TableState:
+    table = TableState(
+        table_id="benchwire",
+        name="Bench wire",
+        is_private=False,
+        max_players=8,
+        config=TableConfig(decks=decks, hints=True),
+    )
+    for seat in range(players):
+        user_id = f"user-{seat}"
+        table.players[user_id] = PlayerState(user_id=user_id, display_name=f"Player {seat}", sid="")
+    table.game = BlackjackGame(table_id=table.table_id, decks=decks)
+    table.game.sync_players([(player.user_id, player.display_name) for player in table.players.values()])
+    table.game.start_round()
+    table.game.consume_events()
+    return table
+
+
+class WirePacket(packet.Packet):
+    json = PacketJSON
+
+
+def encode_packets(frames: list[tuple[str, Any]]) -> int:
+    size = 0
+    for event, payload in frames:
+        encoded = WirePacket(packet.EVENT, data=[event, payload]).encode()
+        if isinstance(encoded, str):
+            encoded = [encoded]
+        size += sum(len(part) if isinstance(part, bytes) else len(part.encode()) for part in encoded)
+    return size
+
+
+def measure(rounds: int, build: Callable[[], list[tuple[str, Any]]]) -> tuple[float, int]:
+    size = encode_packets(build())
+    started = time.perf_counter()
+    for _ in range(rounds):
+        encode_packets(build())
+    elapsed = time.perf_counter() - started
+    return elapsed / rounds, size
+
+
+def game_state_frames(table: TableState, packed: bool) -> list[tuple[str, Any]]:
+    projection = TableProjection()
+    projection.refresh(table.game)
+    frames = []
+    for player in table.players.values():
+        viewer = viewer_state(table.game, player.user_id, table.config.hints)
+        if packed:
+            frames.append(("game:state", projection.packed_state_for(viewer)))
+        else:
+            frames.append(("game:state", projection.state_for(viewer)))
+    return frames
+
+
+def table_state_frames(table: TableState, packed: bool) -> list[tuple[str, Any]]:
+    snapshot = table.snapshot()
+    if packed:
+        return [("table:state", pack(snapshot))]
+    return [("table:state", snapshot)]
+
+
+def check_round_trip(table: TableState) -> None:
+    projection = TableProjection()
+    projection.refresh(table.game)
+    player = next(iter(table.players.values()))
+    viewer = viewer_state(table.game, player.user_id, table.config.hints)
+    expected = json.loads(PacketJSON.dumps(projection.state_for(viewer)))
+    if expand(msgpack.unpackb(projection.packed_state_for(viewer))) != expected:
+        raise SystemExit("msgpack game:state does not expand back to the JSON payload")
+    if expand(msgpack.unpackb(pack(table.snapshot()))) != table.snapshot():
+        raise SystemExit("msgpack table:state does not expand back to the JSON payload")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare JSON and msgpack encode cost and wire size for one table broadcast."
+    )
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    table = build_table(args.players, args.decks)
+    check_round_trip(table)
+
+    print(f"Table: {args.players} seats, {args.decks} decks, mid-round")
+    print(f"{'event':<12} {'encoding':<8} {'encode':>12} {'wire':>10}")
+    for name, frames in (("game:state", game_state_frames), ("table:state", table_state_frames)):
+        results = {}
+        for encoding, packed in (("json", False), ("msgpack", True)):
+            elapsed, size = measure(args.rounds, lambda: frames(table, packed))
+            results[encoding] = (elapsed, size)
+            print(f"{name:<12} {encoding:<8} {elapsed * 1e6:>9.1f} us {size:>8} B")
+        json_elapsed, json_size = results["json"]
+        packed_elapsed, packed_size = results["msgpack"]
+        print(
+            f"{'':<12} {'ratio':<8} {packed_elapsed / json_elapsed:>11.2f}x"
+            f" {packed_size / json_size:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.realtime.actors import ActorRegistry
+
+
+def test_actor_runs_commands_for_one_table_in_order() -> None:
+    log: list[tuple[str, int]] = []
+
+    async def step(table_id: str, number: int) -> int:
+        log.append((table_id, number))
+        await asyncio.sleep(0)
+        log.append((table_id, -number))
+        return number
+
+    async def scenario() -> list[int]:
+        actors = ActorRegistry()
+        results = await asyncio.gather(
+            *(actors.run("t1", lambda number=number: step("t1", number)) for number in range(1, 4)),
+            actors.run("t2", lambda: 7),
+        )
+        assert len(actors) == 0
+        return results
+
+    assert asyncio.run(scenario()) == [1, 2, 3, 7]
+    table_one = [entry for entry in log if entry[0] == "t1"]
+    assert [number for _, number in table_one] == [1, -1, 2, -2, 3, -3]
+
+
+def test_actor_propagates_errors_and_keeps_going() -> None:
+    def fail() -> None:
+        raise ValueError("bad")
+
+    async def scenario() -> int:
+        actors = ActorRegistry()
+        with pytest.raises(ValueError):
+            await actors.run("t1", fail)
+        return await actors.run("t1", lambda: 5)
+
+    assert asyncio.run(scenario()) == 5
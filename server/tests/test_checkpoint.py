@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from app.game.blackjack import BlackjackGame, build_shuffled_shoe
+from app.realtime.checkpoint import CheckpointStore, decode_table, encode_table
+from app.realtime.state import LobbyState, PlayerState, TableConfig, TableState
+
+
+def seeded_shoe(decks: int):
+    return build_shuffled_shoe(decks, b"\x07" * 32)
+
+
+def test_table_round_trips_mid_round() -> None:
+    table = TableState(
+        table_id="cp1",
+        name="Checkpoint",
+        is_private=True,
+        max_players=4,
+        invite_code="ABC123",
+        config=TableConfig(),
+        betting_locked=True,
+    )
+    for user_id, name in (("u1", "One"), ("u2", "Two")):
+        table.players[user_id] = PlayerState(
+            user_id=user_id, display_name=name, sid="", is_ready=True
+        )
+    game = BlackjackGame(table_id="cp1", shoe_source=seeded_shoe)
+    game.sync_players([("u1", "One"), ("u2", "Two")])
+    game.start_round()
+    table.game = game
+
+    restored = decode_table(encode_table(table))
+
+    assert restored.table_id == table.table_id
+    assert restored.name == table.name
+    assert restored.is_private and restored.invite_code == "ABC123"
+    assert restored.config == table.config
+    assert restored.betting_locked and not restored.is_paused
+    assert [(p.user_id, p.display_name, p.is_ready) for p in restored.players.values()] == [
+        ("u1", "One", True),
+        ("u2", "Two", True),
+    ]
+    assert restored.game is not None
+    assert restored.game.shoe == game.shoe
+    assert restored.game.shoe_commitment == game.shoe_commitment
+    assert restored.game.snapshot() == game.snapshot()
+
+
+def test_table_without_game_round_trips() -> None:
+    table = TableState(table_id="cp2", name="Empty", is_private=False, max_players=6)
+    restored = decode_table(encode_table(table))
+    assert restored.game is None
+    assert restored.players == {}
+    assert restored.max_players == 6
+
+
+def test_store_only_encodes_tables_that_changed() -> None:
+    state = LobbyState()
+    for table_id in ("cp3", "cp4"):
+        state.tables[table_id] = TableState(
+            table_id=table_id, name=table_id, is_private=False, max_players=4
+        )
+    store = CheckpointStore(state, redis=None)
+
+    changed, removed = store._changed()
+    assert sorted(changed) == ["cp3", "cp4"] and removed == []
+    assert store._changed() == ({}, [])
+
+    state.tables["cp3"].is_paused = True
+    del state.tables["cp4"]
+    changed, removed = store._changed()
+    assert list(changed) == ["cp3"] and removed == ["cp4"]
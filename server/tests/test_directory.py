@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from app.realtime.directory import LobbyFilter, TableDirectory, index_key
+
+
+def summary(rng: random.Random, number: int) -> dict:
+    max_players = rng.choice([2, 4, 6])
+    return {
+        "id": f"{number:05x}",
+        "name": f"Table {number}",
+        "isPrivate": False,
+        "maxPlayers": max_players,
+        "playerCount": rng.randint(0, max_players),
+        "minBet": rng.choice([5, 10, 25]),
+        "maxBet": rng.choice([100, 500, 1000]),
+        "decks": rng.choice([1, 6, 8]),
+    }
+
+
+def read_all(directory: TableDirectory, filters: LobbyFilter, limit: int) -> list[str]:
+    table_ids: list[str] = []
+    cursor = None
+    while True:
+        page = json.loads(directory.page(filters, cursor, limit).raw)
+        table_ids += [table["id"] for table in page["tables"]]
+        cursor = page["nextCursor"]
+        if cursor is None:
+            return table_ids
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        LobbyFilter(),
+        LobbyFilter(decks=6),
+        LobbyFilter(min_bet=10, max_bet=500),
+        LobbyFilter(has_seats=True, decks=8),
+    ],
+)
+def test_cursor_pages_cover_matching_tables_in_order(filters: LobbyFilter) -> None:
+    rng = random.Random(11)
+    directory = TableDirectory()
+    tables = {}
+    for number in range(400):
+        table = summary(rng, number)
+        directory.update(table)
+        tables[table["id"]] = table
+    for number in rng.sample(range(400), 80):
+        directory.discard(f"{number:05x}")
+        tables.pop(f"{number:05x}")
+    for number in rng.sample(range(400), 80):
+        table = summary(rng, number)
+        directory.update(table)
+        tables[table["id"]] = table
+
+    expected = sorted(
+        table_id for table_id, table in tables.items() if filters.matches(index_key(table))
+    )
+    assert read_all(directory, filters, 17) == expected
+
+
+def test_page_cache_drops_on_change() -> None:
+    rng = random.Random(3)
+    directory = TableDirectory()
+    directory.update(summary(rng, 1))
+    first = directory.page(LobbyFilter(), None, 10)
+    assert directory.page(LobbyFilter(), None, 10) is first
+    directory.update(summary(rng, 2))
+    assert len(json.loads(directory.page(LobbyFilter(), None, 10).raw)["tables"]) == 2
+
+
+def test_drain_reports_changes_since_last_drain() -> None:
+    rng = random.Random(5)
+    directory = TableDirectory(journal=True)
+    one, two = summary(rng, 1), summary(rng, 2)
+    directory.update(one)
+    directory.update(two)
+    assert directory.drain() == ([one, two], [], [])
+
+    moved = {**one, "playerCount": 0}
+    directory.update(moved)
+    directory.discard(two["id"])
+    directory.update(summary(rng, 3))
+    directory.discard("00003")
+    assert directory.drain() == ([], [moved], [two["id"]])
+    assert directory.drain() == ([], [], [])
+
+
+def test_filter_from_payload_ignores_bad_values() -> None:
+    filters = LobbyFilter.from_payload({"decks": "6", "minBet": "", "maxBet": "many", "hasSeats": 1})
+    assert filters == LobbyFilter(decks=6, has_seats=True)
+    assert LobbyFilter.from_payload(filters.payload()) == filters
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from app.game.blackjack import BlackjackGame
+from app.game.events import EventBuffer
+
+
+def round_details(events: list[dict]) -> list[dict]:
+    return [event for event in events if event["action"] == "round_detail"]
+
+
+def test_force_result_closes_round_detail() -> None:
+    game = BlackjackGame(table_id="events", event_verbosity="summary")
+    game.sync_players([("u1", "Player")])
+    game.consume_events()
+
+    game.start_round()
+    forced_round = game.round_id
+    game.force_result("push")
+    forced = round_details(game.consume_events())
+    assert [event["round_id"] for event in forced] == [forced_round]
+    assert forced[0]["payload"]["counts"]["deal"] == {"u1": 2, "dealer": 2}
+
+    game.start_round()
+    next_round = game.round_id
+    game.force_end_round()
+    details = round_details(game.consume_events())
+    assert [event["round_id"] for event in details] == [next_round]
+    assert details[0]["payload"]["counts"]["deal"] == {"u1": 2, "dealer": 2}
+
+
+def test_full_buffer_keeps_round_boundaries() -> None:
+    buffer = EventBuffer("events", size=4)
+    buffer.record("r1", "round_start", None)
+    for _ in range(6):
+        buffer.record("r1", "hit", "u1")
+    buffer.record("r1", "round_end", None, {"summary": {}})
+    actions = [event["action"] for event in buffer.flush()]
+    assert actions == ["round_start", "hit", "hit", "round_end"]
+    assert buffer.dropped == 4
+
+
+def test_round_detail_reports_dropped_events() -> None:
+    buffer = EventBuffer("events", size=3)
+    for _ in range(3):
+        buffer.record("r1", "hit", "u1")
+    buffer.flush()
+    buffer.record("r2", "round_start", None)
+    for _ in range(4):
+        buffer.record("r2", "hit", "u1")
+    buffer.summarize("r2")
+    events = buffer.flush()
+    assert [event["action"] for event in events] == ["round_start", "hit", "round_detail"]
+    assert events[-1]["payload"] == {"counts": {}, "dropped": 2}
+    assert buffer.dropped == 3
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+import pytest
+
+from app.realtime import game_logging
+from app.realtime.game_logging import GameLogWriter
+
+
+def test_failed_batch_falls_back_to_per_round_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts: list[list[str]] = []
+
+    async def write_batch(session: object, events: list[dict]) -> None:
+        rounds = sorted({event["round_id"] for event in events})
+        attempts.append(rounds)
+        if "bad" in rounds:
+            raise RuntimeError("missing round row")
+
+    monkeypatch.setattr(game_logging, "write_batch", write_batch)
+    writer = GameLogWriter(session_factory=lambda: contextlib.nullcontext(None))
+    batch = [
+        {"round_id": "good", "action": "hit"},
+        {"round_id": "bad", "action": "hit"},
+        {"round_id": "good", "action": "stand"},
+    ]
+
+    asyncio.run(writer._write(batch))
+    assert attempts == [["bad", "good"], ["bad", "good"], ["good"], ["bad"]]
+    assert writer.written == 2
+    assert writer.failed == 1
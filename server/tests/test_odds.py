@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from app.game.odds import estimate_house_edge
+from app.game.probability import OddsRequest, hand_odds
+
+
+# House edge and standard error of app.game.simulate for six decks, 3:2 blackjack and basic
+# strategy, over 10,000,000 rounds with seed 2024, keyed by dealer_hits_soft_17.
+REFERENCE_EDGES = {False: (0.00191, 0.00032), True: (0.00378, 0.00032)}
+
+
+@pytest.mark.parametrize("dealer_hits_soft_17", [False, True])
+def test_estimate_matches_basic_strategy_reference(dealer_hits_soft_17: bool) -> None:
+    reference, reference_error = REFERENCE_EDGES[dealer_hits_soft_17]
+    estimate = estimate_house_edge(
+        6, dealer_hits_soft_17=dealer_hits_soft_17, hands=1_000_000, seed=7
+    )
+    error = math.hypot(estimate.std_error, reference_error)
+    assert abs(estimate.house_edge - reference) < 3 * error
+
+
+def test_soft_21_reports_no_hit_ev() -> None:
+    counts = [24] * 9 + [96]
+    for slot in (0, 4, 4, 9):
+        counts[slot] -= 1
+    odds = hand_odds(
+        OddsRequest(
+            counts=tuple(counts),
+            player_slots=(0, 4, 4),
+            upcard_slot=9,
+            dealer_hits_soft_17=False,
+            blackjack_payout=1.5,
+            can_double=False,
+            can_split=False,
+        )
+    )
+    assert odds.hit is None
+    assert odds.best == "stand"
+    assert odds.stand > 0.8
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from app.realtime.outbox import TableOutbox
+
+
+def test_outbox_replays_only_within_window_and_epoch() -> None:
+    outbox = TableOutbox(size=3)
+    for number in range(5):
+        outbox.append("chat:message", {"n": number})
+    assert outbox.seq == 5
+    assert [seq for seq, _, _ in outbox.since(outbox.epoch, 2)] == [3, 4, 5]
+    assert outbox.since(outbox.epoch, 5) == []
+    assert outbox.since(outbox.epoch, 1) is None
+    assert outbox.since(outbox.epoch, 6) is None
+    assert outbox.since("other", 4) is None
+    assert TableOutbox().epoch != outbox.epoch
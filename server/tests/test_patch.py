@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any
+
+import msgpack
+import pytest
+
+from app.game.blackjack import BlackjackGame
+from app.realtime.encoding import expand
+from app.realtime.patch import diff_state
+from app.realtime.projection import TableProjection, viewer_state
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def apply_ops(document: Any, ops: list[dict]) -> Any:
+    document = copy.deepcopy(document)
+    for op in ops:
+        if op["path"] == "":
+            document = copy.deepcopy(op["value"])
+            continue
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        if isinstance(target, list):
+            if op["op"] == "add" and last == "-":
+                target.append(op["value"])
+            elif op["op"] == "remove":
+                del target[int(last)]
+            else:
+                target[int(last)] = op["value"]
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = op["value"]
+    return document
+
+
+STATE = {
+    "status": "player_turn",
+    "version": 4,
+    "players": [
+        {"userId": "u1", "hands": [{"cards": [1, 2], "bet": 10}], "bank": 990},
+        {"userId": "u2", "hands": [{"cards": [3, 4], "bet": 25}], "bank": 975},
+    ],
+    "dealer": {"cards": [5], "holeHidden": True},
+    "odd/key~": 1,
+}
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda state: state.update(status="dealer_turn", version=5),
+        lambda state: state["players"][0]["hands"][0]["cards"].append(9),
+        lambda state: state["players"][1]["hands"].append({"cards": [4], "bet": 25}),
+        lambda state: state["players"].pop(),
+        lambda state: state["dealer"].pop("holeHidden"),
+        lambda state: state.update({"odd/key~": 2, "new~/key": [1]}),
+        lambda state: state["dealer"].update(cards=[7, 8]),
+    ],
+)
+def test_diff_round_trips(change) -> None:
+    current = copy.deepcopy(STATE)
+    change(current)
+    ops = diff_state(STATE, current)
+    assert ops
+    assert apply_ops(STATE, ops) == current
+
+
+def test_diff_of_equal_states_is_empty() -> None:
+    assert diff_state(STATE, copy.deepcopy(STATE)) == []
+
+
+def test_appended_cards_become_add_ops() -> None:
+    current = copy.deepcopy(STATE)
+    current["dealer"]["cards"] += [6, 7]
+    assert diff_state(STATE, current) == [
+        {"op": "add", "path": "/dealer/cards/-", "value": 6},
+        {"op": "add", "path": "/dealer/cards/-", "value": 7},
+    ]
+
+
+def test_full_state_frames_carry_the_outbox_seq() -> None:
+    game = BlackjackGame(table_id="t1")
+    game.sync_players([("u1", "Player")])
+    projection = TableProjection()
+    projection.refresh(game)
+    viewer = viewer_state(game, "u1", False)
+
+    frame = json.loads(projection.state_for(viewer, 7).raw)
+    assert frame["seq"] == 7 and frame["viewer"] == viewer
+    assert "seq" not in json.loads(projection.state_for(viewer).raw)
+    assert expand(msgpack.unpackb(projection.packed_state_for(viewer, 7))) == frame
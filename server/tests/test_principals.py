@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import time
+import uuid
+
+from app.core.principals import PrincipalCache, detached_user
+
+
+def test_principal_cache_is_keyed_by_token_and_invalidated_per_user() -> None:
+    cache = PrincipalCache(ttl=60)
+    user_id = uuid.uuid4()
+    values = {"id": user_id, "email": "a@example.com", "is_active": True}
+    cache.put(user_id, 100, values)
+
+    assert cache.get(user_id, 100) == values
+    assert cache.get(user_id, 200) is None
+    cache.get(user_id, 100)["is_active"] = False
+    assert cache.get(user_id, 100)["is_active"] is True
+
+    cache.invalidate(user_id)
+    assert cache.get(user_id, 100) is None
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+def test_principal_cache_expires_entries() -> None:
+    cache = PrincipalCache(ttl=0.01)
+    user_id = uuid.uuid4()
+    cache.put(user_id, 100, {"id": user_id})
+    time.sleep(0.02)
+    assert cache.get(user_id, 100) is None
+
+
+def test_detached_user_carries_cached_columns() -> None:
+    user_id = uuid.uuid4()
+    user = detached_user({"id": user_id, "email": "a@example.com", "is_admin": True})
+    assert user.id == user_id
+    assert user.email == "a@example.com"
+    assert user.role == "admin"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.game.blackjack import BlackjackGame, build_shuffled_shoe
+from app.realtime import server
+from app.realtime.state import PlayerState, TableState
+
+
+def seeded_shoe(decks: int):
+    return build_shuffled_shoe(decks, b"\x07" * 32)
+
+
+def test_short_gap_replays_only_sequenced_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[tuple[str, dict, str]] = []
+
+    async def emit(event: str, payload=None, room: str | None = None, **kwargs) -> None:
+        sent.append((event, payload, room))
+
+    monkeypatch.setattr(server.sio, "emit", emit)
+    table = TableState(table_id="rc1", name="Reconnect", is_private=False, max_players=4)
+    for user_id, name in (("u1", "One"), ("u2", "Two")):
+        table.players[user_id] = PlayerState(user_id=user_id, display_name=name, sid=f"s-{user_id}")
+    game = BlackjackGame(table_id="rc1", shoe_source=seeded_shoe)
+    game.sync_players([("u1", "One"), ("u2", "Two")])
+    game.start_round()
+    table.game = game
+    monkeypatch.setitem(server.state.tables, "rc1", table)
+
+    async def scenario() -> None:
+        await server._emit_game_state("rc1")
+        last_seq = table.outbox.seq
+        table.players["u2"].connected = False
+        game.stand(game.active_player_id)
+        await server._emit_game_state("rc1")
+        table.players["u2"].connected = True
+        sent.clear()
+        assert await server._replay_missed(
+            "s-u2", table, table.players["u2"], table.outbox.epoch, last_seq
+        )
+
+    asyncio.run(scenario())
+    events = [(event, room) for event, _, room in sent]
+    assert events == [("table:joined", "s-u2"), ("game:patch", "s-u2")]
+    patch = sent[1][1]
+    assert patch["seq"] == table.outbox.seq
+    assert patch["version"] == game.version
+    assert patch["viewer"]["userId"] == "u2"
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from app.game.blackjack import build_shuffled_shoe
+from app.game.shuffle import verify_shoe
+
+
+def test_verify_shoe_accepts_the_committed_shuffle() -> None:
+    shoe = build_shuffled_shoe(6, b"\x42" * 32)
+    assert verify_shoe(shoe.seed, shoe.commitment, shoe.cards)
+    assert build_shuffled_shoe(6, b"\x42" * 32).cards == shoe.cards
+
+
+def test_verify_shoe_rejects_tampering() -> None:
+    shoe = build_shuffled_shoe(1, b"\x42" * 32)
+    swapped = shoe.cards[:]
+    swapped[0], swapped[1] = swapped[1], swapped[0]
+    assert not verify_shoe(shoe.seed, shoe.commitment, swapped)
+    assert not verify_shoe(b"\x43" * 32, shoe.commitment, shoe.cards)
+
+
+def test_verify_shoe_accepts_a_partly_dealt_shoe() -> None:
+    shoe = build_shuffled_shoe(2, b"\x42" * 32)
+    remaining = shoe.cards[:]
+    dealt = [remaining.pop() for _ in range(20)]
+    assert verify_shoe(shoe.seed, shoe.commitment, remaining, decks=2)
+    assert verify_shoe(shoe.seed, shoe.commitment, remaining, dealt=dealt)
+    assert verify_shoe(shoe.seed, shoe.commitment, remaining[:0], decks=2, dealt=dealt)
+    assert not verify_shoe(shoe.seed, shoe.commitment, remaining, decks=2, dealt=dealt[::-1])
+    assert not verify_shoe(shoe.seed, shoe.commitment, remaining, decks=1)
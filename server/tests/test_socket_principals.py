@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import time
+
+from app.realtime import auth
+from app.realtime.auth import SocketPrincipal, forget_socket_user
+
+
+def test_socket_principal_round_trips_and_ban_expiry() -> None:
+    now = datetime.now(timezone.utc)
+    principal = SocketPrincipal(
+        user_id="u1",
+        display_name="One",
+        is_active=True,
+        is_banned=True,
+        banned_until=now,
+        muted_until=now,
+    )
+    assert SocketPrincipal.loads(principal.dumps()) == principal
+    assert principal.socket_user() is None
+    assert principal.ban_expired(now)
+
+
+def test_forget_socket_user_drops_entry_and_bumps_generation() -> None:
+    principal = SocketPrincipal(user_id="u2", display_name="Two", is_active=True, is_banned=False)
+    auth._principals["u2"] = (time.monotonic() + 60, principal)
+    before = auth._generations.get("u2", 0)
+    forget_socket_user("u2")
+    assert "u2" not in auth._principals
+    assert auth._generations["u2"] == before + 1
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.realtime.timers import TimerWheel
+
+
+def test_timer_wheel_fires_due_timers_and_skips_cancelled() -> None:
+    fired: list[str] = []
+
+    async def record(name: str) -> None:
+        fired.append(name)
+
+    async def scenario() -> None:
+        wheel = TimerWheel(tick=0.01, slots=8)
+        wheel.schedule("late", 0.12, record, "late")
+        wheel.schedule("soon", 0.02, record, "soon")
+        wheel.schedule("cancelled", 0.03, record, "cancelled")
+        wheel.schedule("soon", 0.05, record, "rearmed")
+        assert wheel.cancel("cancelled")
+        assert not wheel.cancel("missing")
+        assert wheel.pending == 2
+        await asyncio.sleep(0.25)
+        assert wheel.pending == 0
+        wheel.stop()
+
+    asyncio.run(scenario())
+    assert fired == ["rearmed", "late"]
+
+
+def test_timer_wheel_survives_failing_callback() -> None:
+    fired: list[str] = []
+
+    async def fail() -> None:
+        raise RuntimeError("boom")
+
+    async def record() -> None:
+        fired.append("ok")
+
+    async def scenario() -> None:
+        wheel = TimerWheel(tick=0.01)
+        wheel.schedule("fail", 0.01, fail)
+        wheel.schedule("ok", 0.03, record)
+        await asyncio.sleep(0.1)
+        assert wheel.fired == 2
+
+    asyncio.run(scenario())
+    assert fired == ["ok"]